@@ -0,0 +1,224 @@
+"""
+End-to-end benchmark: the file and readme agents, no network.
+
+Runs AgentFactory agents on a scratch copy of this repository and
+reports steps/sec, framework overhead per step (step time minus LLM
+time), step and LLM tail latency, and memory growth across sessions.
+
+Modes:
+  server  the configured Groq client talks to a local stub server
+          (benchmarks/stub_llm_server.py) with the given latency and
+          token rates; needs the provider SDK, not the network
+  replay  ReplayLLMClient plays back a fixture recorded with --record,
+          so only framework cost is measured; needs nothing installed
+
+    python benchmarks/bench_agents_e2e.py --mode server --latency-ms 50 --record benchmarks/fixtures/agents_e2e.jsonl
+    python benchmarks/bench_agents_e2e.py --mode replay --sessions 20 --json results.json
+"""
+import argparse
+import json
+import os
+import shutil
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from benchmarks.stub_llm_server import SessionPolicy, StubLLMServer  # noqa: E402
+
+DEFAULT_FIXTURE = os.path.join(ROOT, "benchmarks", "fixtures", "agents_e2e.jsonl")
+AGENTS = ("file", "readme")
+PINNED_MODEL = "llama-3.3-70b-versatile"
+
+
+class SpanCollector:
+    """Tracer processor keeping the durations of the spans we report on."""
+
+    def __init__(self, names=("agent.step", "llm.call")):
+        self.durations = {name: [] for name in names}
+
+    def on_end(self, span):
+        durations = self.durations.get(span.name)
+        if durations is not None:
+            durations.append(span.duration_ms)
+
+    def reset(self):
+        for durations in self.durations.values():
+            durations.clear()
+
+
+def percentile(values: list, fraction: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def make_workspace() -> str:
+    """Scratch copy of the repo's sources for the agents to read."""
+    workspace = tempfile.mkdtemp(prefix="game-bench-")
+    ignore = shutil.ignore_patterns("__pycache__", ".cache", ".sessions", "*.pyc")
+    shutil.copytree(os.path.join(ROOT, "game"), os.path.join(workspace, "game"), ignore=ignore)
+    shutil.copy(os.path.join(ROOT, "main.py"), workspace)
+    return workspace
+
+
+def client_factory(options):
+    """Return make_client(agent_type) for the selected mode."""
+    if options.mode == "replay":
+        from game.llm.replay_client import ReplayLLMClient
+
+        def make_replay(agent_type):
+            return ReplayLLMClient(options.fixture, session=agent_type)
+        return make_replay
+
+    from game.llm.groq_client import GroqClient
+    from game.llm.replay_client import RecordingLLMClient
+    from game.llm.resilient_client import ResilientLLMClient
+
+    recorded = set()
+
+    def make_live(agent_type):
+        client = ResilientLLMClient(GroqClient(model=PINNED_MODEL, stream=options.stream))
+        if options.record and agent_type not in recorded:
+            recorded.add(agent_type)
+            return RecordingLLMClient(client, options.record, session=agent_type)
+        return client
+    return make_live
+
+
+def run_session(agent_type: str, make_client, max_iterations: int) -> int:
+    from game.agents.agent_factory import AgentFactory
+    from game.memory.memory import Memory
+
+    agent = AgentFactory.create(agent_type, llm=make_client(agent_type))
+    memory = agent.run(f"Summarize the Python modules of this project ({agent_type} benchmark).",
+                       Memory(), max_iterations=max_iterations)
+    # Task + a decision/result pair per step
+    return (len(memory.items) - 1) // 2
+
+
+def bench_agent(agent_type: str, make_client, collector: SpanCollector, sessions: int, max_iterations: int) -> dict:
+    run_session(agent_type, make_client, max_iterations)  # warm-up: imports, tool cache, pools
+    collector.reset()
+
+    steps = 0
+    start = time.perf_counter()
+    for _ in range(sessions):
+        steps += run_session(agent_type, make_client, max_iterations)
+    elapsed = time.perf_counter() - start
+
+    step_ms = collector.durations["agent.step"]
+    llm_ms = collector.durations["llm.call"]
+    return {
+        "agent": agent_type,
+        "sessions": sessions,
+        "steps": steps,
+        "steps_per_sec": steps / elapsed if elapsed else 0.0,
+        "overhead_ms_per_step": (sum(step_ms) - sum(llm_ms)) / len(step_ms) if step_ms else 0.0,
+        "step_p50_ms": percentile(step_ms, 0.50),
+        "step_p95_ms": percentile(step_ms, 0.95),
+        "step_p99_ms": percentile(step_ms, 0.99),
+        "llm_p50_ms": percentile(llm_ms, 0.50),
+        "llm_p99_ms": percentile(llm_ms, 0.99),
+    }
+
+
+def bench_memory(agent_type: str, make_client, sessions: int, max_iterations: int) -> dict:
+    """Traced allocations still alive after each session: growth = leak suspects."""
+    tracemalloc.start()
+    try:
+        run_session(agent_type, make_client, max_iterations)
+        baseline, _ = tracemalloc.get_traced_memory()
+        for _ in range(sessions):
+            run_session(agent_type, make_client, max_iterations)
+        current, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "memory_growth_kb_per_session": (current - baseline) / 1024 / max(sessions, 1),
+        "memory_peak_kb": peak / 1024,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--mode", choices=("server", "replay"), default="replay")
+    parser.add_argument("--agents", nargs="+", choices=AGENTS, default=list(AGENTS))
+    parser.add_argument("--sessions", type=int, default=10, help="timed sessions per agent")
+    parser.add_argument("--steps", type=int, default=8, help="tool calls per session (stub policy)")
+    parser.add_argument("--memory-sessions", type=int, default=5, help="sessions for the memory pass (0 = skip)")
+    parser.add_argument("--fixture", default=DEFAULT_FIXTURE, help="replay fixture")
+    parser.add_argument("--record", help="server mode: record each agent's first session to this fixture")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="stub time to first token")
+    parser.add_argument("--prompt-tps", type=float, default=0.0, help="stub prefill tokens/sec (0 = instant)")
+    parser.add_argument("--completion-tps", type=float, default=0.0, help="stub decode tokens/sec (0 = instant)")
+    parser.add_argument("--stream", action="store_true", help="server mode: stream responses")
+    parser.add_argument("--json", help="also write the results to this file")
+    options = parser.parse_args()
+    options.fixture = os.path.abspath(options.fixture)
+    if options.record:
+        options.record = os.path.abspath(options.record)
+        if os.path.exists(options.record):
+            os.remove(options.record)
+
+    server = None
+    if options.mode == "server":
+        server = StubLLMServer(
+            latency_ms=options.latency_ms,
+            prompt_tps=options.prompt_tps,
+            completion_tps=options.completion_tps,
+            policy=SessionPolicy(options.steps),
+        ).start()
+        # Read by CONFIG, so set before the game package is imported
+        os.environ["GROQ_BASE_URL"] = server.url
+        os.environ.setdefault("GROQ_API_KEY", "stub")
+
+    from game.tracing.tracer import Tracer, set_tracer
+
+    collector = SpanCollector()
+    set_tracer(Tracer([collector]))
+
+    workspace = make_workspace()
+    cwd = os.getcwd()
+    os.chdir(workspace)
+    try:
+        make_client = client_factory(options)
+        max_iterations = options.steps + 2
+        results = []
+        for agent_type in options.agents:
+            row = bench_agent(agent_type, make_client, collector, options.sessions, max_iterations)
+            if options.memory_sessions:
+                row.update(bench_memory(agent_type, make_client, options.memory_sessions, max_iterations))
+            results.append(row)
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(workspace, ignore_errors=True)
+        if server is not None:
+            server.stop()
+
+    print(f"End-to-end agents ({options.mode} mode, {options.sessions} sessions each)")
+    for row in results:
+        print(
+            f"  {row['agent']:<7} {row['steps_per_sec']:8.1f} steps/s"
+            f"  overhead {row['overhead_ms_per_step']:6.2f} ms/step"
+            f"  step p50/p95/p99 {row['step_p50_ms']:.2f}/{row['step_p95_ms']:.2f}/{row['step_p99_ms']:.2f} ms"
+        )
+        if "memory_growth_kb_per_session" in row:
+            print(
+                f"          memory +{row['memory_growth_kb_per_session']:.1f} KB/session"
+                f"  peak {row['memory_peak_kb']:.0f} KB"
+            )
+
+    if options.json:
+        with open(options.json, "w", encoding="utf-8") as f:
+            json.dump({"mode": options.mode, "results": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
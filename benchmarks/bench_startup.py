@@ -0,0 +1,88 @@
+"""
+Startup benchmark: cold import time of the entry points.
+
+Imports each target in a fresh interpreter under `python -X importtime`
+and reports the cumulative import time (min / median over --repeat runs),
+optionally with the modules that cost the most themselves.
+
+    python benchmarks/bench_startup.py [--repeat 5] [--top 10]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+TARGETS = [
+    "main",
+    "game.agents.agent_factory",
+    "game.agents.file_agent.agent",
+    "game.agents.readme_agent.agent",
+]
+
+
+def import_times(module: str) -> dict:
+    """Run `import module` in a new interpreter: {name: (self_us, cumulative_us)}."""
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+    )
+    if completed.returncode != 0:
+        raise RuntimeError(f"import {module} failed:\n{completed.stderr}")
+
+    times = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # header
+        times[fields[2].strip()] = (int(fields[0]), int(fields[1]))
+    return times
+
+
+def bench(module: str, repeat: int):
+    import_times(module)  # warm-up: writes any missing .pyc files
+    totals = []
+    runs = []
+    for _ in range(repeat):
+        times = import_times(module)
+        totals.append(times[module][1])
+        runs.append(times)
+    return totals, runs
+
+
+def top_self_times(runs: list, count: int):
+    """Modules with the highest median self time across runs."""
+    names = set().union(*runs)
+    medians = {
+        name: statistics.median(run[name][0] for run in runs if name in run)
+        for name in names
+    }
+    return sorted(medians.items(), key=lambda item: item[1], reverse=True)[:count]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--top", type=int, default=0, help="also list the N slowest modules (self time)")
+    parser.add_argument("targets", nargs="*", default=TARGETS)
+    options = parser.parse_args()
+
+    print(f"Cold import time ({options.repeat} runs each)")
+    for module in options.targets:
+        totals, runs = bench(module, options.repeat)
+        print(
+            f"  {module:<32} min {min(totals) / 1000:7.1f} ms"
+            f"  median {statistics.median(totals) / 1000:7.1f} ms"
+        )
+        for name, micros in top_self_times(runs, options.top):
+            print(f"      {name:<40} {micros / 1000:6.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""
+Micro-benchmark: per-step overhead of the agent loop itself.
+
+The LLM is a scripted callable that returns instantly and the tool is a
+no-op, so the time measured is prompt building, decision parsing, tool
+dispatch and memory updates only.
+
+    python benchmarks/bench_step_overhead.py [--steps 2000] [--repeat 5]
+"""
+import argparse
+import json
+import os
+import sys
+import time
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import game.actions  # noqa: F401  (registers core tools)
+from game.actions.core.decorators import register_tool
+from game.actions.registry import ActionRegistry
+from game.core.agent import Agent
+from game.environment.environment import Environment
+from game.goals.goal import Goal
+from game.language.agent_language import AgentLanguage
+from game.memory.memory import Memory
+
+
+@register_tool(tags=["benchmark"])
+def bench_noop(value: str) -> str:
+    """Return the value unchanged."""
+    return value
+
+
+class ScriptedLLM:
+    """Answers every prompt with a fixed decision; terminates after `steps`."""
+
+    def __init__(self, steps: int, response):
+        self.steps = steps
+        self.response = response
+        self.calls = 0
+
+    def __call__(self, prompt):
+        self.calls += 1
+        if self.calls >= self.steps:
+            return '{"tool": "terminate", "args": {"message": "done"}}'
+        return self.response
+
+
+def build_agent(llm) -> Agent:
+    return Agent(
+        goals=[Goal(priority=1, name="benchmark", description="Call bench_noop repeatedly.")],
+        agent_language=AgentLanguage(),
+        action_registry=ActionRegistry(tags=["benchmark", "system"]),
+        generate_response=llm,
+        environment=Environment(),
+    )
+
+
+def bench_loop(steps: int, repeat: int, response) -> float:
+    """Best-of-`repeat` microseconds per step for a full agent.run()."""
+    best = float("inf")
+    for _ in range(repeat):
+        llm = ScriptedLLM(steps, response)
+        agent = build_agent(llm)
+
+        start = time.perf_counter()
+        agent.run("benchmark", Memory(), max_iterations=steps + 1)
+        elapsed = time.perf_counter() - start
+
+        best = min(best, elapsed / llm.calls)
+    return best * 1e6
+
+
+def bench_decide(number: int, response, repeat: int = 5) -> dict:
+    """
+    Best-of-`repeat` microseconds per step spent turning a response into
+    a dispatchable, storable decision: single-parse Decision vs. the
+    previous get_action + should_terminate + memory serialization
+    sequence. Both run the tool's argument validator, as decide() does,
+    and both serialize the response for memory.
+    """
+    agent = build_agent(ScriptedLLM(1, response))
+
+    def single_parse():
+        decision = agent.decide(response)
+        return decision.call, decision.terminal, decision.serialized
+
+    def double_parse():
+        tool, invocation = agent.get_action(response)
+        args = tool["validator"](invocation["args"])
+        terminal = agent.should_terminate(response)
+        serialized = response if isinstance(response, str) else json.dumps(response, default=str)
+        return tool, args, terminal, serialized
+
+    return {
+        "decide": min(timeit.repeat(single_parse, number=number, repeat=repeat)) / number * 1e6,
+        "parse twice": min(timeit.repeat(double_parse, number=number, repeat=repeat)) / number * 1e6,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--steps", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    options = parser.parse_args()
+
+    responses = {
+        "json string": '{"tool": "bench_noop", "args": {"value": "x"}}',
+        "native dict": {"tool": "bench_noop", "args": {"value": "x"}},
+    }
+
+    print(f"Agent loop, {options.steps} steps (best of {options.repeat})")
+    for label, response in responses.items():
+        print(f"  {label:<12} {bench_loop(options.steps, options.repeat, response):8.1f} us/step")
+
+    print("\nDecision parsing")
+    for label, response in responses.items():
+        for path, micros in bench_decide(20000, response, options.repeat).items():
+            print(f"  {label:<12} {path:<12} {micros:6.2f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+"""
+Micro-benchmark: cost of validating tool-call args before dispatch.
+
+Runs the compiled validators of the registered file tools against
+valid, coercible and invalid arguments and reports microseconds per call.
+
+    python benchmarks/bench_validation.py [--number 100000]
+"""
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import game.actions  # noqa: F401  (registers core tools)
+from game.actions.core.actions_registry import TOOLS
+from game.actions.core.validation import ToolArgumentError
+
+
+CASES = [
+    ("read_file", "valid", {"file_name": "main.py"}),
+    ("read_file", "valid, 4 args", {"file_name": "main.py", "offset": 0, "length": 4096, "cursor": ""}),
+    ("read_file", "coerced", {"file_name": "main.py", "length": "4096", "start_line": 10.0}),
+    ("search_in_file", "valid", {"file_name": "main.py", "search_term": "agent", "max_matches": 5}),
+    ("read_file", "invalid", {"length": "lots", "bogus": True}),
+]
+
+
+def bench(validator, args, number: int) -> float:
+    def run():
+        try:
+            validator(args)
+        except ToolArgumentError:
+            pass
+
+    return timeit.timeit(run, number=number) / number * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--number", type=int, default=100000)
+    options = parser.parse_args()
+
+    print(f"Argument validation ({options.number} calls each)")
+    for tool_name, label, args in CASES:
+        micros = bench(TOOLS[tool_name]["validator"], args, options.number)
+        print(f"  {tool_name:<15} {label:<14} {micros:6.2f} us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,275 @@
+"""
+Local OpenAI-compatible chat-completions stub for offline benchmarks.
+
+Answers POST .../chat/completions (Groq's /openai/v1 and plain /v1
+paths alike) with deterministic tool calls, streamed or not, after a
+configurable latency: a fixed time to first token plus prompt and
+completion tokens at the given rates. Token usage is estimated at ~4
+characters per token and reported like the real APIs (usage, and
+x_groq.usage on the last stream chunk).
+
+The default policy drives the file and readme agents through a short
+realistic session: walk the workspace for Python files, read and
+search a few of them, then terminate.
+
+    python benchmarks/stub_llm_server.py --port 8765 --latency-ms 200
+    GROQ_BASE_URL=http://127.0.0.1:8765 GROQ_API_KEY=stub python main.py
+"""
+import argparse
+import itertools
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+CHARS_PER_TOKEN = 4
+
+
+def _tokens(text: str) -> int:
+    return max(1, (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN)
+
+
+class SessionPolicy:
+    """
+    Picks the next tool call from the request alone (the server is
+    stateless): the step is the number of assistant messages so far.
+    """
+
+    def __init__(self, steps: int = 8):
+        self.steps = max(2, steps)
+
+    def decide(self, messages: list, tools: list) -> dict:
+        available = {tool["function"]["name"] for tool in tools or []}
+        step = sum(1 for message in messages if message.get("role") == "assistant")
+
+        if step >= self.steps - 1 or "walk_files" not in available:
+            return {"tool": "terminate", "args": {"message": f"Done after {step} steps."}}
+
+        if step == 0:
+            return {"tool": "walk_files", "args": {"dir_path": ".", "pattern": "*.py", "max_results": 50}}
+
+        files = self._listed_files(messages) or ["main.py"]
+        name = files[(step - 1) % len(files)]
+        if step % 3 == 0 and "search_in_file" in available:
+            return {"tool": "search_in_file", "args": {"file_name": name, "search_term": "def ", "max_matches": 5}}
+        return {"tool": "read_file", "args": {"file_name": name, "length": 4096}}
+
+    @staticmethod
+    def _listed_files(messages: list) -> list:
+        # The result of the first walk_files call follows the first decision
+        for message in messages:
+            if message.get("role") != "user" or '"entries"' not in (message.get("content") or ""):
+                continue
+            try:
+                result = json.loads(message["content"]).get("result", {})
+            except (ValueError, AttributeError):
+                return []
+            return [
+                entry["path"] for entry in result.get("entries", [])
+                if isinstance(entry, dict) and "size" in entry
+            ]
+        return []
+
+
+class StubLLMServer:
+    """
+    Threaded HTTP server; start() runs it in a daemon thread.
+
+    latency_ms: time to first token; prompt_tps / completion_tps:
+    prefill and decode rates in tokens per second (0 = instant).
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency_ms: float = 0.0,
+        prompt_tps: float = 0.0,
+        completion_tps: float = 0.0,
+        policy: SessionPolicy | None = None,
+    ):
+        self.latency_ms = latency_ms
+        self.prompt_tps = prompt_tps
+        self.completion_tps = completion_tps
+        self.policy = policy or SessionPolicy()
+        self.requests = 0
+        self._ids = itertools.count(1)
+        self._httpd = ThreadingHTTPServer((host, port), self._handler())
+        self._httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "StubLLMServer":
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="stub-llm-server", daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self):
+        try:
+            self._httpd.serve_forever()
+        finally:
+            self._httpd.server_close()
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    # ------------------------------------------------------------------
+    # Completions
+    # ------------------------------------------------------------------
+
+    def complete(self, request: dict):
+        """Return (calls, their JSON arguments, prompt tokens, completion tokens)."""
+        messages = request.get("messages") or []
+        prompt_tokens = _tokens(json.dumps(messages)) + _tokens(json.dumps(request.get("tools") or []))
+
+        calls = [self.policy.decide(messages, request.get("tools"))]
+        arguments = [json.dumps(call["args"]) for call in calls]
+        completion_tokens = sum(_tokens(a) + 8 for a in arguments)
+
+        delay = self.latency_ms / 1000
+        if self.prompt_tps:
+            delay += prompt_tokens / self.prompt_tps
+        time.sleep(delay)
+        return calls, arguments, prompt_tokens, completion_tokens
+
+    def _decode_delay(self, completion_tokens: int) -> float:
+        return completion_tokens / self.completion_tps if self.completion_tps else 0.0
+
+    def _handler(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def do_POST(self):
+                if not self.path.rstrip("/").endswith("/chat/completions"):
+                    self._send_json(404, {"error": {"message": f"Unknown path {self.path}"}})
+                    return
+
+                length = int(self.headers.get("Content-Length") or 0)
+                try:
+                    request = json.loads(self.rfile.read(length) or b"{}")
+                except ValueError:
+                    self._send_json(400, {"error": {"message": "Invalid JSON body"}})
+                    return
+
+                server.requests += 1
+                completion_id = f"chatcmpl-stub-{next(server._ids)}"
+                calls, arguments, prompt_tokens, completion_tokens = server.complete(request)
+                usage = {
+                    "prompt_tokens": prompt_tokens,
+                    "completion_tokens": completion_tokens,
+                    "total_tokens": prompt_tokens + completion_tokens,
+                }
+                model = request.get("model", "stub")
+
+                if request.get("stream"):
+                    self._stream(completion_id, model, calls, arguments, usage, request)
+                    return
+
+                time.sleep(server._decode_delay(completion_tokens))
+                self._send_json(200, {
+                    "id": completion_id,
+                    "object": "chat.completion",
+                    "created": int(time.time()),
+                    "model": model,
+                    "choices": [{
+                        "index": 0,
+                        "message": {
+                            "role": "assistant",
+                            "content": None,
+                            "tool_calls": [
+                                {
+                                    "id": f"call_{i}",
+                                    "type": "function",
+                                    "function": {"name": call["tool"], "arguments": args},
+                                }
+                                for i, (call, args) in enumerate(zip(calls, arguments))
+                            ],
+                        },
+                        "finish_reason": "tool_calls",
+                    }],
+                    "usage": usage,
+                })
+
+            def _stream(self, completion_id, model, calls, arguments, usage, request):
+                self.send_response(200)
+                self.send_header("Content-Type", "text/event-stream")
+                self.send_header("Cache-Control", "no-cache")
+                self.send_header("Connection", "close")
+                self.end_headers()
+                self.close_connection = True
+
+                def chunk(delta, finish_reason=None, **extra):
+                    payload = {
+                        "id": completion_id,
+                        "object": "chat.completion.chunk",
+                        "created": int(time.time()),
+                        "model": model,
+                        "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}],
+                        **extra,
+                    }
+                    self.wfile.write(f"data: {json.dumps(payload)}\n\n".encode("utf-8"))
+                    self.wfile.flush()
+
+                pieces = 8
+                piece_delay = server._decode_delay(usage["completion_tokens"]) / (pieces * len(calls))
+                for i, (call, args) in enumerate(zip(calls, arguments)):
+                    chunk({"tool_calls": [{
+                        "index": i, "id": f"call_{i}", "type": "function",
+                        "function": {"name": call["tool"], "arguments": ""},
+                    }]})
+                    size = max(1, -(-len(args) // pieces))
+                    for start in range(0, len(args), size):
+                        time.sleep(piece_delay)
+                        chunk({"tool_calls": [{"index": i, "function": {"arguments": args[start:start + size]}}]})
+
+                extra = {"x_groq": {"id": completion_id, "usage": usage}}
+                if (request.get("stream_options") or {}).get("include_usage"):
+                    extra["usage"] = usage
+                chunk({}, "tool_calls", **extra)
+                self.wfile.write(b"data: [DONE]\n\n")
+                self.wfile.flush()
+
+            def _send_json(self, status: int, body: dict):
+                data = json.dumps(body).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+        return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="time to first token")
+    parser.add_argument("--prompt-tps", type=float, default=0.0, help="prefill tokens per second (0 = instant)")
+    parser.add_argument("--completion-tps", type=float, default=0.0, help="decode tokens per second (0 = instant)")
+    parser.add_argument("--steps", type=int, default=8, help="tool calls per session, including terminate")
+    options = parser.parse_args()
+
+    server = StubLLMServer(
+        options.host, options.port, options.latency_ms,
+        options.prompt_tps, options.completion_tps, SessionPolicy(options.steps),
+    )
+    print(f"Stub LLM server on {server.url} (Ctrl-C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
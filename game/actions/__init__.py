@@ -1,3 +1,5 @@
-# Import tool modules so decorators execute
-from game.actions.core.file_actions import *      # noqa
-from game.actions.core.terminate_action import *  # noqa
+# Register core tools: from the tool manifest where it is current, so the
+# tool modules themselves are only imported on first use
+from game.actions.manifest import load_tools
+
+load_tools()
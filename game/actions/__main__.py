@@ -0,0 +1,6 @@
+"""Regenerate the tool manifest: python -m game.actions"""
+from game.actions.manifest import MANIFEST_PATH, write_manifest
+
+written = write_manifest()
+count = sum(len(entry["tools"]) for entry in written["modules"].values())
+print(f"Wrote {count} tools from {len(written['modules'])} modules to {MANIFEST_PATH}")
@@ -1,31 +1,214 @@
-from collections import defaultdict
+import hashlib
+import importlib
+import json
+import threading
+from types import MappingProxyType
 
-# Global tool storage (simple by design)
-TOOLS = {}
-TOOLS_BY_TAG = defaultdict(list)
+DEFAULT_NAMESPACE = "default"
 
 
-def register_tool_metadata(metadata: dict):
-    name = metadata["tool_name"]
+class LazyTool(dict):
+    """
+    Tool metadata registered from the tool manifest (see game.actions.manifest).
 
-    if name in TOOLS:
-        raise ValueError(f"Tool '{name}' already registered")
+    Everything but "function" is available without importing the tool's
+    module; the first tool["function"] imports it. The entry itself never
+    changes (snapshots share it): the module's @register_tool only hands
+    over the function, which is kept as a set-once attribute.
+    """
 
-    if not metadata["tags"]:
-        raise ValueError(f"Tool '{name}' must have at least one tag")
+    __slots__ = ("module", "_function")
 
-    TOOLS[name] = metadata
+    def __init__(self, module: str, metadata: dict):
+        super().__init__(metadata)
+        self.module = module
+        self._function = None
 
-    for tag in metadata["tags"]:
-        TOOLS_BY_TAG[tag].append(name)
+    @property
+    def loaded(self) -> bool:
+        return self._function is not None
 
+    def resolve(self, function):
+        """Set the function once, from the registration of the real tool."""
+        if self._function is None:
+            self._function = function
 
-def get_tools_by_tags(tags=None):
-    if not tags:
-        return dict(TOOLS)
+    def __missing__(self, key):
+        if key != "function":
+            raise KeyError(key)
+        if self._function is None:
+            importlib.import_module(self.module)
+            if self._function is None:
+                raise KeyError(f"Tool '{self['tool_name']}' is not defined in {self.module}")
+        return self._function
 
-    allowed = set()
-    for tag in tags:
-        allowed.update(TOOLS_BY_TAG.get(tag, []))
+    def __contains__(self, key):
+        return key == "function" or dict.__contains__(self, key)
 
-    return {name: TOOLS[name] for name in allowed}
+    def get(self, key, default=None):
+        # dict.get bypasses __missing__
+        if key == "function":
+            return self[key]
+        return super().get(key, default)
+
+
+class ToolView:
+    """
+    The tools of a snapshot that carry any of a set of tags.
+
+    Views are built once per (snapshot, tags) and shared by every
+    ActionRegistry asking for them, together with their OpenAI schema.
+    Treat `tools` and `openai_schema` as read-only.
+    """
+
+    __slots__ = ("tags", "tools", "openai_schema")
+
+    def __init__(self, tags, tools: dict):
+        self.tags = tags
+        self.tools = MappingProxyType(tools)
+        self.openai_schema = [
+            {
+                "type": "function",
+                "function": {
+                    "name": tool["tool_name"],
+                    "description": tool["description"],
+                    "parameters": tool["parameters"],
+                },
+            }
+            for tool in tools.values()
+        ]
+
+
+class RegistrySnapshot:
+    """
+    Immutable state of a ToolNamespace at one version.
+
+    Tag lookups are dict lookups; tag views are built on first use and
+    cached. A snapshot never changes, so it can be shared freely across
+    threads. Pickling sends only the namespace name and a digest of the
+    tool schemas: the receiving process resolves its own snapshot of that
+    namespace and refuses one that registered different tools.
+    """
+
+    def __init__(self, namespace: str, version: int, tools: dict, tags: dict):
+        self.namespace = namespace
+        self.version = version
+        self.tools = MappingProxyType(tools)
+        self.tags = MappingProxyType({tag: tuple(names) for tag, names in tags.items()})
+        self._views = {}
+        self._digest = None
+
+    @property
+    def digest(self) -> str:
+        """Content hash of every tool's name, tags and schema."""
+        if self._digest is None:
+            encoded = json.dumps(
+                [[name, tool["tags"], tool["parameters"]] for name, tool in sorted(self.tools.items())],
+                sort_keys=True,
+            )
+            self._digest = hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+        return self._digest
+
+    def view(self, tags=None) -> ToolView:
+        """Tools carrying any of `tags` (all tools if none), in registration order."""
+        key = frozenset(tags) if tags else None
+        view = self._views.get(key)
+        if view is not None:
+            return view
+
+        if key is None:
+            tools = dict(self.tools)
+        else:
+            allowed = {name for tag in key for name in self.tags.get(tag, ())}
+            tools = {name: tool for name, tool in self.tools.items() if name in allowed}
+
+        # Two threads may build the same view: keep whichever landed first
+        return self._views.setdefault(key, ToolView(key, tools))
+
+    def __reduce__(self):
+        return _resolve_snapshot, (self.namespace, self.digest)
+
+
+def _resolve_snapshot(namespace: str, digest: str) -> RegistrySnapshot:
+    snapshot = get_namespace(namespace).snapshot()
+    if snapshot.digest != digest:
+        raise ValueError(f"Tool namespace '{namespace}' differs in this process")
+    return snapshot
+
+
+class ToolNamespace:
+    """
+    A named, independently scoped set of registered tools.
+
+    Registration bumps `version`; snapshot() returns the immutable
+    RegistrySnapshot of the current version, built once and reused until
+    the next registration.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self.version = 0
+        self.tools = {}
+        self.tags = {}  # tag -> {tool name: None}, an insertion-ordered set
+        self._snapshot = None
+        self._lock = threading.Lock()
+
+    def register(self, metadata: dict):
+        name = metadata["tool_name"]
+
+        with self._lock:
+            existing = self.tools.get(name)
+            if isinstance(existing, LazyTool) and not existing.loaded:
+                # The module behind a manifest entry was imported; the
+                # manifest matched its source, so only the function is new
+                existing.resolve(metadata["function"])
+                return
+
+            if existing is not None:
+                raise ValueError(f"Tool '{name}' already registered in namespace '{self.name}'")
+
+            if not metadata["tags"]:
+                raise ValueError(f"Tool '{name}' must have at least one tag")
+
+            self.tools[name] = metadata
+            for tag in metadata["tags"]:
+                self.tags.setdefault(tag, {})[name] = None
+            self.version += 1
+
+    def snapshot(self) -> RegistrySnapshot:
+        snapshot = self._snapshot
+        if snapshot is not None and snapshot.version == self.version:
+            return snapshot
+
+        with self._lock:
+            if self._snapshot is None or self._snapshot.version != self.version:
+                self._snapshot = RegistrySnapshot(self.name, self.version, dict(self.tools), self.tags)
+            return self._snapshot
+
+
+_NAMESPACES = {}
+_NAMESPACES_LOCK = threading.Lock()
+
+
+def get_namespace(name: str | None = None) -> ToolNamespace:
+    """The namespace called `name` (created on first use); default: the global one."""
+    name = name or DEFAULT_NAMESPACE
+    namespace = _NAMESPACES.get(name)
+    if namespace is None:
+        with _NAMESPACES_LOCK:
+            namespace = _NAMESPACES.setdefault(name, ToolNamespace(name))
+    return namespace
+
+
+# Global tool storage: the default namespace (kept as module names for existing callers)
+TOOLS = get_namespace().tools
+TOOLS_BY_TAG = get_namespace().tags
+
+
+def register_tool_metadata(metadata: dict, namespace: str | None = None):
+    get_namespace(namespace).register(metadata)
+
+
+def get_tools_by_tags(tags=None, namespace: str | None = None):
+    """Read-only mapping of the tools carrying any of `tags` (all tools if none)."""
+    return get_namespace(namespace).snapshot().view(tags).tools
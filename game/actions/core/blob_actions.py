@@ -0,0 +1,68 @@
+from game.actions.core import chunked_file
+from game.actions.core.decorators import register_tool
+from game.config.config import CONFIG
+from game.memory.blob_store import BLOB_STORE
+
+
+# Pages are already bounded by the arguments below; never spill them again
+@register_tool(tags=["blobs", "read"], max_result_chars=0)
+def read_blob(
+    blob_id: str,
+    offset: int = 0,
+    length: int = 0,
+    start_line: int = 0,
+    end_line: int = 0,
+    cursor: str = ""
+) -> dict:
+    """Reads part of a large tool result that was stored separately
+    (a value replaced by a blob_id handle). Pass the returned cursor back
+    to read the next chunk.
+
+    Args:
+        blob_id: blob_id from the truncated result
+        offset: Byte offset to start reading at
+        length: Number of bytes to read (capped per call)
+        start_line: First line to read (1-based); enables line mode
+        end_line: Last line to read (inclusive)
+        cursor: Cursor from a previous read_blob call
+    """
+    path = BLOB_STORE.open_path(blob_id)
+    page = CONFIG.results.page_bytes
+
+    if start_line or end_line:
+        result = chunked_file.read_lines(path, start_line, end_line, page, cursor)
+    else:
+        length = min(length, page) if length > 0 else page
+        result = chunked_file.read_range(path, offset, length, cursor)
+
+    result["file_name"] = blob_id
+    return result
+
+@register_tool(tags=["blobs", "search"], max_result_chars=0)
+def search_blob(
+    blob_id: str,
+    search_term: str,
+    max_matches: int = 0,
+    context_lines: int = 0,
+    cursor: str = ""
+) -> dict:
+    """Searches a large tool result that was stored separately and returns
+    matching lines with their line numbers.
+
+    Args:
+        blob_id: blob_id from the truncated result
+        search_term: Term to search for
+        max_matches: Maximum number of matches to return
+        context_lines: Lines of context to include before and after each match
+        cursor: Cursor from a previous search_blob call
+    """
+    limits = CONFIG.files
+    max_matches = min(max_matches, limits.search_max_matches) if max_matches > 0 else limits.search_max_matches
+    context_lines = max(0, min(context_lines, limits.search_max_context))
+
+    result = chunked_file.search(
+        BLOB_STORE.open_path(blob_id), search_term, max_matches, context_lines,
+        limits.max_line_chars, cursor
+    )
+    result["file_name"] = blob_id
+    return result
@@ -0,0 +1,247 @@
+"""
+Ranged reads and mmap-backed search for the file tools.
+
+Nothing here loads a whole file: reads are bounded by a byte budget and
+search jumps between matches with mmap.find(). Every result carries a
+cursor ("<byte offset>:<line number>") that resumes exactly where the
+previous call stopped, so an agent can page through multi-GB files.
+"""
+import mmap
+import os
+from contextlib import contextmanager
+
+_COUNT_WINDOW = 1024 * 1024  # newline counting is done in bounded slices
+
+
+def encode_cursor(offset: int, line: int) -> str:
+    return f"{offset}:{line}"
+
+
+def decode_cursor(cursor: str):
+    """Return (offset, line); line 0 means "not known yet"."""
+    try:
+        offset, _, line = cursor.partition(":")
+        offset, line = int(offset), int(line or 0)
+    except ValueError:
+        raise ValueError(f"Invalid cursor: {cursor!r}")
+    if offset < 0 or line < 0:
+        raise ValueError(f"Invalid cursor: {cursor!r}")
+    return offset, line
+
+
+@contextmanager
+def mapped(path: str):
+    """Read-only mmap of `path` (empty files map to b"")."""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            yield b""
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield mm
+
+
+def count_newlines(buf, start: int, end: int) -> int:
+    total = 0
+    for i in range(start, end, _COUNT_WINDOW):
+        total += buf[i:min(end, i + _COUNT_WINDOW)].count(b"\n")
+    return total
+
+
+def char_boundary(data: bytes) -> int:
+    """Length of `data` without a trailing, incomplete UTF-8 sequence."""
+    for back in range(1, min(4, len(data)) + 1):
+        byte = data[-back]
+        if byte < 0x80:
+            return len(data)           # ASCII: nothing pending
+        if byte >= 0xC0:
+            width = 2 if byte < 0xE0 else 3 if byte < 0xF0 else 4
+            return len(data) if back >= width else len(data) - back
+    return len(data)
+
+
+def decode(data: bytes, max_chars: int | None = None) -> str:
+    text = data.decode("utf-8", errors="replace").rstrip("\r")
+    if max_chars is not None and len(text) > max_chars:
+        text = text[:max_chars] + "..."
+    return text
+
+
+def _line_at(buf, offset: int, line: int) -> int:
+    return line or 1 + count_newlines(buf, 0, offset)
+
+
+def _seek_line(buf, line: int) -> int:
+    """Byte offset where 1-based `line` starts (len(buf) if past the end)."""
+    pos = 0
+    for _ in range(line - 1):
+        nl = buf.find(b"\n", pos)
+        if nl == -1:
+            return len(buf)
+        pos = nl + 1
+    return pos
+
+
+# ----------------------------------------------------------------------
+# Reads
+# ----------------------------------------------------------------------
+
+def read_range(path: str, offset: int, length: int, cursor: str = "") -> dict:
+    """
+    Read up to `length` bytes from `offset`. Unless the end of file is
+    reached the chunk is cut after its last newline (or at a character
+    boundary when it holds no newline), so the next page starts cleanly.
+    """
+    line = 0
+    if cursor:
+        offset, line = decode_cursor(cursor)
+
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        f.seek(offset)
+        data = f.read(length)
+
+    end = offset + len(data)
+    if end < size:
+        cut = data.rfind(b"\n") + 1
+        data = data[:cut] if cut else data[:char_boundary(data)]
+        end = offset + len(data)
+
+    result = {
+        "file_name": path,
+        "size": size,
+        "offset": offset,
+        "end_offset": end,
+        "content": decode(data),
+        "eof": end >= size,
+    }
+    next_line = line + data.count(b"\n") if line else 0
+    result["cursor"] = None if result["eof"] else encode_cursor(end, next_line)
+    return result
+
+
+def read_lines(path: str, start_line: int, end_line: int, max_bytes: int, cursor: str = "") -> dict:
+    """
+    Read lines start_line..end_line (1-based, inclusive; end_line 0 →
+    as many as fit). At most `max_bytes` are returned per call; the
+    cursor is None once the range or the file is exhausted.
+    """
+    if end_line and end_line < max(start_line, 1):
+        raise ValueError(f"end_line ({end_line}) is before start_line ({start_line})")
+
+    with mapped(path) as buf:
+        size = len(buf)
+
+        if cursor:
+            pos, line = decode_cursor(cursor)
+            line = _line_at(buf, pos, line)
+        else:
+            line = max(start_line, 1)
+            pos = _seek_line(buf, line)
+
+        stop = min(size, pos + max_bytes)
+        end, last = pos, line - 1
+        while end < stop and (not end_line or last < end_line):
+            nl = buf.find(b"\n", end, stop)
+            if nl == -1:
+                if stop == size:       # final line without a newline
+                    end, last = size, last + 1
+                break
+            end, last = nl + 1, last + 1
+
+        if end == pos and pos < stop and (not end_line or line <= end_line):
+            # A single line longer than the budget: return part of it
+            end = pos + char_boundary(buf[pos:stop])
+            last = line
+
+        data = buf[pos:end]
+
+    eof = end >= size
+    next_line = last + 1 if data.endswith(b"\n") else last
+    done = eof or (end_line and next_line > end_line)
+    return {
+        "file_name": path,
+        "size": size,
+        "start_line": line,
+        "end_line": last,
+        "content": decode(data),
+        "eof": eof,
+        "cursor": None if done else encode_cursor(end, next_line),
+    }
+
+
+# ----------------------------------------------------------------------
+# Search
+# ----------------------------------------------------------------------
+
+def search(
+    path: str,
+    term: str,
+    max_matches: int,
+    context_lines: int,
+    max_line_chars: int,
+    cursor: str = "",
+) -> dict:
+    """
+    Find lines containing `term` (one match per line). Stops after
+    `max_matches`; the returned cursor continues after the last match.
+    """
+    needle = term.encode("utf-8")
+    if not needle:
+        raise ValueError("search_term must not be empty")
+
+    # Never copy more than this from one (possibly huge) line
+    max_slice = max_line_chars * 4
+
+    def line_text(start, end):
+        return decode(buf[start:min(end, start + max_slice)], max_line_chars)
+
+    def line_end(start):
+        nl = buf.find(b"\n", start)
+        return size if nl == -1 else nl
+
+    with mapped(path) as buf:
+        size = len(buf)
+
+        pos, line = decode_cursor(cursor) if cursor else (0, 1)
+        line = _line_at(buf, pos, line)
+
+        matches = []
+        hit = buf.find(needle, pos)
+        while hit != -1 and len(matches) < max_matches:
+            line += count_newlines(buf, pos, hit)
+            start = buf.rfind(b"\n", 0, hit) + 1
+            end = line_end(hit)
+
+            match = {"line": line, "text": line_text(start, end)}
+
+            if context_lines:
+                before, s = [], start
+                while len(before) < context_lines and s > 0:
+                    prev = buf.rfind(b"\n", 0, s - 1) + 1
+                    before.append(line_text(prev, s - 1))
+                    s = prev
+                match["before"] = before[::-1]
+
+                after, e = [], end
+                while len(after) < context_lines and e + 1 < size:
+                    nxt = line_end(e + 1)
+                    after.append(line_text(e + 1, nxt))
+                    e = nxt
+                match["after"] = after
+
+            matches.append(match)
+
+            # Continue on the next line
+            pos = min(end + 1, size)
+            if end < size:
+                line += 1
+            hit = buf.find(needle, pos)
+
+    more = hit != -1
+    return {
+        "file_name": path,
+        "search_term": term,
+        "matches": matches,
+        "truncated": more,
+        "cursor": encode_cursor(pos, line) if more else None,
+    }
@@ -1,5 +1,6 @@
 from game.actions.core.helpers import get_tool_metadata
 from game.actions.core.actions_registry import register_tool_metadata
+from game.actions.core.tool_cache import cached_tool, invalidating_tool
 
 def register_tool(
     tool_name=None,
@@ -7,6 +8,12 @@ def register_tool(
     parameters_override=None,
     terminal=False,
     tags=None,
+    stream_args=None,
+    max_result_chars=None,
+    cacheable=False,
+    path_args=None,
+    invalidates_cache=False,
+    namespace=None,
 ):
     """
     A decorator to dynamically register a function in the tools dictionary with its parameters, schema, and docstring.
@@ -17,10 +24,29 @@ def register_tool(
         parameters_override (dict, optional): Override for the argument schema. Defaults to dynamically inferred schema.
         terminal (bool, optional): Whether the tool is terminal. Defaults to False.
         tags (List[str], optional): List of tags to associate with the tool.
+        stream_args (List[str], optional): String arguments the tool accepts as
+            StreamedText when responses are streamed (e.g. large file content).
+        max_result_chars (int, optional): Cap on the result size kept in memory;
+            larger values are spilled to the blob store. Defaults to
+            CONFIG.results.max_inline_chars; 0 disables the cap.
+        cacheable (bool, optional): Memoize results of this read-only tool
+            (see TOOL_CACHE). Defaults to False.
+        path_args (List[str], optional): Arguments holding file or directory
+            paths. A cacheable tool's entries are only reused while those
+            paths are unchanged (inode, mtime, size); a tool with
+            invalidates_cache drops cached entries under those paths.
+        invalidates_cache (bool, optional): Whether the tool writes to
+            `path_args`. Defaults to False. A tool that writes is not
+            read-only, so it cannot also be cacheable.
+        namespace (str, optional): Tool namespace to register in (see
+            ToolNamespace). Defaults to the global namespace.
 
     Returns:
         function: The wrapped function.
     """
+    if cacheable and invalidates_cache:
+        raise ValueError("A tool cannot be both cacheable and invalidates_cache: a tool that writes is not read-only")
+
     def decorator(func):
         metadata = get_tool_metadata(
             func=func,
@@ -29,7 +55,19 @@ def register_tool(
             parameters_override=parameters_override,
             terminal=terminal,
             tags=tags,
+            stream_args=stream_args,
+            max_result_chars=max_result_chars,
         )
-        register_tool_metadata(metadata)
+        metadata["cacheable"] = cacheable
+        metadata["path_args"] = list(path_args or [])
+
+        if cacheable:
+            # Same-named tools in other namespaces must not share cache entries
+            cache_name = metadata["tool_name"] if namespace is None else f"{namespace}:{metadata['tool_name']}"
+            metadata["function"] = cached_tool(func, cache_name, metadata["path_args"])
+        elif invalidates_cache:
+            metadata["function"] = invalidating_tool(func, metadata["path_args"])
+
+        register_tool_metadata(metadata, namespace)
         return func
     return decorator
@@ -1,37 +1,75 @@
 import os
 from typing import Dict
+from game.actions.core import chunked_file
 from game.actions.core.decorators import register_tool
+from game.config.config import CONFIG
+from game.llm.streaming import StreamedText
 
-@register_tool(tags=["file_operations", "list"])
+@register_tool(tags=["file_operations", "list"], cacheable=True, path_args=["dir_path"])
 def list_files(dir_path: str) -> list:
     return os.listdir(dir_path)
 
-@register_tool(tags=["file_operations", "read"])
-def read_file(file_name: str) -> str:
-    """Reads and returns the content of a file.
+# Pages are already bounded by read_max_bytes / search limits; never spill them
+@register_tool(tags=["file_operations", "read"], cacheable=True, path_args=["file_name"], max_result_chars=0)
+def read_file(
+    file_name: str,
+    offset: int = 0,
+    length: int = 0,
+    start_line: int = 0,
+    end_line: int = 0,
+    cursor: str = ""
+) -> dict:
+    """Reads part of a file. Large files are returned in chunks; pass the
+    returned cursor back to read the next chunk.
 
     Args:
         file_name: Name of the file
+        offset: Byte offset to start reading at
+        length: Number of bytes to read (capped per call)
+        start_line: First line to read (1-based); enables line mode
+        end_line: Last line to read (inclusive)
+        cursor: Cursor from a previous read_file call
     """
-    with open(file_name, 'r') as f:
-        return f.read()
+    max_bytes = CONFIG.files.read_max_bytes
 
-@register_tool(tags=["file_operations", "search"])
-def search_in_file(file_name: str, search_term: str) -> list:
-    """Searches for a term in a specific file.
+    if start_line or end_line:
+        return chunked_file.read_lines(file_name, start_line, end_line, max_bytes, cursor)
+
+    length = min(length, max_bytes) if length > 0 else max_bytes
+    return chunked_file.read_range(file_name, offset, length, cursor)
+
+@register_tool(tags=["file_operations", "search"], cacheable=True, path_args=["file_name"], max_result_chars=0)
+def search_in_file(
+    file_name: str,
+    search_term: str,
+    max_matches: int = 0,
+    context_lines: int = 0,
+    cursor: str = ""
+) -> dict:
+    """Searches for a term in a specific file and returns matching lines
+    with their line numbers. Pass the returned cursor back for more matches.
 
     Args:
         file_name: Name of the file
         search_term: Term to search in the file
+        max_matches: Maximum number of matches to return
+        context_lines: Lines of context to include before and after each match
+        cursor: Cursor from a previous search_in_file call
     """
-    results = []
-    with open(file_name, 'r') as f:
-        for i, line in enumerate(f.readlines()):
-            if search_term in line:
-                results.append((i+1, line.strip()))
-    return results
-
-@register_tool(tags=["file_operations", "write"])
+    limits = CONFIG.files
+    max_matches = min(max_matches, limits.search_max_matches) if max_matches > 0 else limits.search_max_matches
+    context_lines = max(0, min(context_lines, limits.search_max_context))
+
+    return chunked_file.search(
+        file_name, search_term, max_matches, context_lines, limits.max_line_chars, cursor
+    )
+
+@register_tool(
+    tags=["file_operations", "write"],
+    stream_args=["content"],
+    invalidates_cache=True,
+    path_args=["output_dir"],
+)
 def write_output_file(
     filename: str,
     content: str,
@@ -53,9 +91,14 @@ def write_output_file(
     file_path = os.path.join(output_dir, filename)
 
     with open(file_path, "w", encoding="utf-8") as f:
-        f.write(content)
+        # Streamed content is copied from its spool, never held whole in memory
+        if isinstance(content, StreamedText):
+            bytes_written = content.copy_to(f)
+        else:
+            f.write(content)
+            bytes_written = len(content.encode("utf-8"))
 
     return {
         "output_path": file_path,
-        "bytes_written": len(content.encode("utf-8"))
+        "bytes_written": bytes_written
     }
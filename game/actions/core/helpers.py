@@ -1,6 +1,8 @@
 import inspect
 from typing import get_type_hints
 
+from game.actions.core.validation import compile_validator
+
 
 def python_type_to_json_type(py_type):
     if py_type in (int,):
@@ -23,6 +25,8 @@ def get_tool_metadata(
     parameters_override=None,
     terminal=False,
     tags=None,
+    stream_args=None,
+    max_result_chars=None,
 ):
     tool_name = tool_name or func.__name__
 
@@ -64,4 +68,8 @@ def get_tool_metadata(
         "function": func,
         "terminal": terminal,
         "tags": tags or [],
+        "stream_args": list(stream_args or []),
+        "max_result_chars": max_result_chars,
+        # Compiled once here, run on every call before dispatch
+        "validator": compile_validator(tool_name, parameters),
     }
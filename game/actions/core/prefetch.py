@@ -0,0 +1,163 @@
+"""
+Speculative prefetch of read-only tool calls.
+
+While the LLM decides the next step, the calls it is likely to make
+(e.g. read_file on what list_files just returned) run in the background
+and their results wait in PREFETCH_CACHE; the real call takes them
+instead of touching the disk. Only cacheable tools carrying one of
+CONFIG.prefetch.tags ("read" and "search" by default) are ever run
+speculatively, so tools with side effects never are.
+"""
+import functools
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+
+from game.config.config import CONFIG
+
+logger = logging.getLogger(__name__)
+
+PREDICTORS = {}
+
+
+def predictor(tool_name: str):
+    """
+    Register fn(args, result) -> iterable of (tool_name, args): the calls
+    likely to follow a successful call of `tool_name`, most likely first.
+    """
+    def decorator(func):
+        PREDICTORS[tool_name] = func
+        return func
+    return decorator
+
+
+def _read(root: str, path: str):
+    return "read_file", {"file_name": os.path.normpath(os.path.join(root, path))}
+
+
+@predictor("list_files")
+def _after_list_files(args: dict, result):
+    root = args.get("dir_path") or "."
+    for name in result if isinstance(result, list) else []:
+        if os.path.isfile(os.path.join(root, name)):
+            yield _read(root, name)
+
+
+@predictor("walk_files")
+def _after_walk_files(args: dict, result):
+    root = args.get("dir_path") or "."
+    for entry in result.get("entries", []) if isinstance(result, dict) else []:
+        if "size" in entry:
+            yield _read(root, entry["path"])
+
+
+@predictor("search_workspace")
+def _after_search_workspace(args: dict, result):
+    root = args.get("path") or "."
+    seen = set()
+    for hit in result.get("hits", []) if isinstance(result, dict) else []:
+        if hit["file"] not in seen:
+            seen.add(hit["file"])
+            yield _read(root, hit["file"])
+
+
+# tool name -> extra args of its last real call, shared by every agent in the process
+ARG_TEMPLATES = {}
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def _submit(run, func, args: dict):
+    """Start run(func, args) on the shared prefetch pool."""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = ThreadPoolExecutor(
+                    max_workers=CONFIG.prefetch.max_workers,
+                    thread_name_prefix="game-prefetch",
+                )
+    return _pool.submit(run, func, args)
+
+
+class SpeculativeExecutor:
+    """
+    Warms an agent's likely next calls after each real one.
+
+    A prefetched result is only used by an identical call, so arguments
+    a predictor leaves out are copied from the last real call of the
+    same tool (e.g. its `length`, see ARG_TEMPLATES); path arguments and
+    continuation cursors are not carried over. Predicted args then go
+    through the tool's validator, as the real call's do. Calls run via
+    `environment.run_tool`, so a sandboxed environment's timeouts and
+    limits apply to them too.
+    """
+
+    def __init__(self, actions, environment, tags=None, max_calls: int | None = None):
+        settings = CONFIG.prefetch
+        self.actions = actions
+        self.submit = functools.partial(_submit, environment.run_tool)
+        self.tags = frozenset(tags or settings.tags)
+        self.max_calls = max_calls or settings.max_calls_per_step
+
+    def eligible(self, tool) -> bool:
+        """Read-only (cacheable), non-terminal and tagged for prefetch."""
+        return (
+            tool is not None
+            and tool.get("cacheable", False)
+            and not tool.get("terminal", False)
+            and not self.tags.isdisjoint(tool.get("tags", ()))
+        )
+
+    def _tool(self, name: str):
+        try:
+            return self.actions.get_tool(name)
+        except KeyError:
+            return None
+
+    @staticmethod
+    def _normalize(tool, args: dict):
+        """Args as the validator hands them to the real call (None if invalid)."""
+        validator = tool.get("validator")
+        if validator is None:
+            return args
+        try:
+            return validator(args)
+        except ValueError:
+            return None
+
+    def observe(self, call, result: dict) -> int:
+        """Learn from a finished real call and start the calls likely to follow it."""
+        if call.error is not None:
+            return 0
+
+        if self.eligible(call.tool):
+            skipped = {"cursor", *call.tool["path_args"]}
+            ARG_TEMPLATES[call.name] = {k: v for k, v in call.args.items() if k not in skipped}
+
+        predict = PREDICTORS.get(call.name)
+        if predict is None or not result.get("tool_executed"):
+            return 0
+
+        started = 0
+        try:
+            for name, args in islice(predict(call.args, result.get("result")), self.max_calls):
+                tool = self._tool(name)
+                if not self.eligible(tool):
+                    continue
+                args = self._normalize(tool, {**ARG_TEMPLATES.get(name, {}), **args})
+                if args is None:
+                    continue
+                prefetch = getattr(tool["function"], "prefetch", None)
+                if prefetch is not None and prefetch(self.submit, args):
+                    started += 1
+        except Exception:
+            # A bad guess must never break the run
+            logger.debug("Prefetch after %s failed", call.name, exc_info=True)
+
+        if started:
+            logger.debug("Prefetching %d call(s) after %s", started, call.name)
+        return started
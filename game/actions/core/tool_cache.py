@@ -0,0 +1,315 @@
+import copy
+import functools
+import hashlib
+import inspect
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from game.config.config import CONFIG
+
+
+def _path_state(path: str):
+    """What a cached result depends on: inode, mtime and size (None if missing)."""
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+
+def _affected_by(paths):
+    """Predicate: does a dependency on `path` go stale when `paths` are written?"""
+    targets = [os.path.abspath(p) for p in paths]
+    parents = {os.path.dirname(t) for t in targets}
+
+    def affected(path):
+        return path in parents or any(
+            path == t or path.startswith(t.rstrip(os.sep) + os.sep) for t in targets
+        )
+
+    return affected
+
+
+class ToolCache:
+    """
+    LRU memo of tool results, shared by every agent in the process.
+
+    Entries are keyed on a hash of (tool, args, resolved path args) and
+    store the state of those paths when the result was produced; a hit
+    is only served while every path still has the same inode, mtime and
+    size. Write tools drop entries for the paths they touch.
+    """
+
+    def __init__(self, max_entries: int | None = None):
+        self.max_entries = max_entries or CONFIG.tool_cache.max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()  # key -> (paths, states, value)
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(tool_name: str, args: dict, paths: tuple) -> str | None:
+        try:
+            encoded = json.dumps([tool_name, args, paths], sort_keys=True)
+        except (TypeError, ValueError):
+            return None  # unserializable args are never cached
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+    def get(self, key: str, paths: tuple):
+        """Return (hit, value)."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] == tuple(_path_state(p) for p in paths):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return True, copy.deepcopy(entry[2])
+
+            if entry is not None:
+                del self._entries[key]  # a file changed underneath it
+            self.misses += 1
+            return False, None
+
+    def contains(self, key: str, paths: tuple) -> bool:
+        """Whether get() would hit, without counting it or touching the LRU order."""
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry is not None and entry[1] == tuple(_path_state(p) for p in paths)
+
+    def put(self, key: str, paths: tuple, states: tuple, value):
+        with self._lock:
+            self._entries[key] = (paths, states, copy.deepcopy(value))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate_paths(self, paths):
+        """Drop entries that depend on `paths`, anything under them, or their parent directories."""
+        affected = _affected_by(paths)
+        with self._lock:
+            stale = [key for key, (deps, _, _) in self._entries.items() if any(map(affected, deps))]
+            for key in stale:
+                del self._entries[key]
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
+
+
+TOOL_CACHE = ToolCache()
+
+
+class PrefetchCache:
+    """
+    Short-lived results of speculative tool calls (see prefetch.py).
+
+    An entry is a Future running in the background plus the state of
+    its paths when it started. The first real call with the same key
+    takes it, waiting if it is still running, as long as it has not
+    expired and the paths are unchanged; anything else is a miss and
+    the call runs normally.
+    """
+
+    def __init__(self, ttl_seconds: float | None = None, max_entries: int | None = None):
+        self.ttl_seconds = ttl_seconds or CONFIG.prefetch.ttl_seconds
+        self.max_entries = max_entries or CONFIG.prefetch.max_entries
+        self.started = 0
+        self.hits = 0
+        self.wasted = 0
+        self._entries = OrderedDict()  # key -> (deadline, paths, states, future)
+        self._lock = threading.Lock()
+
+    def start(self, key: str, paths: tuple, states: tuple, submit) -> bool:
+        """Run submit() -> Future for `key` unless an entry is already pending."""
+        with self._lock:
+            now = time.monotonic()
+            self._drop_expired(now)
+            if key in self._entries:
+                return False
+
+            self._entries[key] = (now + self.ttl_seconds, paths, states, submit())
+            self.started += 1
+            while len(self._entries) > self.max_entries:
+                self._discard(self._entries.popitem(last=False)[1])
+            return True
+
+    def take(self, key: str, paths: tuple):
+        """Return (hit, states, value); a taken entry is removed either way."""
+        with self._lock:
+            entry = self._entries.pop(key, None)
+        if entry is None:
+            return False, None, None
+
+        deadline, _, states, future = entry
+        # Still queued: running it inline is no slower than waiting
+        if time.monotonic() > deadline or not (future.running() or future.done()):
+            self._discard(entry)
+            return False, None, None
+
+        try:
+            value = future.result()
+        except Exception:
+            value = states = None  # the real call reports the error
+        if states is None or states != tuple(_path_state(p) for p in paths):
+            self.wasted += 1
+            return False, None, None
+
+        self.hits += 1
+        return True, states, value
+
+    def invalidate_paths(self, paths):
+        """Drop pending entries that depend on `paths` (see ToolCache.invalidate_paths)."""
+        affected = _affected_by(paths)
+        with self._lock:
+            stale = [key for key, (_, deps, _, _) in self._entries.items() if any(map(affected, deps))]
+            for key in stale:
+                self._discard(self._entries.pop(key))
+
+    def _drop_expired(self, now: float):
+        while self._entries:
+            key, entry = next(iter(self._entries.items()))
+            if entry[0] > now:
+                break
+            self._discard(self._entries.pop(key))
+
+    def _discard(self, entry):
+        self.wasted += 1
+        entry[3].cancel()  # no-op once it is running
+
+    def clear(self):
+        with self._lock:
+            for entry in self._entries.values():
+                entry[3].cancel()
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        return {
+            "pending": len(self._entries),
+            "started": self.started,
+            "hits": self.hits,
+            "wasted": self.wasted,
+        }
+
+
+PREFETCH_CACHE = PrefetchCache()
+
+
+def _path_resolver(func, path_args):
+    """Build args -> tuple of absolute paths for the declared path arguments."""
+    defaults = {
+        name: param.default
+        for name, param in inspect.signature(func).parameters.items()
+        if param.default is not inspect.Parameter.empty
+    }
+
+    def resolve(args: dict) -> tuple:
+        paths = []
+        for name in path_args:
+            value = args.get(name, defaults.get(name))
+            if isinstance(value, str):
+                paths.append(os.path.abspath(value))
+        return tuple(paths)
+
+    return resolve
+
+
+def _run_inline(func, args: dict):
+    return func(**args)
+
+
+def cached_tool(
+    func,
+    tool_name: str,
+    path_args,
+    cache: ToolCache = TOOL_CACHE,
+    prefetched: PrefetchCache = PREFETCH_CACHE,
+):
+    """
+    Wrap a read-only tool so repeated calls are served from `cache`,
+    and calls started speculatively from `prefetched`.
+
+    The wrapper's `call_with(run, args)` keeps the cache in this process
+    while `run(func, args)` executes the undecorated tool elsewhere
+    (see ProcessPoolEnvironment). `prefetch(submit, args)` starts the
+    call in the background with submit(func, args) -> Future.
+    """
+    resolve = _path_resolver(func, path_args)
+
+    def call_with(run, args: dict):
+        use_cache = CONFIG.tool_cache.enabled
+        if not use_cache and not CONFIG.prefetch.enabled:
+            return run(func, args)
+
+        paths = resolve(args)
+        key = cache.key(tool_name, args, paths)
+        if key is None:
+            return run(func, args)
+
+        if use_cache:
+            hit, value = cache.get(key, paths)
+            if hit:
+                return value
+
+        if CONFIG.prefetch.enabled:
+            hit, states, value = prefetched.take(key, paths)
+            if hit:
+                if use_cache:
+                    cache.put(key, paths, states, value)
+                return value
+
+        if not use_cache:
+            return run(func, args)
+
+        # Snapshot before running: a concurrent write then just causes a miss
+        states = tuple(_path_state(p) for p in paths)
+        value = run(func, args)
+        cache.put(key, paths, states, value)
+        return value
+
+    @functools.wraps(func)
+    def wrapper(**args):
+        return call_with(_run_inline, args)
+
+    def prefetch(submit, args: dict) -> bool:
+        paths = resolve(args)
+        key = cache.key(tool_name, args, paths)
+        if key is None or (CONFIG.tool_cache.enabled and cache.contains(key, paths)):
+            return False
+
+        states = tuple(_path_state(p) for p in paths)
+        return prefetched.start(key, paths, states, lambda: submit(func, args))
+
+    wrapper.call_with = call_with
+    wrapper.prefetch = prefetch
+    return wrapper
+
+
+def invalidating_tool(
+    func,
+    path_args,
+    cache: ToolCache = TOOL_CACHE,
+    prefetched: PrefetchCache = PREFETCH_CACHE,
+):
+    """Wrap a write tool so cached and prefetched results for the paths it touches are dropped."""
+    resolve = _path_resolver(func, path_args)
+
+    def call_with(run, args: dict):
+        try:
+            return run(func, args)
+        finally:
+            # Also after a failure: the write may have been partial
+            paths = resolve(args)
+            cache.invalidate_paths(paths)
+            prefetched.invalidate_paths(paths)
+
+    @functools.wraps(func)
+    def wrapper(**args):
+        return call_with(_run_inline, args)
+
+    wrapper.call_with = call_with
+    return wrapper
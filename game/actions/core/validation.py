@@ -0,0 +1,183 @@
+"""
+Tool argument validation, compiled once per tool at registration.
+
+A validator checks LLM-provided args against the tool's JSON schema,
+coerces near-misses (e.g. "10" → 10, "true" → True) and reports every
+problem at once as a compact, structured error instead of a traceback.
+"""
+import json
+
+from game.llm.streaming import StreamedText
+
+_INVALID = object()
+_MAX_REPR = 40
+
+
+class ToolArgumentError(ValueError):
+    """LLM-provided args do not match the tool's schema."""
+
+    def __init__(self, tool_name: str, errors: list):
+        self.tool_name = tool_name
+        self.errors = errors
+        super().__init__(f"Invalid arguments for {tool_name}: " + "; ".join(
+            f"{e['arg']}: {e['error']}" if "arg" in e else e["error"] for e in errors
+        ))
+
+    def result(self) -> dict:
+        """Failed tool result shaped like Environment._failure, minus the traceback."""
+        return {
+            "tool_executed": False,
+            "error": str(self),
+            "invalid_args": self.errors,
+        }
+
+
+# ----------------------------------------------------------------------
+# Per-type checkers: return the (possibly coerced) value or _INVALID
+# ----------------------------------------------------------------------
+
+def _check_string(value):
+    if isinstance(value, (str, StreamedText)):
+        return value
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return str(value)
+    return _INVALID
+
+
+def _check_integer(value):
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    if isinstance(value, str):
+        try:
+            return int(value.strip())
+        except ValueError:
+            return _INVALID
+    return _INVALID
+
+
+def _check_number(value):
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return value
+    if isinstance(value, str):
+        try:
+            return float(value.strip())
+        except ValueError:
+            return _INVALID
+    return _INVALID
+
+
+_BOOL_STRINGS = {"true": True, "false": False, "1": True, "0": False, "yes": True, "no": False}
+
+
+def _check_boolean(value):
+    if isinstance(value, bool):
+        return value
+    if isinstance(value, int) and value in (0, 1):
+        return bool(value)
+    if isinstance(value, str):
+        return _BOOL_STRINGS.get(value.strip().lower(), _INVALID)
+    return _INVALID
+
+
+def _json_checker(expected_type):
+    # Models sometimes send arrays/objects as JSON-encoded strings
+    def check(value):
+        if isinstance(value, expected_type):
+            return value
+        if isinstance(value, str):
+            try:
+                decoded = json.loads(value)
+            except ValueError:
+                return _INVALID
+            if isinstance(decoded, expected_type):
+                return decoded
+        return _INVALID
+    return check
+
+
+_CHECKERS = {
+    "string": _check_string,
+    "integer": _check_integer,
+    "number": _check_number,
+    "boolean": _check_boolean,
+    "array": _json_checker(list),
+    "object": _json_checker(dict),
+}
+
+
+def _describe(value) -> str:
+    text = repr(value)
+    return text if len(text) <= _MAX_REPR else text[:_MAX_REPR - 3] + "..."
+
+
+def _compile_property(spec: dict):
+    check = _CHECKERS.get(spec.get("type"))
+    enum = spec.get("enum")
+    if enum is None:
+        return check, spec.get("type")
+
+    allowed = set(enum)
+
+    def check_enum(value):
+        if check is not None:
+            value = check(value)
+        try:
+            return value if value is not _INVALID and value in allowed else _INVALID
+        except TypeError:  # unhashable value
+            return _INVALID
+
+    return check_enum, f"one of {sorted(allowed, key=str)}"
+
+
+def compile_validator(tool_name: str, schema: dict):
+    """Build validate(args) -> args for `schema` (raises ToolArgumentError)."""
+    properties = {
+        name: _compile_property(spec)
+        for name, spec in (schema.get("properties") or {}).items()
+    }
+    required = tuple(schema.get("required", ()))
+    allow_extra = bool(schema.get("additionalProperties", False))
+
+    def validate(args):
+        if not isinstance(args, dict):
+            raise ToolArgumentError(tool_name, [{"error": f"arguments must be an object, got {_describe(args)}"}])
+
+        errors = []
+        coerced = None
+
+        for name, value in args.items():
+            prop = properties.get(name)
+            if prop is None:
+                if not allow_extra:
+                    errors.append({"arg": name, "error": "unexpected argument"})
+                continue
+
+            check, expected = prop
+            if value is None and name not in required:
+                # null for an optional arg → use the tool's default
+                if coerced is None:
+                    coerced = dict(args)
+                del coerced[name]
+                continue
+            if check is None:
+                continue
+
+            result = check(value)
+            if result is _INVALID:
+                errors.append({"arg": name, "error": f"expected {expected}, got {_describe(value)}"})
+            elif result is not value:
+                if coerced is None:
+                    coerced = dict(args)
+                coerced[name] = result
+
+        for name in required:
+            if name not in args:
+                errors.append({"arg": name, "error": "missing required argument"})
+
+        if errors:
+            raise ToolArgumentError(tool_name, errors)
+        return args if coerced is None else coerced
+
+    return validate
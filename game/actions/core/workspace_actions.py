@@ -0,0 +1,72 @@
+from itertools import islice
+
+from game.actions.core.decorators import register_tool
+from game.config.config import CONFIG
+from game.workspace.trigram_index import TrigramIndex
+from game.workspace.walker import walk
+
+
+@register_tool(tags=["file_operations", "list"])
+def walk_files(
+    dir_path: str = ".",
+    pattern: str = "",
+    max_depth: int = 0,
+    max_results: int = 0,
+    include_dirs: bool = False,
+    cursor: str = ""
+) -> dict:
+    """Recursively lists files under a directory with their sizes,
+    skipping anything ignored by .gitignore. Results are paged; pass the
+    returned cursor back to get the next page.
+
+    Args:
+        dir_path: Directory to walk (default: current directory)
+        pattern: Glob filter, e.g. "*.py" (file name) or "game/**/*.py" (path)
+        max_depth: Maximum directory depth (1 = only dir_path itself)
+        max_results: Maximum number of entries to return
+        include_dirs: Also list directories
+        cursor: Cursor from a previous walk_files call
+    """
+    limit = CONFIG.files.walk_max_results
+    max_results = min(max_results, limit) if max_results > 0 else limit
+
+    # The walk order is stable: a page resumes after the last path returned
+    entries = list(islice(
+        walk(dir_path, pattern, max_depth=max_depth or None, include_dirs=include_dirs, after=cursor),
+        max_results + 1,
+    ))
+    more = len(entries) > max_results
+
+    return {
+        "dir_path": dir_path,
+        "entries": [
+            {"path": entry.path + "/", "type": "dir"} if entry.is_dir
+            else {"path": entry.path, "size": entry.size}
+            for entry in entries[:max_results]
+        ],
+        "truncated": more,
+        "cursor": entries[max_results - 1].path if more else None,
+    }
+
+
+@register_tool(tags=["file_operations", "search"])
+def search_workspace(
+    query: str,
+    path: str = ".",
+    max_results: int = 0,
+    case_sensitive: bool = False
+) -> dict:
+    """Searches all text files under a directory in one call and returns
+    the best matching lines as file/line hits. Lines containing more of
+    the query's words rank higher.
+
+    Args:
+        query: Words to search for (separated by spaces)
+        path: Directory to search (default: current directory)
+        max_results: Maximum number of hits to return
+        case_sensitive: Match letter case exactly
+    """
+    limit = CONFIG.search.max_results
+    max_results = min(max_results, limit) if max_results > 0 else limit
+
+    return TrigramIndex.for_root(path).search(query, max_results, case_sensitive)
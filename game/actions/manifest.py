@@ -0,0 +1,110 @@
+"""
+Tool manifest: register core tool metadata without importing tool modules.
+
+tool_manifest.json stores each core module's tool metadata together with
+a hash of the module's source. load_tools() registers LazyTool entries
+from it, so agents can build schemas and validate calls at startup; a
+module is imported on the first call of one of its tools. A module whose
+source no longer matches the manifest is imported right away instead.
+
+Regenerate after changing a tool module:
+
+    python -m game.actions
+"""
+import hashlib
+import importlib
+import json
+import os
+
+from game.actions.core.actions_registry import TOOLS, LazyTool, register_tool_metadata
+from game.actions.core.validation import compile_validator
+
+# Modules whose tools every agent can see (order = registration order)
+TOOL_MODULES = (
+    "game.actions.core.file_actions",
+    "game.actions.core.terminate_action",
+    "game.actions.core.workspace_actions",
+    "game.actions.core.blob_actions",
+)
+
+MANIFEST_PATH = os.path.join(os.path.dirname(__file__), "tool_manifest.json")
+
+# Everything in the registry metadata except the callables
+_FIELDS = (
+    "tool_name",
+    "description",
+    "parameters",
+    "terminal",
+    "tags",
+    "stream_args",
+    "max_result_chars",
+    "cacheable",
+    "path_args",
+)
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def _source_hash(module: str) -> str | None:
+    path = os.path.join(_ROOT, *module.split(".")) + ".py"
+    try:
+        with open(path, "rb") as f:
+            return hashlib.sha256(f.read()).hexdigest()
+    except OSError:
+        return None
+
+
+def _read_manifest(path: str) -> dict:
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f).get("modules", {})
+    except (OSError, ValueError):
+        return {}
+
+
+def load_tools(modules=TOOL_MODULES, manifest_path: str = MANIFEST_PATH):
+    """Register the tools of `modules`, lazily where the manifest is current."""
+    manifest = _read_manifest(manifest_path)
+
+    for module in modules:
+        entry = manifest.get(module)
+        source_hash = _source_hash(module)
+        if entry is None or source_hash is None or entry.get("sha256") != source_hash:
+            importlib.import_module(module)
+            continue
+
+        for metadata in entry["tools"]:
+            if metadata["tool_name"] in TOOLS:
+                continue  # module already imported
+            metadata["validator"] = compile_validator(metadata["tool_name"], metadata["parameters"])
+            register_tool_metadata(LazyTool(module, metadata))
+
+
+def build_manifest(modules=TOOL_MODULES) -> dict:
+    """Import `modules` and collect their registered tool metadata."""
+    for module in modules:
+        importlib.import_module(module)
+
+    tools_by_module = {module: [] for module in modules}
+    for tool in TOOLS.values():
+        module = tool["function"].__module__
+        if module in tools_by_module:
+            tools_by_module[module].append({field: tool[field] for field in _FIELDS})
+
+    return {
+        "modules": {
+            module: {"sha256": _source_hash(module), "tools": tools}
+            for module, tools in tools_by_module.items()
+        }
+    }
+
+
+def write_manifest(manifest_path: str = MANIFEST_PATH, modules=TOOL_MODULES) -> dict:
+    manifest = build_manifest(modules)
+    tmp_path = manifest_path + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, indent=2)
+        f.write("\n")
+    os.replace(tmp_path, manifest_path)
+    return manifest
+
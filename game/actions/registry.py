@@ -1,13 +1,20 @@
-from game.actions.core.actions_registry import get_tools_by_tags
+from game.actions.core.actions_registry import RegistrySnapshot, get_namespace
 
 
 class ActionRegistry:
     """
     Agent-scoped view of allowed tools.
+
+    Backed by a shared, immutable ToolView, so building one is a cached
+    lookup and every registry with the same tags reuses the same tool
+    mapping and OpenAI schema. Tools come from `namespace` (the global
+    one by default) or from an explicit `snapshot`.
     """
 
-    def __init__(self, tags=None):
-        self._tools = get_tools_by_tags(tags)
+    def __init__(self, tags=None, namespace: str | None = None, snapshot: RegistrySnapshot | None = None):
+        self.snapshot = snapshot or get_namespace(namespace).snapshot()
+        self._view = self.snapshot.view(tags)
+        self._tools = self._view.tools
 
     def list_tools(self):
         return self._tools.values()
@@ -16,15 +23,5 @@ class ActionRegistry:
         return self._tools[name]
 
     def get_openai_schema(self):
-        return [
-            {
-                "type": "function",
-                "function": {
-                    "name": tool["tool_name"],
-                    "description": tool["description"],
-                    "parameters": tool["parameters"],
-                },
-            }
-            for tool in self._tools.values()
-        ]
-
+        # Built once per (snapshot, tags) and shared: treat as read-only
+        return self._view.openai_schema
@@ -15,11 +15,15 @@ class AgentFactory:
     }
 
     @classmethod
-    def create(cls, agent_type: str):
+    def create(cls, agent_type: str, llm=None):
+        """
+        Build an agent of the given type.
+        Pass `llm` to share one client (e.g. a rate-limited one) across agents.
+        """
         if agent_type not in cls._registry:
             raise ValueError(
                 f"Unknown agent type '{agent_type}'. "
                 f"Available agents: {list(cls._registry.keys())}"
             )
 
-        return cls._registry[agent_type]()
+        return cls._registry[agent_type](llm=llm)
@@ -1,7 +1,7 @@
 from game.core.agent import Agent
 from game.language.agent_language import AgentLanguage
 from game.memory.memory import Memory
-from game.environment.environment import Environment
+from game.environment.environment_factory import EnvironmentFactory
 from game.llm.llm_factory import LLMFactory
 from game.config.config import CONFIG
 
@@ -11,14 +11,15 @@ from . import actions
 
 from .goals import file_management_goals
 
-def create_agent():
-    llm = LLMFactory.create()
-    action_registry = ActionRegistry(tags=["file_operations","system"])
+def create_agent(llm=None):
+    llm = llm or LLMFactory.create()
+    action_registry = ActionRegistry(tags=["file_operations", "system", "blobs"])
 
     return Agent(
         goals=file_management_goals,
         agent_language=AgentLanguage(),
         action_registry=action_registry,
-        environment=Environment(),
-        generate_response=llm
+        environment=EnvironmentFactory.create(),
+        generate_response=llm,
+        name="file",
     )
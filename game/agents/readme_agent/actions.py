@@ -1,13 +1,15 @@
+from itertools import islice
 from typing import List
-import os
 
 from game.actions.core.decorators import register_tool
+from game.config.config import CONFIG
+from game.workspace.walker import walk
 
 
 @register_tool(tags=["readme"])
 def list_project_files(dir_path: str) -> List[str]:
-    """Lists all Python files in the project directory."""
-    return sorted(
-        file for file in os.listdir(dir_path)
-        if file.endswith(".py")
-    )
+    """Lists all Python files in the project directory, including subpackages."""
+    return [
+        entry.path
+        for entry in islice(walk(dir_path, "*.py"), CONFIG.files.walk_max_results)
+    ]
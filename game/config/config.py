@@ -19,11 +19,13 @@ Free tier models to use (sorted by best to worst for tool calling):
 class PortkeyConfig:
     api_key: str = os.getenv("PORTKEY_API_KEY", "")
     virtual_key: str = os.getenv("PORTKEY_VIRTUAL_KEY", "")
+    base_url: Optional[str] = os.getenv("PORTKEY_BASE_URL") or None   # e.g. a local stub server
 
 
 @dataclass(frozen=True)
 class GroqConfig:
     api_key: str = os.getenv("GROQ_API_KEY", "")
+    base_url: Optional[str] = os.getenv("GROQ_BASE_URL") or None      # e.g. a local stub server
 
 
 # ------------------------
@@ -43,6 +45,58 @@ class LLMConfig:
     temperature: float = 0.0
     max_tokens: int = 1024
 
+    # Resilience (ResilientLLMClient)
+    timeout_seconds: float = 60.0          # deadline per call, across retries
+    max_retries: int = 3
+    retry_base_delay: float = 0.5
+    retry_max_delay: float = 8.0
+    hedge_after_seconds: Optional[float] = None  # None → no hedged requests
+    hedge_model: Optional[str] = None            # alternate model for hedging
+
+    # Streaming responses
+    stream: bool = False
+    stream_spool_chars: int = 64 * 1024   # larger string args spill to a temp file
+    stream_early_dispatch: bool = True    # agents start complete, valid calls mid-stream
+
+
+# ------------------------
+# Model router config
+# ------------------------
+
+@dataclass(frozen=True)
+class RouterConfig:
+    window_size: int = 50                 # rolling latency / error samples per model
+    min_samples: int = 4                  # before error rate is trusted
+    max_error_rate: float = 0.5           # above → model cools down
+    error_cooldown_seconds: float = 30.0
+    throttle_cooldown_seconds: float = 10.0  # when a 429 has no retry-after
+    latency_slack: float = 1.5            # prefer quality unless p50 is >1.5x the fastest
+
+
+# ------------------------
+# HTTP connection pool config (shared SDK clients)
+# ------------------------
+
+@dataclass(frozen=True)
+class HttpConfig:
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 30.0   # seconds an idle connection is kept open
+    http2: bool = True               # used when the `h2` package is installed
+
+
+# ------------------------
+# LLM response cache config
+# ------------------------
+
+@dataclass(frozen=True)
+class CacheConfig:
+    enabled: bool = False
+    directory: str = ".cache/llm"
+    ttl_seconds: float = 7 * 24 * 3600
+    max_memory_entries: int = 1024
+    max_disk_bytes: int = 256 * 1024 * 1024
+
 
 # ------------------------
 # Agent-level config
@@ -53,6 +107,151 @@ class AgentConfig:
     max_iterations: int = 10
     verbose: bool = True
 
+    # Accept every tool call in one LLM response and run them concurrently
+    parallel_tool_calls: bool = False
+
+
+# ------------------------
+# Memory config
+# ------------------------
+
+@dataclass(frozen=True)
+class MemoryConfig:
+    strategy: str = "unbounded"        # "unbounded" | "token_budget"
+
+    # token_budget strategy
+    keep_recent: int = 6               # newest messages always kept verbatim
+    stub_chars: int = 200              # preview kept from compacted tool results
+    reserve_tokens: int = 1500         # system message + tool schemas
+    default_context_tokens: int = 8192 # when the model is not in MODEL_REGISTRY
+    min_budget_tokens: int = 1024
+
+    # Persistent sessions (PersistentMemory)
+    session_dir: str = ".sessions"
+    session_fsync: bool = False        # True → survive power loss, not just crashes
+
+
+# ------------------------
+# Batch runner config
+# ------------------------
+
+@dataclass(frozen=True)
+class RunnerConfig:
+    mode: str = "async"          # "async" | "process"
+    workers: int = 8             # concurrent jobs (asyncio tasks or processes)
+    max_llm_concurrency: int = 4 # global cap on in-flight LLM calls
+
+
+# ------------------------
+# File tools config
+# ------------------------
+
+@dataclass(frozen=True)
+class FileToolsConfig:
+    read_max_bytes: int = 64 * 1024   # largest chunk a single read_file call returns
+    search_max_matches: int = 50      # matches per search_in_file page
+    search_max_context: int = 10      # cap on context_lines
+    max_line_chars: int = 500         # longer matched/context lines are cut
+
+    # Directory walking (walk_files, workspace index)
+    walk_max_results: int = 200       # entries per walk_files page
+    walk_max_depth: int = 32
+    respect_gitignore: bool = True
+    ignore_dirs: tuple = (            # never descended into
+        ".git", "__pycache__", "node_modules", ".venv", "venv",
+        ".cache", ".sessions", ".tox", ".mypy_cache", ".pytest_cache",
+    )
+
+
+# ------------------------
+# Sandboxed tool execution config
+# ------------------------
+
+@dataclass(frozen=True)
+class SandboxConfig:
+    enabled: bool = False           # True → agents run tools in ProcessPoolEnvironment
+    workers: int = 4                # pre-forked worker processes (shared per process)
+    timeout_seconds: float = 30.0   # wall clock per tool call
+    cpu_seconds: int = 30           # CPU time per tool call (RLIMIT_CPU)
+    memory_bytes: Optional[int] = 1024 * 1024 * 1024  # address space per worker (RLIMIT_AS)
+    start_method: str = "forkserver"
+
+
+# ------------------------
+# Tool memoization config
+# ------------------------
+
+@dataclass(frozen=True)
+class ToolCacheConfig:
+    enabled: bool = True
+    max_entries: int = 256    # LRU size, shared by every agent in the process
+
+
+# ------------------------
+# Speculative tool prefetch config
+# ------------------------
+
+@dataclass(frozen=True)
+class PrefetchConfig:
+    enabled: bool = False
+    tags: tuple = ("read", "search")   # only cacheable tools with one of these tags run speculatively
+    max_calls_per_step: int = 4        # predicted calls started after each real call
+    max_workers: int = 4
+    ttl_seconds: float = 30.0          # unused prefetched results are dropped after this
+    max_entries: int = 64
+
+
+# ------------------------
+# Tool result governor config
+# ------------------------
+
+@dataclass(frozen=True)
+class ResultsConfig:
+    enabled: bool = True
+    max_inline_chars: int = 8000   # serialized result size kept in memory (per tool override: max_result_chars)
+    preview_chars: int = 1000      # preview kept next to a spilled value's handle
+    page_bytes: int = 8000         # default read_blob chunk
+    blob_dir: str = ".cache/blobs"
+    blob_max_bytes: int = 256 * 1024 * 1024  # least recently stored blobs are evicted past this
+
+
+# ------------------------
+# Workspace search config
+# ------------------------
+
+@dataclass(frozen=True)
+class SearchConfig:
+    index_dir: str = ".cache/index"
+    max_file_bytes: int = 1024 * 1024   # larger files are not indexed
+    max_results: int = 50
+    max_hits_per_file: int = 200
+    refresh_interval_seconds: float = 2.0  # re-stat the tree at most this often
+
+
+# ------------------------
+# Tracing / logging config
+# ------------------------
+
+@dataclass(frozen=True)
+class TracingConfig:
+    enabled: bool = False
+    export_path: Optional[str] = None     # OTLP-JSON lines file; None → in-process aggregation only
+    export_batch_size: int = 64
+    service_name: str = "game-agent"
+    aggregate_window: int = 1000          # recent durations kept per span name (percentiles)
+    log_level: str = "INFO"
+    log_max_chars: int = 2000             # longer logged payloads are truncated
+
+
+# ------------------------
+# Token usage / cost accounting config
+# ------------------------
+
+@dataclass(frozen=True)
+class UsageConfig:
+    enabled: bool = True
+    max_records: int = 10000   # per-call records kept for reports (totals are unbounded)
+
 
 # ------------------------
 # Root config
@@ -61,7 +260,20 @@ class AgentConfig:
 @dataclass(frozen=True)
 class Config:
     llm: LLMConfig = LLMConfig()
+    cache: CacheConfig = CacheConfig()
+    http: HttpConfig = HttpConfig()
+    router: RouterConfig = RouterConfig()
     agent: AgentConfig = AgentConfig()
+    memory: MemoryConfig = MemoryConfig()
+    runner: RunnerConfig = RunnerConfig()
+    files: FileToolsConfig = FileToolsConfig()
+    search: SearchConfig = SearchConfig()
+    results: ResultsConfig = ResultsConfig()
+    tool_cache: ToolCacheConfig = ToolCacheConfig()
+    prefetch: PrefetchConfig = PrefetchConfig()
+    sandbox: SandboxConfig = SandboxConfig()
+    tracing: TracingConfig = TracingConfig()
+    usage: UsageConfig = UsageConfig()
 
     # Providers
     portkey: PortkeyConfig = PortkeyConfig()
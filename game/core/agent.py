@@ -1,13 +1,30 @@
+import asyncio
+import inspect
 import json
+import logging
 from typing import List, Callable
 
 from game.goals.goal import Goal
+from game.actions.core.prefetch import SpeculativeExecutor
 from game.actions.registry import ActionRegistry
+from game.core.early_dispatch import EarlyDispatch
 from game.language.agent_language import AgentLanguage
 from game.environment.environment import Environment
 from game.memory.memory import Memory
+from game.memory.memory_factory import MemoryFactory
+from game.memory.result_governor import ResultGovernor
+from game.language.decision import Decision, ToolCall
 from game.language.prompt import Prompt
-from game.llm.llm_factory import LLMFactory
+from game.language.prompt_builder import PromptBuilder
+from game.config.config import CONFIG
+from game.llm.resilient_client import LLMCallError
+from game.llm.streaming import StreamedText
+from game.llm.usage import USAGE_LEDGER, PromptComposition, UsageRecord, capture_usage
+from game.memory.tokens import estimate_tokens
+from game.tracing.log import Preview
+from game.tracing.tracer import get_tracer
+
+logger = logging.getLogger(__name__)
 
 
 class Agent:
@@ -16,18 +33,37 @@ class Agent:
                  agent_language: AgentLanguage,
                  action_registry: ActionRegistry,
                  generate_response: Callable[[Prompt], str],
-                 environment: Environment):
+                 environment: Environment,
+                 name: str | None = None):
         """
-        Initialize an agent with its core GAME components
+        Initialize an agent with its core GAME components.
+        `name` labels the agent in usage reports (see UsageLedger).
         """
+        self.name = name
         self.goals = goals
         self.generate_response = generate_response
         self.agent_language = agent_language
         self.actions = action_registry
         self.environment = environment
+        self.prompt_builder = None  # created on first prompt
+        self.result_governor = ResultGovernor() if CONFIG.results.enabled else None
+        self.tracer = get_tracer()
+        self.usage_ledger = USAGE_LEDGER if CONFIG.usage.enabled else None
+        self.prompt_composition = PromptComposition()
+        self._system_tokens = (None, None, 0)  # (system, tools, estimate)
+        self.prefetcher = SpeculativeExecutor(action_registry, environment) if CONFIG.prefetch.enabled else None
+        self.dispatch_early = CONFIG.llm.stream and CONFIG.llm.stream_early_dispatch
 
     def construct_prompt(self, goals: List[Goal], memory: Memory, actions: ActionRegistry) -> Prompt:
         """Build prompt with memory context."""
+        # Agent's own goals/tools → cached, incremental builder
+        if goals is self.goals and actions is self.actions:
+            if self.prompt_builder is None:
+                self.prompt_builder = PromptBuilder(
+                    self.agent_language, goals, actions, self.environment
+                )
+            return self.prompt_builder.build(memory)
+
         return self.agent_language.construct_prompt(
             actions=actions.get_openai_schema(),
             environment=self.environment,
@@ -41,69 +77,502 @@ class Agent:
         tool = self.actions.get_tool(invocation["tool"])
         return tool, invocation
 
+    def decide(self, response) -> Decision:
+        """Parse response once → Decision (tool call(s), args, terminal flag, serialized form)."""
+        return Decision.from_response(response, self.agent_language, self.actions)
+
+    def split_parallel_calls(self, decision: Decision, step: int):
+        """
+        Split the calls of a multi-call decision into independent calls,
+        which run concurrently, and terminal calls, which run after them.
+        Terminal calls are dropped on the first step.
+        """
+        independent = [call for call in decision.calls if not call.terminal]
+        terminal = [call for call in decision.calls if call.terminal]
+
+        if step == 0:
+            terminal = []
+
+        return independent, terminal
+
+    def tool_args(self, call: ToolCall) -> dict:
+        """
+        Arguments to pass to the tool. Streamed string arguments stay
+        spooled only for tools that declared them in `stream_args`.
+        """
+        args = call.args
+        if not any(isinstance(value, StreamedText) for value in args.values()):
+            return args
+
+        return {
+            name: value.getvalue()
+            if isinstance(value, StreamedText) and name not in call.tool["stream_args"]
+            else value
+            for name, value in args.items()
+        }
+
+    def execute_call(self, call: ToolCall, early: EarlyDispatch | None = None) -> dict:
+        """
+        Run one call; args that failed validation are reported without
+        dispatching. A call `early` started while streaming is only awaited.
+        """
+        started = early.take(call) if early is not None else None
+        if started is not None:
+            return started.result()
+
+        with self.tracer.span("tool.execute", tool=call.name) as span:
+            if call.error is not None:
+                result = call.error.result()
+            else:
+                result = self.environment.execute_action(call.function, self.tool_args(call))
+            span.set(ok=result.get("tool_executed"))
+            return result
+
+    async def aexecute_call(self, call: ToolCall, early: EarlyDispatch | None = None) -> dict:
+        started = early.take(call) if early is not None else None
+        if started is not None:
+            return await asyncio.wrap_future(started)
+
+        with self.tracer.span("tool.execute", tool=call.name) as span:
+            if call.error is not None:
+                result = call.error.result()
+            else:
+                result = await self.environment.aexecute_action(call.function, self.tool_args(call))
+            span.set(ok=result.get("tool_executed"))
+            return result
+
+    def execute_calls(self, calls: list, early: EarlyDispatch | None = None) -> list:
+        """Run independent calls concurrently; results keep the order of `calls`."""
+        started = [early.take(call) if early is not None else None for call in calls]
+        with self.tracer.span("tool.execute", tool=",".join(call.name for call in calls), calls=len(calls)):
+            pending = [call for call, future in zip(calls, started) if future is None and call.error is None]
+            results = iter(self.environment.execute_actions(
+                [(call.function, self.tool_args(call)) for call in pending]
+            ))
+            return [
+                call.error.result() if call.error is not None
+                else future.result() if future is not None
+                else next(results)
+                for call, future in zip(calls, started)
+            ]
+
+    async def aexecute_calls(self, calls: list, early: EarlyDispatch | None = None) -> list:
+        started = [early.take(call) if early is not None else None for call in calls]
+        with self.tracer.span("tool.execute", tool=",".join(call.name for call in calls), calls=len(calls)):
+            pending = [call for call, future in zip(calls, started) if future is None and call.error is None]
+            results = iter(await self.environment.aexecute_actions(
+                [(call.function, self.tool_args(call)) for call in pending]
+            ))
+            return [
+                call.error.result() if call.error is not None
+                else await asyncio.wrap_future(future) if future is not None
+                else next(results)
+                for call, future in zip(calls, started)
+            ]
+
+    def prefetch(self, calls: list, results: list):
+        """Start the read-only calls likely to come next, while the LLM decides (opt-in)."""
+        if self.prefetcher is None:
+            return
+        for call, result in zip(calls, results):
+            self.prefetcher.observe(call, result)
+
     def should_terminate(self, response: str) -> bool:
         action_def, _ = self.get_action(response)
         return action_def["terminal"]
 
+    def create_memory(self, session_id: str | None = None) -> Memory:
+        """
+        Create a memory sized for this agent's model (see CONFIG.memory).
+        With a session_id the memory is persisted and can be resumed.
+        """
+        return MemoryFactory.create(
+            getattr(self.generate_response, "model", None),
+            session_id=session_id,
+        )
+
+    def is_terminal_decision(self, response) -> bool:
+        """True when a stored decision called a terminal tool (unparseable → False)."""
+        try:
+            return self.decide(response).terminal
+        except (ValueError, KeyError, TypeError):
+            return False
+
+    def resume_step(self, memory: Memory, task: str, max_iterations: int):
+        """
+        Return the step to continue from when `memory` already holds a run
+        of `task` (e.g. a reopened PersistentMemory), or None for a fresh run.
+        """
+        items = memory.items
+        if not len(items) or items[0].get("content") != task:
+            return None
+
+        # Scan back to the last decision only; older records stay on disk
+        last_decision = next(
+            (items[i] for i in range(len(items) - 1, 0, -1)
+             if items[i].get("role") == "assistant"),
+            None,
+        )
+
+        # The previous run already finished
+        if last_decision and self.is_terminal_decision(last_decision["content"]):
+            return max_iterations
+
+        # Counted by the loop: items can't tell (blocked steps, compaction)
+        return memory.steps
+
     def set_current_task(self, memory: Memory, task: str):
         memory.add_memory({"role": "user", "content": task})
 
-    def update_memory(self, memory: Memory, response: str, result: dict):
-        """Update memory with the agent's decision and the environment's response."""
+    def govern_result(self, call: ToolCall, result: dict) -> str:
+        """Serialize a tool result for memory, spilling oversized values to the blob store."""
+        if self.result_governor is None:
+            return json.dumps(result)
+        return self.result_governor.govern(result, call.tool.get("max_result_chars"))
+
+    def update_memory(self, memory: Memory, decision: Decision, result):
+        """
+        Update memory with the agent's decision and the environment's response.
+        `result` may already be serialized (see govern_result).
+        """
+        # Reuse the decision's serialized form (raw responses are still accepted)
+        content = decision.serialized if isinstance(decision, Decision) else decision
+
         new_memories = [
-            {"role": "assistant", "content": response},
-            {"role": "user", "content": json.dumps(result)}
+            {"role": "assistant", "content": content},
+            {"role": "user", "content": result if isinstance(result, str) else json.dumps(result)}
         ]
-        for m in new_memories:
-            memory.add_memory(m)
+        memory.add_memories(new_memories)
+
+    def block_premature_termination(self, memory: Memory):
+        memory.add_memory({
+            "role": "system",
+            "content": "Termination is not allowed as the first action. Execute the required tool instead."
+        })
+
+    def finish_parallel_step(self, memory: Memory, decision: Decision, calls: list, results: list) -> bool:
+        """
+        Record every call of a parallel step in a single memory update.
+        Returns True when a terminal tool was executed.
+        """
+        if len(calls) != len(decision.calls):
+            # Store only the calls that ran, so a resumed run is not
+            # mistaken for a finished one
+            decision = decision.only(calls)
+
+        labelled = [
+            {"tool": call.name, **result}
+            for call, result in zip(calls, results)
+        ]
+        logger.info("Action Results: %s", Preview(labelled))
+
+        with self.tracer.span("memory.update") as span:
+            # Each result is capped on its own; the list is joined as JSON text
+            governed = [self.govern_result(call, item) for call, item in zip(calls, labelled)]
+            content = "[" + ", ".join(governed) + "]"
+            self.update_memory(memory, decision, content)
+            self.describe_memory(span, memory, content)
+
+        if any(call.terminal for call in calls):
+            logger.info("Agent requested termination.")
+            return True
+        return False
+
+    def record_result(self, memory: Memory, decision: Decision, call: ToolCall, result: dict):
+        """Govern a single call's result and store the step in memory."""
+        with self.tracer.span("memory.update") as span:
+            content = self.govern_result(call, result)
+            self.update_memory(memory, decision, content)
+            self.describe_memory(span, memory, content)
+
+    @staticmethod
+    def describe_memory(span, memory: Memory, content: str):
+        span.set(
+            result_chars=len(content),
+            memory_items=len(memory.items),
+            memory_tokens=getattr(memory, "total_tokens", None),
+        )
+
+    def build_prompt(self, memory: Memory) -> Prompt:
+        """construct_prompt for this agent's own goals and tools, traced."""
+        with self.tracer.span("agent.prompt") as span:
+            prompt = self.construct_prompt(self.goals, memory, self.actions)
+            span.set(
+                messages=len(prompt.messages),
+                tools=len(prompt.tools),
+                memory_tokens=getattr(memory, "total_tokens", None),
+            )
+            return prompt
+
+    def parse_decision(self, response) -> Decision:
+        """decide(), traced."""
+        with self.tracer.span("agent.parse") as span:
+            decision = self.decide(response)
+            span.set(calls=len(decision.calls), response_chars=len(decision.serialized))
+            return decision
+
+    def call_llm(self, prompt: Prompt, memory: Memory, step: int, early: EarlyDispatch | None = None):
+        """
+        prompt_llm_for_action, with the tokens it used filed in the usage
+        ledger. Calls that complete while the response streams go to `early`.
+        """
+        if early is not None:
+            with early.hooks():
+                return self.call_llm(prompt, memory, step)
+
+        if self.usage_ledger is None:
+            return self.prompt_llm_for_action(prompt)
+
+        with capture_usage() as meter:
+            try:
+                return self.prompt_llm_for_action(prompt)
+            finally:
+                self.account_usage(meter.calls, prompt, memory, step)
+
+    async def acall_llm(self, prompt: Prompt, memory: Memory, step: int, early: EarlyDispatch | None = None):
+        if early is not None:
+            with early.hooks():
+                return await self.acall_llm(prompt, memory, step)
+
+        if self.usage_ledger is None:
+            return await self.aprompt_llm_for_action(prompt)
+
+        with capture_usage() as meter:
+            try:
+                return await self.aprompt_llm_for_action(prompt)
+            finally:
+                self.account_usage(meter.calls, prompt, memory, step)
+
+    def early_dispatch(self, loop=None) -> EarlyDispatch | None:
+        """Per-step dispatcher of calls completed mid-stream (None unless streaming)."""
+        if not self.dispatch_early:
+            return None
+        if loop is None:
+            return EarlyDispatch.threaded(self)
+        return EarlyDispatch.on_loop(self, loop)
+
+    def end_step(self, memory: Memory, step: int, decision: Decision, early: EarlyDispatch | None):
+        """Count the step as done and release what it streamed."""
+        memory.end_step(step)
+        decision.close()
+        if early is not None:
+            early.close()
+
+    def account_usage(self, calls: list, prompt: Prompt, memory: Memory, step: int):
+        """
+        Record each provider request of a step. Prompt tokens are split
+        across the system prompt and the memory entries behind the prompt,
+        in proportion to their estimated size.
+        """
+        if not calls:
+            return  # cache hit or failed call
+
+        composition = {"system": self.estimate_system_tokens(prompt)}
+        for source, tokens in self.prompt_composition.update(memory).items():
+            composition[source] = composition.get(source, 0) + tokens
+        estimated = sum(composition.values()) or 1
+
+        session_id = getattr(memory, "session_id", None) or f"run-{id(memory):x}"
+        for usage in calls:
+            scale = usage.prompt_tokens / estimated
+            self.usage_ledger.record(UsageRecord(
+                session_id=session_id,
+                agent=self.name,
+                step=step,
+                model=usage.model,
+                prompt_tokens=usage.prompt_tokens,
+                completion_tokens=usage.completion_tokens,
+                cost_usd=usage.cost_usd,
+                sources={source: round(tokens * scale) for source, tokens in composition.items()},
+            ))
+
+    def estimate_system_tokens(self, prompt: Prompt) -> int:
+        """System message + tool schemas; cached while the prompt reuses them."""
+        system, tools, tokens = self._system_tokens
+        if prompt.system is not system or prompt.tools is not tools:
+            tokens = estimate_tokens(prompt.system) + estimate_tokens(json.dumps(prompt.tools))
+            self._system_tokens = (prompt.system, prompt.tools, tokens)
+        return tokens
+
+    @property
+    def model(self) -> str | None:
+        """Model the LLM client is configured with (providers record the one actually used)."""
+        return getattr(self.generate_response, "model", None)
 
     def prompt_llm_for_action(self, full_prompt: Prompt) -> str:
         """Call the LLM and return its raw response."""
-        response = self.generate_response(full_prompt)
-        return response
+        with self.tracer.span("llm.call", model=self.model):
+            response = self.generate_response(full_prompt)
+            return response
+
+    async def aprompt_llm_for_action(self, full_prompt: Prompt) -> str:
+        """
+        Call the LLM without blocking the event loop.
+        Prefers the client's native `acall`, then coroutine callables,
+        and finally offloads a blocking callable to a worker thread.
+        """
+        with self.tracer.span("llm.call", model=self.model):
+            acall = getattr(self.generate_response, "acall", None)
+            if acall is not None:
+                return await acall(full_prompt)
+
+            if inspect.iscoroutinefunction(self.generate_response):
+                return await self.generate_response(full_prompt)
+
+            return await asyncio.to_thread(self.generate_response, full_prompt)
 
     def run(self, user_input: str, memory=None, max_iterations: int = 50) -> Memory:
         """
         Execute the GAME loop for this agent with a maximum iteration limit.
+        Passing a memory that already holds a run of `user_input`
+        (e.g. a reopened PersistentMemory) resumes that run.
         """
-        memory = memory or Memory()
-        self.set_current_task(memory, user_input)
+        memory = memory or self.create_memory()
 
-        for step in range(max_iterations):
+        start_step = self.resume_step(memory, user_input, max_iterations)
+        if start_step is None:
+            self.set_current_task(memory, user_input)
+            start_step = 0
 
-            # 1. Build GAME prompt
-            prompt = self.construct_prompt(self.goals, memory, self.actions)
+        with self.tracer.span("agent.run", model=self.model, start_step=start_step):
+            for step in range(start_step, max_iterations):
+                with self.tracer.span("agent.step", step=step):
 
-            print("\nAgent thinking...")
-            response = self.prompt_llm_for_action(prompt)
-            print(f"Agent Decision: {response}")
-
-            # 2. Identify intended action
-            tool, invocation = self.get_action(response)
-
-            # Prevent premature termination
-            if tool["tool_name"] == "terminate" and step == 0:
-                memory.add_memory({
-                    "role": "system",
-                    "content": "Termination is not allowed as the first action. Execute the required tool instead."
-                })
-                continue
-
-            # 3. Execute the action
-            result = self.environment.execute_action(
-                tool["function"],
-                invocation["args"]
-            )
+                    # 1. Build GAME prompt
+                    prompt = self.build_prompt(memory)
+
+                    logger.info("\nAgent thinking...")
+                    early = self.early_dispatch()
+                    try:
+                        response = self.call_llm(prompt, memory, step, early)
+                    except LLMCallError as e:
+                        # Keep the memory so far; the run can be resumed later
+                        logger.warning("Agent stopped: %s", e)
+                        if early is not None:
+                            early.close()
+                        break
+                    logger.info("Agent Decision: %s", Preview(response))
 
-            print(f"Action Result: {result}")
+                    # 2. Parse once → Decision used by every later stage
+                    decision = self.parse_decision(response)
 
-            # 4. Update memory
-            self.update_memory(memory, response, result)
+                    # Parallel mode: several tool calls in one response
+                    if decision.parallel:
+                        independent, terminal = self.split_parallel_calls(decision, step)
+                        if not independent and not terminal:
+                            self.block_premature_termination(memory)
+                            self.end_step(memory, step, decision, early)
+                            continue
 
-            # 5. Terminate?
-            if self.should_terminate(response):
-                print("Agent requested termination.")
-                break
+                        results = self.execute_calls(independent, early)
+                        results += [self.execute_call(call) for call in terminal]
+                        self.prefetch(independent, results)
+
+                        finished = self.finish_parallel_step(memory, decision, independent + terminal, results)
+                        self.end_step(memory, step, decision, early)
+                        if finished:
+                            break
+                        continue
+
+                    call = decision.call
+
+                    # Prevent premature termination
+                    if call.terminal and step == 0:
+                        self.block_premature_termination(memory)
+                        self.end_step(memory, step, decision, early)
+                        continue
+
+                    # 3. Execute the action
+                    result = self.execute_call(call, early)
+                    self.prefetch([call], [result])
+
+                    logger.info("Action Result: %s", Preview(result))
+
+                    # 4. Update memory
+                    self.record_result(memory, decision, call, result)
+                    self.end_step(memory, step, decision, early)
+
+                    # 5. Terminate?
+                    if decision.terminal:
+                        logger.info("Agent requested termination.")
+                        break
 
         return memory
 
+    async def arun(self, user_input: str, memory=None, max_iterations: int = 50) -> Memory:
+        """
+        Async GAME loop. Same semantics as run(), but the LLM call and
+        tool execution are awaited so many sessions can share one event loop.
+        """
+        memory = memory or self.create_memory()
+
+        start_step = self.resume_step(memory, user_input, max_iterations)
+        if start_step is None:
+            self.set_current_task(memory, user_input)
+            start_step = 0
+
+        with self.tracer.span("agent.run", model=self.model, start_step=start_step):
+            for step in range(start_step, max_iterations):
+                with self.tracer.span("agent.step", step=step):
+
+                    # 1. Build GAME prompt
+                    prompt = self.build_prompt(memory)
+
+                    logger.info("\nAgent thinking...")
+                    early = self.early_dispatch(asyncio.get_running_loop())
+                    try:
+                        response = await self.acall_llm(prompt, memory, step, early)
+                    except LLMCallError as e:
+                        # Keep the memory so far; the run can be resumed later
+                        logger.warning("Agent stopped: %s", e)
+                        if early is not None:
+                            early.close()
+                        break
+                    logger.info("Agent Decision: %s", Preview(response))
+
+                    # 2. Parse once → Decision used by every later stage
+                    decision = self.parse_decision(response)
+
+                    # Parallel mode: several tool calls in one response
+                    if decision.parallel:
+                        independent, terminal = self.split_parallel_calls(decision, step)
+                        if not independent and not terminal:
+                            self.block_premature_termination(memory)
+                            self.end_step(memory, step, decision, early)
+                            continue
+
+                        results = await self.aexecute_calls(independent, early)
+                        for call in terminal:
+                            results.append(await self.aexecute_call(call))
+                        self.prefetch(independent, results)
+
+                        finished = self.finish_parallel_step(memory, decision, independent + terminal, results)
+                        self.end_step(memory, step, decision, early)
+                        if finished:
+                            break
+                        continue
+
+                    call = decision.call
+
+                    # Prevent premature termination
+                    if call.terminal and step == 0:
+                        self.block_premature_termination(memory)
+                        self.end_step(memory, step, decision, early)
+                        continue
+
+                    # 3. Execute the action
+                    result = await self.aexecute_call(call, early)
+                    self.prefetch([call], [result])
+
+                    logger.info("Action Result: %s", Preview(result))
+
+                    # 4. Update memory
+                    self.record_result(memory, decision, call, result)
+                    self.end_step(memory, step, decision, early)
+
+                    # 5. Terminate?
+                    if decision.terminal:
+                        logger.info("Agent requested termination.")
+                        break
+
+        return memory
@@ -0,0 +1,89 @@
+"""
+Early dispatch of streamed tool calls.
+
+With a streaming client, a tool call is complete as soon as its closing
+brace arrives, while later calls of a parallel response (and the end of
+the stream) are still on the wire. The agent starts each such call right
+away and takes its result once the response is parsed, instead of
+running the call again.
+"""
+import asyncio
+import contextvars
+import logging
+import threading
+
+from game.language.decision import ToolCall
+from game.llm.streaming import call_key, stream_hooks
+
+logger = logging.getLogger(__name__)
+
+
+class EarlyDispatch:
+    """
+    Starts the calls of one streamed response as they complete.
+
+    Only calls that pass the tool's validator and are not terminal are
+    started, each at most once (a call streamed again after a retry or
+    fallback is matched by content). `start(call)` returns a concurrent
+    Future of the call's result; take(call) hands it to the agent.
+    """
+
+    def __init__(self, actions, start):
+        self.actions = actions
+        self.start = start
+        self._started = {}  # call key -> Future
+        self._lock = threading.Lock()
+
+    @classmethod
+    def threaded(cls, agent) -> "EarlyDispatch":
+        """Calls run on the environment's pool, traced as by agent.execute_call."""
+        def start(call):
+            return agent.environment.submit(contextvars.copy_context().run, agent.execute_call, call)
+        return cls(agent.actions, start)
+
+    @classmethod
+    def on_loop(cls, agent, loop) -> "EarlyDispatch":
+        """Calls run as tasks on `loop`; the stream may be read on another thread."""
+        def start(call):
+            return asyncio.run_coroutine_threadsafe(agent.aexecute_call(call), loop)
+        return cls(agent.actions, start)
+
+    def hooks(self):
+        """Context manager routing the stream's finished calls here."""
+        return stream_hooks(on_tool_call=self.on_tool_call, validate=self.validate)
+
+    def validate(self, name: str, args: dict) -> dict:
+        try:
+            tool = self.actions.get_tool(name)
+        except KeyError:
+            raise ValueError(f"Unknown tool: {name}")
+        validator = tool.get("validator")
+        return args if validator is None else validator(args)
+
+    def on_tool_call(self, invocation: dict):
+        tool = self.actions.get_tool(invocation["tool"])
+        if tool["terminal"]:
+            return  # may be dropped (first step) and ends the run; wait for the response
+
+        key = call_key(invocation["tool"], invocation["args"])
+        with self._lock:
+            if key in self._started:
+                return
+            self._started[key] = self.start(ToolCall(tool, invocation["args"]))
+        logger.debug("Started %s before the response ended", invocation["tool"])
+
+    def take(self, call: ToolCall):
+        """The started execution of `call`, or None if it has to run now."""
+        if call.error is not None or not self._started:
+            return None
+        with self._lock:
+            return self._started.pop(call_key(call.name, call.args), None)
+
+    def close(self):
+        """Forget calls the final response did not contain (they already ran)."""
+        with self._lock:
+            if self._started:
+                logger.warning(
+                    "%d early-dispatched call(s) were not in the final response", len(self._started)
+                )
+            self._started.clear()
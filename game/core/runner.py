@@ -0,0 +1,220 @@
+import asyncio
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from multiprocessing import Manager
+from typing import AsyncIterable, AsyncIterator, Iterable, List, Optional, Union
+
+from game.agents.agent_factory import AgentFactory
+from game.config.config import CONFIG
+from game.llm.limited_client import ConcurrencyLimitedClient
+from game.llm.llm_factory import LLMFactory
+from game.memory.memory import Memory
+
+
+@dataclass(frozen=True)
+class Job:
+    agent_type: str
+    task: str
+    job_id: Optional[str] = None
+
+
+@dataclass
+class JobResult:
+    job: Job
+    memory: Optional[Memory]
+    error: Optional[str] = None
+    elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class AgentRunner:
+    """
+    Runs a stream of (agent_type, task) jobs across a pool of workers.
+
+    - mode="async":   workers are asyncio tasks sharing one event loop
+    - mode="process": workers are processes, each running the sync loop
+
+    In both modes a single limit caps in-flight LLM calls globally,
+    and results are yielded as each job finishes (not in input order).
+    `llm` is shared by the async workers; process workers each build
+    their own client, so it is rejected in process mode.
+    """
+
+    def __init__(
+        self,
+        mode: str | None = None,
+        workers: int | None = None,
+        max_llm_concurrency: int | None = None,
+        max_iterations: int | None = None,
+        llm=None,
+    ):
+        self.mode = (mode or CONFIG.runner.mode).lower()
+        self.workers = workers or CONFIG.runner.workers
+        self.max_llm_concurrency = max_llm_concurrency or CONFIG.runner.max_llm_concurrency
+        self.max_iterations = max_iterations or CONFIG.agent.max_iterations
+        self.llm = llm
+
+        if self.mode not in ("async", "process"):
+            raise ValueError(f"Unsupported runner mode: {self.mode}")
+        if self.mode == "process" and llm is not None:
+            raise ValueError("A custom llm client cannot be shared with process workers; use mode='async'")
+
+    async def run(self, jobs: Union[Iterable, AsyncIterable]) -> AsyncIterator[JobResult]:
+        """
+        Consume `jobs` lazily and yield a JobResult per job as it completes.
+        Jobs may be Job instances or (agent_type, task) tuples.
+        """
+        if self.mode == "async":
+            runner = self._run_async(jobs)
+        else:
+            runner = self._run_processes(jobs)
+
+        async for result in runner:
+            yield result
+
+    def run_all(self, jobs: Union[Iterable, AsyncIterable]) -> List[JobResult]:
+        """Blocking helper: run every job and return results in completion order."""
+        async def collect():
+            return [result async for result in self.run(jobs)]
+
+        return asyncio.run(collect())
+
+    # ------------------------------------------------------------------
+    # ASYNC MODE
+    # ------------------------------------------------------------------
+    async def _run_async(self, jobs) -> AsyncIterator[JobResult]:
+        llm = ConcurrencyLimitedClient(
+            self.llm or LLMFactory.create(),
+            self.max_llm_concurrency,
+        )
+
+        # Bounded queue → the job stream is only read as fast as workers drain it
+        pending: asyncio.Queue = asyncio.Queue(maxsize=self.workers * 2)
+        results: asyncio.Queue = asyncio.Queue()
+        done = object()
+
+        async def produce():
+            try:
+                async for job in _iterate(jobs):
+                    await pending.put(job)
+            finally:
+                # Also when the job stream fails: workers must still stop
+                for _ in range(self.workers):
+                    await pending.put(done)
+
+        async def work():
+            while True:
+                job = await pending.get()
+                if job is done:
+                    await results.put(done)
+                    return
+                await results.put(await self._run_job_async(job, llm))
+
+        tasks = [asyncio.create_task(produce())]
+        tasks += [asyncio.create_task(work()) for _ in range(self.workers)]
+
+        try:
+            finished = 0
+            while finished < self.workers:
+                result = await results.get()
+                if result is done:
+                    finished += 1
+                    continue
+                yield result
+
+            await tasks[0]  # surface errors raised while reading the job stream
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _run_job_async(self, job: Job, llm) -> JobResult:
+        start = time.perf_counter()
+        memory = None
+        try:
+            agent = AgentFactory.create(job.agent_type, llm=llm)
+            memory = agent.create_memory()
+            await agent.arun(job.task, memory, max_iterations=self.max_iterations)
+            return JobResult(job, memory, elapsed=time.perf_counter() - start)
+        except Exception as e:
+            return JobResult(job, memory, error=repr(e), elapsed=time.perf_counter() - start)
+
+    # ------------------------------------------------------------------
+    # PROCESS MODE
+    # ------------------------------------------------------------------
+    async def _run_processes(self, jobs) -> AsyncIterator[JobResult]:
+        loop = asyncio.get_running_loop()
+
+        with Manager() as manager:
+            # Shared across processes → one global cap on in-flight LLM calls
+            semaphore = manager.BoundedSemaphore(self.max_llm_concurrency)
+
+            with ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_init_worker,
+                initargs=(semaphore, self.max_llm_concurrency),
+            ) as pool:
+                in_flight = set()
+
+                async for job in _iterate(jobs):
+                    in_flight.add(loop.run_in_executor(
+                        pool, _run_job_in_process, job, self.max_iterations
+                    ))
+
+                    # Keep the job stream lazy: at most 2x workers submitted
+                    if len(in_flight) >= self.workers * 2:
+                        finished, in_flight = await asyncio.wait(
+                            in_flight, return_when=asyncio.FIRST_COMPLETED
+                        )
+                        for future in finished:
+                            yield future.result()
+
+                for future in asyncio.as_completed(in_flight):
+                    yield await future
+
+
+# ----------------------------------------------------------------------
+# Helpers
+# ----------------------------------------------------------------------
+
+def _to_job(item) -> Job:
+    if isinstance(item, Job):
+        return item
+    return Job(*item)
+
+
+async def _iterate(jobs) -> AsyncIterator[Job]:
+    if hasattr(jobs, "__aiter__"):
+        async for item in jobs:
+            yield _to_job(item)
+    else:
+        for item in jobs:
+            yield _to_job(item)
+
+
+# Per-process LLM client, built once by the pool initializer
+_WORKER_LLM = None
+
+
+def _init_worker(semaphore, max_llm_concurrency: int):
+    global _WORKER_LLM
+    _WORKER_LLM = ConcurrencyLimitedClient(
+        LLMFactory.create(),
+        max_llm_concurrency,
+        semaphore=semaphore,
+    )
+
+
+def _run_job_in_process(job: Job, max_iterations: int) -> JobResult:
+    start = time.perf_counter()
+    memory = None
+    try:
+        agent = AgentFactory.create(job.agent_type, llm=_WORKER_LLM)
+        memory = agent.create_memory()
+        agent.run(job.task, memory, max_iterations=max_iterations)
+        return JobResult(job, memory, elapsed=time.perf_counter() - start)
+    except Exception as e:
+        return JobResult(job, memory, error=repr(e), elapsed=time.perf_counter() - start)
@@ -1,19 +1,90 @@
+import asyncio
+import functools
+import inspect
 import traceback
+from concurrent.futures import ThreadPoolExecutor
 
 class Environment:
+    def __init__(self, executor=None, max_parallel_actions: int = 8):
+        # Executor used by aexecute_action for sync tools
+        # (None → the event loop's default thread pool)
+        self.executor = executor
+
+        # Thread pool for execute_actions, created on first parallel step
+        self.max_parallel_actions = max_parallel_actions
+        self._parallel_pool = None
+
     def execute_action(self, func, args):
         """
         Execute a tool function safely.
         """
         try:
             result = func(**args)
-            return {
-                "tool_executed": True,
-                "result": result,
-            }
+            return self._success(result)
         except Exception as e:
-            return {
-                "tool_executed": False,
-                "error": str(e),
-                "traceback": traceback.format_exc(),
-            }
+            return self._failure(e)
+
+    async def aexecute_action(self, func, args):
+        """
+        Execute a tool function without blocking the event loop.
+        Coroutine tools are awaited; sync tools run in the executor.
+        """
+        try:
+            if inspect.iscoroutinefunction(func):
+                result = await func(**args)
+            else:
+                loop = asyncio.get_running_loop()
+                result = await loop.run_in_executor(
+                    self.executor, functools.partial(func, **args)
+                )
+            return self._success(result)
+        except Exception as e:
+            return self._failure(e)
+
+    def execute_actions(self, calls):
+        """
+        Execute independent tool calls concurrently.
+        `calls` is a list of (func, args); results keep the same order.
+        """
+        if len(calls) <= 1:
+            return [self.execute_action(func, args) for func, args in calls]
+
+        futures = [self.submit(self.execute_action, func, args) for func, args in calls]
+        return [future.result() for future in futures]
+
+    def run_tool(self, func, args: dict):
+        """
+        Run an undecorated tool function where this environment runs tools
+        (the `run` of a memoized tool's call_with, see cached_tool).
+        """
+        return func(**args)
+
+    def submit(self, fn, *args):
+        """Run fn(*args) on the parallel pool; returns a concurrent Future."""
+        if self._parallel_pool is None:
+            self._parallel_pool = ThreadPoolExecutor(
+                max_workers=self.max_parallel_actions,
+                thread_name_prefix="game-tool",
+            )
+        return self._parallel_pool.submit(fn, *args)
+
+    async def aexecute_actions(self, calls):
+        """Async variant of execute_actions."""
+        return list(await asyncio.gather(
+            *(self.aexecute_action(func, args) for func, args in calls)
+        ))
+
+    @staticmethod
+    def _success(result):
+        return {
+            "tool_executed": True,
+            "result": result,
+        }
+
+    @staticmethod
+    def _failure(e: Exception):
+        return {
+            "tool_executed": False,
+            "error": str(e),
+            "traceback": traceback.format_exc(),
+        }
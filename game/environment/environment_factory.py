@@ -0,0 +1,13 @@
+from game.config.config import CONFIG
+from game.environment.environment import Environment
+
+
+class EnvironmentFactory:
+
+    @staticmethod
+    def create() -> Environment:
+        """Inline Environment, or the sandboxed process pool (see CONFIG.sandbox)."""
+        if CONFIG.sandbox.enabled:
+            from game.environment.process_environment import ProcessPoolEnvironment
+            return ProcessPoolEnvironment()
+        return Environment()
@@ -0,0 +1,59 @@
+import asyncio
+import inspect
+
+from game.config.config import CONFIG
+from game.environment.environment import Environment
+from game.environment.worker_pool import ToolSandboxError, ToolWorkerPool
+from game.llm.streaming import materialize
+
+
+class ProcessPoolEnvironment(Environment):
+    """
+    Environment that runs tools in a warm pool of worker processes.
+
+    A slow, CPU-heavy or crashing tool cannot block or take down the
+    agent: each call has a wall-clock timeout and rlimit CPU / memory
+    caps, and a dead worker is replaced. Coroutine tools still run in
+    the agent's process. Tool memoization (cacheable / invalidates_cache)
+    stays in this process, so every worker shares one cache; speculative
+    prefetch runs its calls in the workers too (see run_tool).
+    """
+
+    def __init__(
+        self,
+        pool: ToolWorkerPool | None = None,
+        timeout: float | None = None,
+        cpu_seconds: int | None = None,
+        max_parallel_actions: int | None = None,
+    ):
+        self.pool = pool or ToolWorkerPool.shared()
+        super().__init__(max_parallel_actions=max_parallel_actions or self.pool.size)
+        self.timeout = timeout or CONFIG.sandbox.timeout_seconds
+        self.cpu_seconds = cpu_seconds or CONFIG.sandbox.cpu_seconds
+
+    def execute_action(self, func, args):
+        try:
+            call_with = getattr(func, "call_with", None)
+            if call_with is not None:
+                result = call_with(self.run_tool, args)
+            else:
+                result = self.run_tool(func, args)
+            return self._success(result)
+        except ToolSandboxError as e:
+            return {
+                "tool_executed": False,
+                "error": str(e),
+                "traceback": e.remote_traceback,
+            }
+        except Exception as e:
+            return self._failure(e)
+
+    async def aexecute_action(self, func, args):
+        if inspect.iscoroutinefunction(func):
+            return await super().aexecute_action(func, args)
+        # Waiting on a worker blocks, so do it off the event loop
+        return await asyncio.to_thread(self.execute_action, func, args)
+
+    def run_tool(self, func, args: dict):
+        # Streamed arguments live in local temp files: send plain strings
+        return self.pool.run(func, materialize(args), self.timeout, self.cpu_seconds)
@@ -0,0 +1,187 @@
+import atexit
+import multiprocessing
+import os
+import pickle
+import queue
+import signal
+import threading
+import traceback
+
+from game.config.config import CONFIG
+
+try:
+    import resource
+except ImportError:  # not available on Windows: limits are skipped
+    resource = None
+
+
+class ToolSandboxError(Exception):
+    """A tool failed, timed out or crashed inside a worker process."""
+
+    def __init__(self, message: str, remote_traceback: str = ""):
+        super().__init__(message)
+        self.remote_traceback = remote_traceback
+
+
+# ----------------------------------------------------------------------
+# Worker process side
+# ----------------------------------------------------------------------
+
+def _set_cpu_limit(cpu_seconds: int | None):
+    """RLIMIT_CPU counts the worker's whole life, so cap it at usage + budget."""
+    if resource is None or not cpu_seconds:
+        return
+    usage = resource.getrusage(resource.RUSAGE_SELF)
+    soft = int(usage.ru_utime + usage.ru_stime) + cpu_seconds
+    _, hard = resource.getrlimit(resource.RLIMIT_CPU)
+    if hard != resource.RLIM_INFINITY:
+        soft = min(soft, hard)
+    resource.setrlimit(resource.RLIMIT_CPU, (soft, hard))
+
+
+def _worker_main(conn, memory_bytes: int | None):
+    # Ctrl-C is handled by the parent, which then shuts the pool down
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+    if resource is not None and memory_bytes:
+        resource.setrlimit(resource.RLIMIT_AS, (memory_bytes, memory_bytes))
+
+    while True:
+        try:
+            payload = conn.recv_bytes()
+        except (EOFError, OSError):
+            return
+
+        try:
+            func, args, cwd, cpu_seconds = pickle.loads(payload)
+            if cwd != os.getcwd():
+                os.chdir(cwd)
+            _set_cpu_limit(cpu_seconds)
+            reply = ("ok", func(**args))
+        except BaseException as e:  # MemoryError included
+            reply = ("error", str(e) or repr(e), traceback.format_exc())
+
+        try:
+            data = pickle.dumps(reply, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception as e:
+            data = pickle.dumps(("error", f"Tool result is not serializable: {e}", ""))
+        conn.send_bytes(data)
+
+
+# ----------------------------------------------------------------------
+# Parent side
+# ----------------------------------------------------------------------
+
+class _Worker:
+    def __init__(self, context, memory_bytes):
+        self.conn, child_conn = context.Pipe()
+        self.process = context.Process(
+            target=_worker_main,
+            args=(child_conn, memory_bytes),
+            daemon=True,
+            name="game-tool-worker",
+        )
+        self.process.start()
+        child_conn.close()
+
+    def kill(self):
+        if self.process.is_alive():
+            self.process.kill()
+        self.process.join()
+        self.conn.close()
+
+
+_EXIT_REASONS = {
+    -getattr(signal, "SIGXCPU", 24): "CPU time limit exceeded",
+    -signal.SIGKILL: "killed (possibly out of memory)",
+    -signal.SIGSEGV: "segmentation fault",
+}
+
+
+class ToolWorkerPool:
+    """
+    Pre-started worker processes that run tool functions.
+
+    Calls are pickled (highest protocol) over a pipe to an idle worker.
+    A worker that overruns its wall-clock timeout is killed and replaced;
+    per call CPU time and per worker address space are capped with rlimits.
+    """
+
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    def __init__(
+        self,
+        workers: int | None = None,
+        memory_bytes: int | None = None,
+        start_method: str | None = None,
+    ):
+        settings = CONFIG.sandbox
+        self.size = workers or settings.workers
+        self.memory_bytes = memory_bytes if memory_bytes is not None else settings.memory_bytes
+
+        method = start_method or settings.start_method
+        if method not in multiprocessing.get_all_start_methods():
+            method = "spawn"
+        self._context = multiprocessing.get_context(method)
+
+        self._idle = queue.Queue()
+        self._closed = False
+        for _ in range(self.size):
+            self._idle.put(self._spawn())
+
+    @classmethod
+    def shared(cls) -> "ToolWorkerPool":
+        """One pool per process, reused by every ProcessPoolEnvironment."""
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+                atexit.register(cls._shared.close)
+            return cls._shared
+
+    def _spawn(self) -> _Worker:
+        return _Worker(self._context, self.memory_bytes)
+
+    def run(self, func, args: dict, timeout: float | None = None, cpu_seconds: int | None = None):
+        """Run func(**args) in a worker and return its result (raises ToolSandboxError)."""
+        if self._closed:
+            raise RuntimeError("Tool worker pool is closed")
+
+        payload = pickle.dumps((func, args, os.getcwd(), cpu_seconds), protocol=pickle.HIGHEST_PROTOCOL)
+
+        worker = self._idle.get()
+        healthy = False
+        try:
+            worker.conn.send_bytes(payload)
+
+            if not worker.conn.poll(timeout):
+                raise ToolSandboxError(f"Tool timed out after {timeout}s")
+
+            try:
+                status, *rest = pickle.loads(worker.conn.recv_bytes())
+            except (EOFError, OSError):
+                worker.process.join(1)
+                code = worker.process.exitcode
+                reason = _EXIT_REASONS.get(code, f"exit code {code}")
+                raise ToolSandboxError(f"Tool process died: {reason}")
+
+            healthy = True
+            if status == "error":
+                raise ToolSandboxError(*rest)
+            return rest[0]
+        finally:
+            if not healthy:
+                # Timed out or crashed: replace the worker so the pool stays warm
+                worker.kill()
+                worker = self._spawn()
+            self._idle.put(worker)
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        while True:
+            try:
+                self._idle.get_nowait().kill()
+            except queue.Empty:
+                break
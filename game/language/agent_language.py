@@ -1,10 +1,28 @@
 import json
 from typing import List
 
+from game.config.config import CONFIG
 from game.language.prompt import Prompt
 from game.language.function_call_parser import FunctionCallParser
 
 
+SINGLE_TOOL_RULES = """IMPORTANT TOOL USE RULES:
+- You MUST return ONLY ONE tool call per message.
+- Never return an array of tool calls.
+- Never attempt multiple actions in the same step.
+- If you need to perform multiple actions, do them one by one, in separate messages.
+- After executing one action, wait for the environment’s response BEFORE deciding the next tool.
+- Use `terminate` ONLY when the task is fully complete."""
+
+PARALLEL_TOOL_RULES = """IMPORTANT TOOL USE RULES:
+- You MAY return several tool calls in one message when they are independent
+  (e.g. reading or searching several files at once).
+- Independent tool calls are executed concurrently; their results are returned together.
+- NEVER combine calls where one depends on the result of another; wait for the
+  environment’s response BEFORE deciding dependent tools.
+- Use `terminate` ONLY when the task is fully complete, and never alongside other tools."""
+
+
 class AgentLanguage:
     """
     Responsible for:
@@ -12,8 +30,12 @@ class AgentLanguage:
     - Parsing LLM responses to extract function calls
     """
 
-    def __init__(self):
-        pass
+    def __init__(self, parallel_tool_calls: bool | None = None):
+        self.parallel_tool_calls = (
+            CONFIG.agent.parallel_tool_calls
+            if parallel_tool_calls is None
+            else parallel_tool_calls
+        )
 
     # ------------------------------------------------------------------
     # PROMPT CONSTRUCTION LOGIC
@@ -33,6 +55,7 @@ class AgentLanguage:
 
     def build_system_message(self, goals, environment) -> str:
         goals_text = "\n".join(f"- {g.description}" for g in goals)
+        tool_rules = PARALLEL_TOOL_RULES if self.parallel_tool_calls else SINGLE_TOOL_RULES
 
         return f"""
 You are an autonomous agent. 
@@ -62,13 +85,7 @@ Rules:
 - ONLY use tools provided in the tool list.
 - If you want to give an explanation: DO NOT. Tool call JSON ONLY.
 
-IMPORTANT TOOL USE RULES:
-- You MUST return ONLY ONE tool call per message.
-- Never return an array of tool calls.
-- Never attempt multiple actions in the same step.
-- If you need to perform multiple actions, do them one by one, in separate messages.
-- After executing one action, wait for the environment’s response BEFORE deciding the next tool.
-- Use `terminate` ONLY when the task is fully complete.
+{tool_rules}
 
 Your goals:
 {goals_text}
@@ -82,13 +99,17 @@ Environment: {environment.__class__.__name__}
     def parse_response(self, response):
         """
         Parse an LLM response into a tool invocation.
-        Supports both:
+        Supports:
         - dict (Groq-native tool calls)
+        - list of dicts (parallel tool calls)
         - JSON string (fallback / non-tool models)
         """
         if isinstance(response, dict):
             return response
 
+        if isinstance(response, list):
+            return [self.parse_response(item) for item in response]
+
         if isinstance(response, str):
             return FunctionCallParser.parse(response)
 
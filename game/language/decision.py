@@ -0,0 +1,98 @@
+import json
+from dataclasses import dataclass, field
+from typing import Any, Optional, Tuple
+
+from game.actions.core.validation import ToolArgumentError
+from game.llm.streaming import close_streamed
+
+# json.dumps(..., default=str) builds a new encoder per call; this one is reused.
+# default=str: streamed arguments serialize as a short placeholder
+_encode = json.JSONEncoder(default=str).encode
+
+
+# Built on every step: slotted, and not frozen (frozen __init__ is ~2x slower)
+@dataclass(slots=True)
+class ToolCall:
+    tool: dict   # registry metadata for the called tool
+    args: dict   # validated and coerced, unless `error` is set
+    error: Optional[ToolArgumentError] = None
+
+    @property
+    def name(self) -> str:
+        return self.tool["tool_name"]
+
+    @property
+    def function(self):
+        return self.tool["function"]
+
+    @property
+    def terminal(self) -> bool:
+        return self.tool["terminal"]
+
+
+@dataclass(slots=True)
+class Decision:
+    """
+    One LLM response, parsed once per step.
+
+    Carries the resolved tool call(s), the terminal flag and the
+    serialized form stored in memory, so nothing downstream has to
+    re-parse the response or look the tool up again. A native (dict)
+    response is only serialized once memory asks for it.
+    """
+    response: Any
+    calls: Tuple[ToolCall, ...]
+    terminal: bool
+    _serialized: Optional[str] = field(default=None, repr=False)
+
+    @property
+    def serialized(self) -> str:
+        if self._serialized is None:
+            response = self.response
+            self._serialized = response if isinstance(response, str) else _encode(response)
+        return self._serialized
+
+    @property
+    def call(self) -> ToolCall:
+        return self.calls[0]
+
+    @property
+    def parallel(self) -> bool:
+        return len(self.calls) > 1
+
+    def only(self, calls) -> "Decision":
+        """
+        This decision restricted to `calls` (e.g. without a terminal call
+        dropped on the first step), re-serialized so a stored copy only
+        records what actually ran.
+        """
+        calls = tuple(calls)
+        invocations = [{"tool": call.name, "args": call.args} for call in calls]
+        terminal = any(call.terminal for call in calls)
+        return Decision(invocations, calls, terminal, _encode(invocations))
+
+    def close(self):
+        """Remove the spool files of streamed arguments once the step is over."""
+        for call in self.calls:
+            close_streamed(call.args)
+
+    @classmethod
+    def from_response(cls, response, agent_language, actions) -> "Decision":
+        invocations = agent_language.parse_response(response)
+        if isinstance(invocations, dict):
+            # One call, the common case: no intermediate sequences
+            call = _tool_call(actions.get_tool(invocations["tool"]), invocations["args"])
+            return cls(response, (call,), call.tool["terminal"])
+
+        calls = tuple(_tool_call(actions.get_tool(inv["tool"]), inv["args"]) for inv in invocations)
+        return cls(response, calls, any(call.tool["terminal"] for call in calls))
+
+
+def _tool_call(tool: dict, args) -> ToolCall:
+    validator = tool.get("validator")
+    if validator is None:
+        return ToolCall(tool, args)
+    try:
+        return ToolCall(tool, validator(args))
+    except ToolArgumentError as e:
+        return ToolCall(tool, args, e)
@@ -21,7 +21,14 @@ class FunctionCallParser:
         except json.JSONDecodeError:
             raise ValueError(f"Invalid JSON returned by LLM: {response_text}")
 
-        if "tool" not in data or "args" not in data:
+        if isinstance(data, list):
+            return [FunctionCallParser._validate(item, response_text) for item in data]
+
+        return FunctionCallParser._validate(data, response_text)
+
+    @staticmethod
+    def _validate(data, response_text: str):
+        if not isinstance(data, dict) or "tool" not in data or "args" not in data:
             raise ValueError(
                 f"Response missing required fields ('tool', 'args'): {response_text}"
             )
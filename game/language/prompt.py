@@ -4,11 +4,20 @@ class Prompt:
     This object is passed to the LLM backend (generate_response).
     """
 
-    def __init__(self, system: str, messages: list, tools: list = None):
+    def __init__(self, system: str, messages: list, tools: list = None, chat_messages: list = None):
         self.system = system
         self.messages = messages  # Past memory
         self.tools = tools or []  # Function-calling schemas
 
+        # Optional pre-assembled [system] + messages list (see PromptBuilder)
+        self._chat_messages = chat_messages
+
+    def chat_messages(self) -> list:
+        """Return the chat-completions message list, system message first."""
+        if self._chat_messages is not None:
+            return self._chat_messages
+        return [{"role": "system", "content": self.system}] + self.messages
+
     def to_dict(self):
         """Return the prompt in a structure usable by any LLM SDK."""
         return {
@@ -16,4 +25,3 @@ class Prompt:
             "messages": self.messages,
             "tools": self.tools
         }
-
@@ -0,0 +1,72 @@
+from game.language.prompt import Prompt
+
+
+class PromptBuilder:
+    """
+    Incremental prompt assembly for a single agent.
+
+    The system message and tool schemas are computed once. Memory
+    messages are appended as they arrive, and rewrites of older ones
+    (e.g. compaction) are patched in from Memory.edits_since(), so each
+    step costs O(new messages + edits) instead of O(history + tools).
+
+    Prompts returned by build() share their message lists with the
+    builder and are only valid until the next build() call.
+    """
+
+    def __init__(self, agent_language, goals, actions, environment):
+        self.system = agent_language.build_system_message(goals, environment)
+        self.tools = actions.get_openai_schema()
+
+        self._memory = None
+        self._revision = None
+        self._reset()
+
+    def build(self, memory) -> Prompt:
+        items = memory.items
+
+        if memory is not self._memory:
+            edits = None
+        elif memory.revision == self._revision:
+            edits = []
+        else:
+            edits = memory.edits_since(self._revision)
+
+        # Start over when the memory was swapped, its rewrites are unknown, or it shrank
+        if memory is not self._memory or edits is None:
+            self._memory = memory
+            self._reset()
+        else:
+            self._apply(edits)
+            if len(items) < len(self._messages):
+                self._reset()
+        self._revision = memory.revision
+
+        for item in items[len(self._messages):]:
+            self._messages.append(item)
+            self._chat_messages.append(item)
+
+        return Prompt(
+            system=self.system,
+            messages=self._messages,
+            tools=self.tools,
+            chat_messages=self._chat_messages,
+        )
+
+    def _apply(self, edits: list):
+        # Only the part already emitted needs patching; the rest is appended below
+        for edit in edits:
+            if edit[0] == "replace":
+                _, index, item = edit
+                if index < len(self._messages):
+                    self._messages[index] = item
+                    self._chat_messages[index + 1] = item
+            else:
+                _, start, stop = edit
+                del self._messages[start:stop]
+                del self._chat_messages[start + 1:stop + 1]
+
+    def _reset(self):
+        # New lists (never cleared in place) so in-flight prompts stay intact
+        self._messages = []
+        self._chat_messages = [{"role": "system", "content": self.system}]
@@ -1,6 +1,34 @@
+import asyncio
+import contextvars
+import time
 from abc import ABC, abstractmethod
 from game.language.prompt import Prompt
 
+# Monotonic deadline of the current LLM call, set by ResilientLLMClient
+_deadline = contextvars.ContextVar("game_llm_deadline", default=None)
+
+
+def set_deadline(deadline: float | None):
+    _deadline.set(deadline)
+
+
+def request_timeout() -> float | None:
+    """
+    Seconds left before the caller's deadline, for the SDK request
+    timeout (None without a deadline), so an abandoned request ends.
+    """
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return max(0.001, deadline - time.monotonic())
+
+class FallbackResponse(dict):
+    """
+    A response the client made up instead of the model's (e.g. a safe
+    terminate when the model called no tool). Never cached.
+    """
+
+
 class BaseLLMClient(ABC):
 
     @abstractmethod
@@ -13,3 +41,11 @@ class BaseLLMClient(ABC):
         }
         """
         pass
+
+    async def acall(self, prompt: Prompt) -> dict:
+        """
+        Async variant of __call__.
+        Clients with a native async SDK should override this;
+        the default offloads the blocking call to a worker thread.
+        """
+        return await asyncio.to_thread(self, prompt)
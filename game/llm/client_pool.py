@@ -0,0 +1,113 @@
+import asyncio
+import atexit
+import hashlib
+import importlib.util
+import threading
+import weakref
+
+from game.config.config import CONFIG
+
+
+class ClientPool:
+    """
+    Process-wide pool of provider SDK clients.
+
+    Each SDK client owns an HTTP connection pool, so sharing one per
+    (provider, credentials) lets every agent in the process reuse warm
+    keep-alive connections instead of paying TCP/TLS setup per agent.
+
+    - sync clients are shared across threads (httpx.Client is thread-safe)
+    - async clients are shared across tasks of one event loop; each loop
+      gets its own, since httpx.AsyncClient is bound to the loop it runs on
+    """
+
+    _lock = threading.Lock()
+    _sync_clients = {}
+    _async_clients = weakref.WeakKeyDictionary()  # loop -> {key: client}
+
+    @classmethod
+    def get(cls, provider: str, api_key: str | None = None, virtual_key: str | None = None):
+        key = cls._key(provider, api_key, virtual_key)
+
+        with cls._lock:
+            client = cls._sync_clients.get(key)
+            if client is None:
+                client = _build_client(provider, api_key, virtual_key, is_async=False)
+                cls._sync_clients[key] = client
+            return client
+
+    @classmethod
+    def get_async(cls, provider: str, api_key: str | None = None, virtual_key: str | None = None):
+        """Must be called from inside the event loop that will use the client."""
+        key = cls._key(provider, api_key, virtual_key)
+        loop = asyncio.get_running_loop()
+
+        with cls._lock:
+            clients = cls._async_clients.setdefault(loop, {})
+            client = clients.get(key)
+            if client is None:
+                client = _build_client(provider, api_key, virtual_key, is_async=True)
+                clients[key] = client
+            return client
+
+    @classmethod
+    def close_all(cls):
+        """Close pooled sync clients (async ones go away with their loop)."""
+        with cls._lock:
+            clients = list(cls._sync_clients.values())
+            cls._sync_clients.clear()
+
+        for client in clients:
+            close = getattr(client, "close", None)
+            if close is not None:
+                close()
+
+    @staticmethod
+    def _key(provider: str, api_key: str | None, virtual_key: str | None):
+        # Never keep raw credentials in pool keys
+        digest = hashlib.sha256(f"{api_key or ''}:{virtual_key or ''}".encode()).hexdigest()
+        return provider.lower(), digest
+
+
+atexit.register(ClientPool.close_all)
+
+
+# ----------------------------------------------------------------------
+# Client construction (provider SDKs are imported on first use)
+# ----------------------------------------------------------------------
+
+def _http_client(is_async: bool):
+    import httpx
+
+    cfg = CONFIG.http
+    limits = httpx.Limits(
+        max_connections=cfg.max_connections,
+        max_keepalive_connections=cfg.max_keepalive_connections,
+        keepalive_expiry=cfg.keepalive_expiry,
+    )
+    # HTTP/2 needs the optional `h2` package
+    http2 = cfg.http2 and importlib.util.find_spec("h2") is not None
+
+    client_cls = httpx.AsyncClient if is_async else httpx.Client
+    return client_cls(limits=limits, http2=http2)
+
+
+def _build_client(provider: str, api_key: str | None, virtual_key: str | None, is_async: bool):
+    provider = provider.lower()
+    http_client = _http_client(is_async)
+
+    if provider == "groq":
+        from groq import Groq, AsyncGroq
+
+        client_cls = AsyncGroq if is_async else Groq
+        base_url = {"base_url": CONFIG.groq.base_url} if CONFIG.groq.base_url else {}
+        return client_cls(api_key=api_key, http_client=http_client, **base_url)
+
+    if provider == "portkey":
+        from portkey_ai import Portkey, AsyncPortkey
+
+        client_cls = AsyncPortkey if is_async else Portkey
+        base_url = {"base_url": CONFIG.portkey.base_url} if CONFIG.portkey.base_url else {}
+        return client_cls(api_key=api_key, virtual_key=virtual_key, http_client=http_client, **base_url)
+
+    raise ValueError(f"Unsupported LLM provider: {provider}")
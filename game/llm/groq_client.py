@@ -1,18 +1,31 @@
 import json
-from groq import Groq
+import logging
+import time
 from game.language.prompt import Prompt
 from game.config.config import CONFIG
+from game.llm.base_client import BaseLLMClient, FallbackResponse, request_timeout
+from game.llm.client_pool import ClientPool
 from game.llm.model_router import ModelRouter
+from game.llm.streaming import ToolCallAssembler
+from game.llm.usage import record_usage
 
+logger = logging.getLogger(__name__)
 
-class GroqClient:
+
+class GroqClient(BaseLLMClient):
     """
     Groq-native LLM wrapper.
 
     Contract:
     - Uses ONLY Groq tool_calls
-    - Enforces exactly one tool call
+    - Enforces exactly one tool call (unless parallel_tool_calls is enabled)
     - Never parses JSON from message.content
+
+    With stream=True tool calls are assembled from deltas as they arrive:
+    on_tool_start(name) fires once a tool name is known, on_tool_call(invocation)
+    once a call's arguments are complete and valid (never twice for one call,
+    even across a model fallback), and large string arguments are spooled
+    instead of buffered (see game.llm.streaming).
     """
 
     def __init__(
@@ -21,47 +34,182 @@ class GroqClient:
         model: str | None = None,
         max_tokens: int | None = None,
         temperature: float | None = None,
+        parallel_tool_calls: bool | None = None,
+        stream: bool | None = None,
+        on_tool_start=None,
+        on_tool_call=None,
     ):
-        self.client = Groq(api_key=api_key)
+        # SDK clients (and their connection pools) are shared process-wide
+        self.api_key = api_key
+        self.client = ClientPool.get("groq", api_key=api_key)
 
-        self.model = model or ModelRouter.select_model()
+        # A pinned model is always used; otherwise the router picks per call
+        # (self.model is then only the initial pick, for display and budgeting)
+        self.pinned_model = model or CONFIG.llm.pinned_model
+        self.model = self.pinned_model or ModelRouter.route()
+        # What responses depend on (see CachedLLMClient): the pinned model, or routing
+        self.requested_model = self.pinned_model or "routed"
         self.max_tokens = max_tokens or CONFIG.llm.max_tokens
         self.temperature = temperature or CONFIG.llm.temperature
+        self.parallel_tool_calls = (
+            CONFIG.agent.parallel_tool_calls
+            if parallel_tool_calls is None
+            else parallel_tool_calls
+        )
+        self.stream = CONFIG.llm.stream if stream is None else stream
+        self.on_tool_start = on_tool_start
+        self.on_tool_call = on_tool_call
 
-        print(f"[LLM] Provider=Groq | Model={self.model}")
+        logger.info("[LLM] Provider=Groq | Model=%s", self.model)
 
     def __call__(self, prompt: Prompt) -> dict:
-        system = {"role": "system", "content": prompt.system}
-        messages = [system] + prompt.messages
-
-        response = self.client.chat.completions.create(
-            model=self.model,
-            messages=messages,
-            tools=prompt.tools,
-            tool_choice="required",
-            max_tokens=self.max_tokens,
-            temperature=self.temperature,
+        tried = []
+        emitted = set()  # calls already reported by an earlier attempt
+        while True:
+            model = self._select_model(tried)
+            start = time.perf_counter()
+            try:
+                raw = self.client.chat.completions.with_raw_response.create(
+                    **self._request(prompt, model)
+                )
+                response = raw.parse()
+
+                if self.stream:
+                    assembler = self._assembler(prompt, emitted)
+                    for chunk in response:
+                        assembler.feed(chunk)
+                    invocation = self._shape(assembler.finish(), self.parallel_tool_calls)
+                    usage = assembler.usage
+                else:
+                    invocation = self._to_invocation(response.choices[0].message, self.parallel_tool_calls)
+                    usage = getattr(response, "usage", None)
+            except Exception as e:
+                if not self._should_fall_back(model, start, e, tried):
+                    raise
+                continue
+
+            self._record_success(model, start, raw.headers, usage)
+            return invocation
+
+    async def acall(self, prompt: Prompt) -> dict:
+        async_client = ClientPool.get_async("groq", api_key=self.api_key)
+
+        tried = []
+        emitted = set()  # calls already reported by an earlier attempt
+        while True:
+            model = self._select_model(tried)
+            start = time.perf_counter()
+            try:
+                raw = await async_client.chat.completions.with_raw_response.create(
+                    **self._request(prompt, model)
+                )
+                response = await raw.parse()
+
+                if self.stream:
+                    assembler = self._assembler(prompt, emitted)
+                    async for chunk in response:
+                        assembler.feed(chunk)
+                    invocation = self._shape(assembler.finish(), self.parallel_tool_calls)
+                    usage = assembler.usage
+                else:
+                    invocation = self._to_invocation(response.choices[0].message, self.parallel_tool_calls)
+                    usage = getattr(response, "usage", None)
+            except Exception as e:
+                if not self._should_fall_back(model, start, e, tried):
+                    raise
+                continue
+
+            self._record_success(model, start, raw.headers, usage)
+            return invocation
+
+    # ------------------------------------------------------------------
+    # ROUTING
+    # ------------------------------------------------------------------
+    def _select_model(self, tried: list) -> str:
+        # Local to the call: one client is shared by concurrent agents
+        if self.pinned_model:
+            return self.pinned_model
+        return ModelRouter.route(exclude=tried)
+
+    def _should_fall_back(self, model: str, start: float, error: Exception, tried: list) -> bool:
+        """Record the failure; on a 429 switch to another healthy model if one is left."""
+        throttled = ModelRouter.record_failure(model, time.perf_counter() - start, error)
+        if not throttled or self.pinned_model:
+            return False
+
+        tried.append(model)
+        try:
+            ModelRouter.select_model(exclude=tried)
+        except RuntimeError:
+            return False
+
+        logger.warning("[LLM] %s throttled, falling back", model)
+        return True
+
+    @staticmethod
+    def _record_success(model: str, start: float, headers, usage):
+        record_usage(model, usage)
+        ModelRouter.record_success(
+            model,
+            time.perf_counter() - start,
+            headers=headers,
+            tokens=getattr(usage, "total_tokens", 0) or 0,
         )
 
-        message = response.choices[0].message
+    def _request(self, prompt: Prompt, model: str) -> dict:
+        messages = prompt.chat_messages()
+
+        request = {
+            "model": model,
+            "messages": messages,
+            "tools": prompt.tools,
+            "tool_choice": "required",
+            "max_tokens": self.max_tokens,
+            "temperature": self.temperature,
+            **({"parallel_tool_calls": True} if self.parallel_tool_calls else {}),
+            **({"stream": True} if self.stream else {}),
+        }
+
+        # Bounded by the caller's deadline, so an abandoned request ends too
+        timeout = request_timeout()
+        if timeout is not None:
+            request["timeout"] = timeout
+        return request
+
+    def _assembler(self, prompt: Prompt, emitted: set) -> ToolCallAssembler:
+        return ToolCallAssembler(
+            prompt.tools,
+            on_tool_start=self.on_tool_start,
+            on_tool_call=self.on_tool_call,
+            emitted=emitted,
+        )
 
+    @staticmethod
+    def _to_invocation(message, parallel: bool = False):
         # --------------------------------------------
         # ONLY VALID PATH: Groq-native tool_calls
         # --------------------------------------------
-        if not message.tool_calls:
+        invocations = [
+            {
+                "tool": tool_call.function.name,
+                "args": json.loads(tool_call.function.arguments),
+            }
+            for tool_call in message.tool_calls or []
+        ]
+        return GroqClient._shape(invocations, parallel)
+
+    @staticmethod
+    def _shape(invocations: list, parallel: bool = False):
+        if not invocations:
             # Model violated contract → force terminate
-            return {
+            return FallbackResponse({
                 "tool": "terminate",
                 "args": {
                     "message": "Model failed to call a tool. Terminating safely."
                 }
-            }
-
-        # Enforce exactly one tool call
-        tool_call = message.tool_calls[0]
-
-        return {
-            "tool": tool_call.function.name,
-            "args": json.loads(tool_call.function.arguments),
-        }
+            })
 
+        # Enforce exactly one tool call unless parallel mode is on
+        if parallel and len(invocations) > 1:
+            return invocations
+        return invocations[0]
@@ -0,0 +1,44 @@
+import asyncio
+import threading
+
+from game.llm.base_client import BaseLLMClient
+from game.language.prompt import Prompt
+
+
+class ConcurrencyLimitedClient(BaseLLMClient):
+    """
+    Wraps any LLM client and caps the number of in-flight calls.
+
+    One instance is meant to be shared by every agent that should
+    count against the same limit. The sync path uses a blocking
+    semaphore (which may be a multiprocessing.Manager proxy to cap
+    calls across processes); the async path uses an asyncio one.
+    """
+
+    def __init__(self, client, max_concurrency: int, semaphore=None):
+        self.client = client
+        self.max_concurrency = max_concurrency
+
+        self._sync_semaphore = semaphore or threading.BoundedSemaphore(max_concurrency)
+        self._async_semaphore = None  # bound to the event loop on first use
+
+    def __call__(self, prompt: Prompt) -> dict:
+        with self._sync_semaphore:
+            return self.client(prompt)
+
+    async def acall(self, prompt: Prompt) -> dict:
+        if self._async_semaphore is None:
+            self._async_semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async with self._async_semaphore:
+            acall = getattr(self.client, "acall", None)
+            if acall is not None:
+                return await acall(prompt)
+            return await asyncio.to_thread(self.client, prompt)
+
+    def __getattr__(self, name):
+        # Expose wrapped client attributes (model, etc.); `client` itself is
+        # missing only before __init__ ran (unpickling, copy)
+        if name == "client":
+            raise AttributeError(name)
+        return getattr(self.client, name)
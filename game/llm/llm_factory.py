@@ -1,5 +1,4 @@
-from game.llm.groq_client import GroqClient
-from game.llm.portkey_client import PortkeyClient
+from game.llm.resilient_client import ResilientLLMClient
 from game.config.config import CONFIG
 
 
@@ -7,12 +6,33 @@ class LLMFactory:
 
     @staticmethod
     def create():
+        client = ResilientLLMClient(
+            LLMFactory._create_provider_client(),
+            hedge_client=LLMFactory._create_hedge_client(),
+        )
+
+        if CONFIG.cache.enabled:
+            from game.llm.response_cache import CachedLLMClient
+            return CachedLLMClient(client)
+        return client
+
+    @staticmethod
+    def _create_provider_client(model: str | None = None):
+        # Import only the configured provider's client (and so its SDK)
         provider = CONFIG.llm.provider.lower()
 
         if provider == "groq":
-            return GroqClient()
+            from game.llm.groq_client import GroqClient
+            return GroqClient(model=model)
 
         if provider == "portkey":
-            return PortkeyClient()
+            from game.llm.portkey_client import PortkeyClient
+            return PortkeyClient(model=model)
 
         raise ValueError(f"Unsupported LLM provider: {provider}")
+
+    @staticmethod
+    def _create_hedge_client():
+        if CONFIG.llm.hedge_after_seconds is None or not CONFIG.llm.hedge_model:
+            return None
+        return LLMFactory._create_provider_client(model=CONFIG.llm.hedge_model)
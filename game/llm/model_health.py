@@ -0,0 +1,151 @@
+import re
+import threading
+import time
+from collections import deque
+
+from game.config.config import CONFIG
+from game.llm.model_registry import ModelSpec
+
+_DURATION_PART = re.compile(r"(\d+(?:\.\d+)?)(ms|h|m|s)")
+_DURATION_UNITS = {"h": 3600.0, "m": 60.0, "s": 1.0, "ms": 0.001}
+
+
+def parse_duration(value) -> float | None:
+    """Parse rate-limit reset values like '7.66s', '2m59.56s', '250ms' or '12'."""
+    if value is None:
+        return None
+    value = str(value).strip()
+    try:
+        return float(value)
+    except ValueError:
+        pass
+
+    parts = _DURATION_PART.findall(value)
+    if not parts:
+        return None
+    return sum(float(amount) * _DURATION_UNITS[unit] for amount, unit in parts)
+
+
+def _percentile(samples, q: float) -> float | None:
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+class ModelHealth:
+    """
+    Live view of one model: quota (from rate-limit headers, with a
+    local per-minute estimate as fallback), rolling latency and errors.
+    """
+
+    def __init__(self, spec: ModelSpec):
+        self.spec = spec
+        self._lock = threading.RLock()
+
+        window = CONFIG.router.window_size
+        self.latencies = deque(maxlen=window)
+        self.outcomes = deque(maxlen=window)  # True = error
+
+        self.remaining_requests = None
+        self.remaining_tokens = None
+        self.requests_reset_at = 0.0
+        self.tokens_reset_at = 0.0
+        self.cooldown_until = 0.0
+        self.last_failure_at = 0.0
+
+        # Local estimate of the last minute of traffic: (timestamp, tokens)
+        self._recent = deque()
+
+    # ------------------------------------------------------------------
+    # RECORDING
+    # ------------------------------------------------------------------
+    def record_success(self, latency: float, headers=None, tokens: int = 0):
+        with self._lock:
+            now = time.time()
+            self.latencies.append(latency)
+            self.outcomes.append(False)
+            self._recent.append((now, tokens))
+            self._apply_headers(headers, now)
+
+    def record_failure(self, latency: float, throttled: bool = False, headers=None):
+        with self._lock:
+            now = time.time()
+            self.last_failure_at = now
+            self.outcomes.append(True)
+            self._recent.append((now, 0))
+            self._apply_headers(headers, now)
+
+            if throttled:
+                retry_after = parse_duration(headers.get("retry-after")) if headers else None
+                self.cooldown_until = now + (retry_after or CONFIG.router.throttle_cooldown_seconds)
+            elif self.error_rate() >= CONFIG.router.max_error_rate:
+                self.cooldown_until = now + CONFIG.router.error_cooldown_seconds
+
+    def _apply_headers(self, headers, now: float):
+        if not headers:
+            return
+
+        remaining = headers.get("x-ratelimit-remaining-requests")
+        if remaining is not None:
+            self.remaining_requests = int(float(remaining))
+            self.requests_reset_at = now + (parse_duration(headers.get("x-ratelimit-reset-requests")) or 60.0)
+
+        remaining = headers.get("x-ratelimit-remaining-tokens")
+        if remaining is not None:
+            self.remaining_tokens = int(float(remaining))
+            self.tokens_reset_at = now + (parse_duration(headers.get("x-ratelimit-reset-tokens")) or 60.0)
+
+    # ------------------------------------------------------------------
+    # QUERIES
+    # ------------------------------------------------------------------
+    def is_available(self, now: float | None = None) -> bool:
+        with self._lock:
+            now = now or time.time()
+
+            if now < self.cooldown_until:
+                return False
+
+            # Live quota from headers while it is current; otherwise the
+            # local estimate of the last minute against the registry limits
+            while self._recent and now - self._recent[0][0] > 60.0:
+                self._recent.popleft()
+
+            if self.remaining_requests is not None and now < self.requests_reset_at:
+                if self.remaining_requests <= 0:
+                    return False
+            elif len(self._recent) >= self.spec.requests_per_minute:
+                return False
+
+            if self.remaining_tokens is not None and now < self.tokens_reset_at:
+                if self.remaining_tokens < CONFIG.llm.max_tokens:
+                    return False
+            elif sum(tokens for _, tokens in self._recent) >= self.spec.tokens_per_minute:
+                return False
+
+            return True
+
+    def error_rate(self) -> float:
+        with self._lock:
+            if len(self.outcomes) < CONFIG.router.min_samples:
+                return 0.0
+            return sum(self.outcomes) / len(self.outcomes)
+
+    def p50(self) -> float | None:
+        with self._lock:
+            return _percentile(self.latencies, 0.50)
+
+    def p95(self) -> float | None:
+        with self._lock:
+            return _percentile(self.latencies, 0.95)
+
+    def snapshot(self) -> dict:
+        return {
+            "model": self.spec.name,
+            "available": self.is_available(),
+            "p50": self.p50(),
+            "p95": self.p95(),
+            "error_rate": self.error_rate(),
+            "remaining_requests": self.remaining_requests,
+            "remaining_tokens": self.remaining_tokens,
+        }
@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from typing import List
+from typing import List, Optional
 
 
 @dataclass(frozen=True)
@@ -9,10 +9,33 @@ class ModelSpec:
     max_tokens: int
     cost_tier: str           # free / paid
 
+    # Provider rate limits (free tier); used by ModelRouter
+    # while no live values from response headers are current
+    requests_per_minute: int = 30
+    tokens_per_minute: int = 6000
+
+    # On-demand list price, USD per million tokens. Free-tier usage is
+    # still priced at these rates so spend is comparable across tiers.
+    input_price_per_mtok: float = 0.0
+    output_price_per_mtok: float = 0.0
+
+    def cost(self, prompt_tokens: int, completion_tokens: int) -> float:
+        return (
+            prompt_tokens * self.input_price_per_mtok
+            + completion_tokens * self.output_price_per_mtok
+        ) / 1_000_000
+
 MODEL_REGISTRY: List[ModelSpec] = [
-    ModelSpec("llama-3.3-70b-versatile", "groq", 8192, "free"),
-    ModelSpec("meta-llama/llama-4-scout-17b-16e-instruct", "groq", 8192, "free"),
-    ModelSpec("llama-3.1-8b-instant", "groq", 4096, "free"),
-    ModelSpec("qwen/qwen3-32b", "groq", 8192, "free"),
-    ModelSpec("meta-llama/llama-4-maverick-17b-128e-instruct", "groq", 8192, "free"),
-]
\ No newline at end of file
+    ModelSpec("llama-3.3-70b-versatile", "groq", 8192, "free", 30, 12000, 0.59, 0.79),
+    ModelSpec("meta-llama/llama-4-scout-17b-16e-instruct", "groq", 8192, "free", 30, 30000, 0.11, 0.34),
+    ModelSpec("llama-3.1-8b-instant", "groq", 4096, "free", 30, 6000, 0.05, 0.08),
+    ModelSpec("qwen/qwen3-32b", "groq", 8192, "free", 60, 6000, 0.29, 0.59),
+    ModelSpec("meta-llama/llama-4-maverick-17b-128e-instruct", "groq", 8192, "free", 30, 6000, 0.20, 0.60),
+]
+
+
+_MODELS_BY_NAME = {spec.name: spec for spec in MODEL_REGISTRY}
+
+
+def get_model_spec(name: str) -> Optional[ModelSpec]:
+    return _MODELS_BY_NAME.get(name)
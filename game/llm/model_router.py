@@ -1,4 +1,5 @@
 from game.llm.model_registry import MODEL_REGISTRY
+from game.llm.model_health import ModelHealth
 from game.config.config import CONFIG
 
 # Best → worst for tool calling
@@ -10,17 +11,88 @@ GROQ_TOOL_PREFERENCE = [
     "meta-llama/llama-4-maverick-17b-128e-instruct",
 ]
 
+# Process-wide health per registered model
+_HEALTH = {spec.name: ModelHealth(spec) for spec in MODEL_REGISTRY}
+
+
+def _is_throttle(error: Exception) -> bool:
+    return getattr(error, "status_code", None) == 429
+
+
+def _error_headers(error: Exception):
+    response = getattr(error, "response", None)
+    return getattr(response, "headers", None)
+
+
 class ModelRouter:
+    """
+    Picks a Groq model from live health data.
+
+    Among models that are healthy and have quota left, the most preferred
+    one is chosen unless it is clearly slower (p50 beyond
+    CONFIG.router.latency_slack × the fastest p50), in which case the
+    next preferred model within that bound wins.
+    """
+
+    @staticmethod
+    def select_model(exclude=()) -> str:
+        candidates = [
+            name for name in GROQ_TOOL_PREFERENCE
+            if name not in exclude and ModelRouter._is_available(name)
+        ]
+        if not candidates:
+            raise RuntimeError("No suitable Groq model available")
+
+        latencies = [_HEALTH[name].p50() for name in candidates if name in _HEALTH]
+        known = [latency for latency in latencies if latency is not None]
+        if not known:
+            return candidates[0]
+
+        limit = min(known) * CONFIG.router.latency_slack
+        for name in candidates:
+            p50 = _HEALTH[name].p50() if name in _HEALTH else None
+            if p50 is None or p50 <= limit:
+                return name
+
+        return candidates[0]
 
     @staticmethod
-    def select_model() -> str:
-        for model_name in GROQ_TOOL_PREFERENCE:
-            if ModelRouter._is_available(model_name):
-                return model_name
+    def route(exclude=()) -> str:
+        """
+        select_model(), but when every model is unavailable fall back to
+        the one that failed least recently instead of raising.
+        """
+        try:
+            return ModelRouter.select_model(exclude)
+        except RuntimeError:
+            pass
 
-        raise RuntimeError("No suitable Groq model available")
+        candidates = [name for name in GROQ_TOOL_PREFERENCE if name not in exclude] or GROQ_TOOL_PREFERENCE
+        return min(
+            candidates,
+            key=lambda name: _HEALTH[name].last_failure_at if name in _HEALTH else 0.0,
+        )
+
+    @staticmethod
+    def record_success(model_name: str, latency: float, headers=None, tokens: int = 0):
+        health = _HEALTH.get(model_name)
+        if health is not None:
+            health.record_success(latency, headers=headers, tokens=tokens)
+
+    @staticmethod
+    def record_failure(model_name: str, latency: float, error: Exception) -> bool:
+        """Record a failed call. Returns True when the call was throttled (429)."""
+        throttled = _is_throttle(error)
+        health = _HEALTH.get(model_name)
+        if health is not None:
+            health.record_failure(latency, throttled=throttled, headers=_error_headers(error))
+        return throttled
+
+    @staticmethod
+    def stats() -> list:
+        return [_HEALTH[name].snapshot() for name in GROQ_TOOL_PREFERENCE if name in _HEALTH]
 
     @staticmethod
     def _is_available(model_name: str) -> bool:
-        # later: rate limits, outages, quotas
-        return True
\ No newline at end of file
+        health = _HEALTH.get(model_name)
+        return health.is_available() if health is not None else True
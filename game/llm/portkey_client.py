@@ -1,14 +1,20 @@
 import json
-from portkey_ai import Portkey
-from game.llm.base_client import BaseLLMClient
+import logging
+from game.llm.base_client import BaseLLMClient, FallbackResponse, request_timeout
+from game.llm.client_pool import ClientPool
+from game.llm.streaming import ToolCallAssembler
 from game.language.prompt import Prompt
 from game.config.config import CONFIG
+from game.llm.usage import record_usage
+
+logger = logging.getLogger(__name__)
 
 
 class PortkeyClient(BaseLLMClient):
     """
     Portkey-backed LLM client.
     Safer for agents because Portkey normalizes tool calling.
+    Supports the same stream / on_tool_start / on_tool_call options as GroqClient.
     """
     MODEL = "gpt-4o-mini"
 
@@ -17,40 +23,112 @@ class PortkeyClient(BaseLLMClient):
         api_key: str | None = None,
         virtual_key: str | None = None,
         model: str | None = None,
+        parallel_tool_calls: bool | None = None,
+        stream: bool | None = None,
+        on_tool_start=None,
+        on_tool_call=None,
     ):
-        self.client = Portkey(
-            api_key=api_key or CONFIG.portkey.api_key,
-            virtual_key=virtual_key or CONFIG.portkey.virtual_key,
+        self.api_key = api_key or CONFIG.portkey.api_key
+        self.virtual_key = virtual_key or CONFIG.portkey.virtual_key
+
+        # SDK clients (and their connection pools) are shared process-wide
+        self.client = ClientPool.get(
+            "portkey",
+            api_key=self.api_key,
+            virtual_key=self.virtual_key,
+        )
+        self.parallel_tool_calls = (
+            CONFIG.agent.parallel_tool_calls
+            if parallel_tool_calls is None
+            else parallel_tool_calls
         )
+        self.stream = CONFIG.llm.stream if stream is None else stream
+        self.on_tool_start = on_tool_start
+        self.on_tool_call = on_tool_call
 
-        #self.model = model or CONFIG.llm.model
+        self.model = model or self.MODEL
 
-        print(f"[LLM] Provider=Portkey | Model={self.MODEL}")
+        logger.info("[LLM] Provider=Portkey | Model=%s", self.model)
 
     def __call__(self, prompt: Prompt) -> dict:
-        system = {"role": "system", "content": prompt.system}
-        messages = [system] + prompt.messages
-
-        response = self.client.chat.completions.create(
-            model=self.MODEL,
-            messages=messages,
-            tools=prompt.tools,
-            tool_choice="required",   # Portkey handles enforcement
-            max_tokens=CONFIG.llm.max_tokens,
-            temperature=CONFIG.llm.temperature,
+        response = self.client.chat.completions.create(**self._request(prompt))
+
+        if self.stream:
+            assembler = self._assembler(prompt)
+            for chunk in response:
+                assembler.feed(chunk)
+            record_usage(self.model, assembler.usage)
+            return self._shape(assembler.finish(), self.parallel_tool_calls)
+
+        record_usage(self.model, getattr(response, "usage", None))
+        return self._to_invocation(response.choices[0].message, self.parallel_tool_calls)
+
+    async def acall(self, prompt: Prompt) -> dict:
+        async_client = ClientPool.get_async(
+            "portkey",
+            api_key=self.api_key,
+            virtual_key=self.virtual_key,
         )
 
-        message = response.choices[0].message
+        response = await async_client.chat.completions.create(**self._request(prompt))
+
+        if self.stream:
+            assembler = self._assembler(prompt)
+            async for chunk in response:
+                assembler.feed(chunk)
+            record_usage(self.model, assembler.usage)
+            return self._shape(assembler.finish(), self.parallel_tool_calls)
+
+        record_usage(self.model, getattr(response, "usage", None))
+        return self._to_invocation(response.choices[0].message, self.parallel_tool_calls)
+
+    def _request(self, prompt: Prompt) -> dict:
+        messages = prompt.chat_messages()
 
+        request = {
+            "model": self.model,
+            "messages": messages,
+            "tools": prompt.tools,
+            "tool_choice": "required",   # Portkey handles enforcement
+            "max_tokens": CONFIG.llm.max_tokens,
+            "temperature": CONFIG.llm.temperature,
+            **({"parallel_tool_calls": True} if self.parallel_tool_calls else {}),
+            **({"stream": True} if self.stream else {}),
+        }
+
+        # Bounded by the caller's deadline, so an abandoned request ends too
+        timeout = request_timeout()
+        if timeout is not None:
+            request["timeout"] = timeout
+        return request
+
+    def _assembler(self, prompt: Prompt) -> ToolCallAssembler:
+        return ToolCallAssembler(
+            prompt.tools,
+            on_tool_start=self.on_tool_start,
+            on_tool_call=self.on_tool_call,
+        )
+
+    @staticmethod
+    def _to_invocation(message, parallel: bool = False):
         # Portkey normalizes tool calls well
-        if not message.tool_calls:
-            return {
+        invocations = [
+            {
+                "tool": tool_call.function.name,
+                "args": json.loads(tool_call.function.arguments),
+            }
+            for tool_call in message.tool_calls or []
+        ]
+        return PortkeyClient._shape(invocations, parallel)
+
+    @staticmethod
+    def _shape(invocations: list, parallel: bool = False):
+        if not invocations:
+            return FallbackResponse({
                 "tool": "terminate",
                 "args": {"message": "Model failed to call a tool"}
-            }
+            })
 
-        tool_call = message.tool_calls[0]
-        return {
-            "tool": tool_call.function.name,
-            "args": json.loads(tool_call.function.arguments),
-        }
+        if parallel and len(invocations) > 1:
+            return invocations
+        return invocations[0]
@@ -0,0 +1,163 @@
+import asyncio
+import json
+import os
+import threading
+import time
+
+from game.language.prompt import Prompt
+from game.llm.base_client import BaseLLMClient
+from game.llm.resilient_client import LLMCallError
+from game.llm.response_cache import prompt_fingerprint
+from game.llm.streaming import materialize
+from game.llm.usage import capture_usage, record_usage
+
+
+class ReplayExhaustedError(LLMCallError):
+    """A replayed session asked for more responses than were recorded."""
+
+
+class RecordingLLMClient(BaseLLMClient):
+    """
+    Wraps any LLM client and appends every call to a JSONL fixture:
+    session label, step, prompt fingerprint, response, provider usage
+    and latency. Replay it with ReplayLLMClient.
+    """
+
+    def __init__(self, client, path: str, session: str = "default"):
+        self.client = client
+        self.path = path
+        self.session = session
+        self._step = 0
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def __call__(self, prompt: Prompt) -> dict:
+        with capture_usage() as meter:
+            start = time.perf_counter()
+            response = self.client(prompt)
+            latency = time.perf_counter() - start
+        self._write(prompt, response, meter.calls, latency)
+        return response
+
+    async def acall(self, prompt: Prompt) -> dict:
+        with capture_usage() as meter:
+            start = time.perf_counter()
+            acall = getattr(self.client, "acall", None)
+            response = await (acall(prompt) if acall is not None else super().acall(prompt))
+            latency = time.perf_counter() - start
+        self._write(prompt, response, meter.calls, latency)
+        return response
+
+    def _write(self, prompt: Prompt, response, usage: list, latency: float):
+        with self._lock:
+            model = getattr(self.client, "model", None)
+            entry = {
+                "session": self.session,
+                "step": self._step,
+                "model": model,
+                "fingerprint": prompt_fingerprint(prompt, model),
+                "response": materialize(response),
+                "usage": [[u.model, u.prompt_tokens, u.completion_tokens] for u in usage],
+                "latency_ms": round(latency * 1000, 3),
+            }
+            self._step += 1
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write(json.dumps(entry, default=str) + "\n")
+
+    def __getattr__(self, name):
+        # Expose wrapped client attributes (model, etc.); `client` itself is
+        # missing only before __init__ ran (unpickling, copy)
+        if name == "client":
+            raise AttributeError(name)
+        return getattr(self.client, name)
+
+
+class ReplayLLMClient(BaseLLMClient):
+    """
+    Deterministic, offline LLM client that plays back a recorded session.
+
+    Responses are returned in recorded order. With verify=True, prompts
+    whose fingerprint differs from the recording (e.g. the workspace
+    changed) are counted in `mismatches`; strict=True rejects them.
+    Hashing every prompt costs O(history), so it is off by default to
+    keep benchmark overhead honest. Recorded usage is reported again so
+    token accounting matches the original run, and `latency_scale` > 0
+    sleeps for that fraction of the recorded latency.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        session: str | None = None,
+        verify: bool = False,
+        strict: bool = False,
+        latency_scale: float = 0.0,
+    ):
+        self.path = path
+        self.verify = verify or strict
+        self.strict = strict
+        self.latency_scale = latency_scale
+        self.entries = load_fixture(path, session)
+        self.session = session
+        self.model = next((e["model"] for e in self.entries if e.get("model")), None)
+        self.mismatches = 0
+        self._position = 0
+        self._lock = threading.Lock()
+
+        if not self.entries:
+            raise ValueError(f"No recorded calls for session {session!r} in {path}")
+
+    def __call__(self, prompt: Prompt) -> dict:
+        entry = self._next(prompt)
+        if self.latency_scale:
+            time.sleep(entry["latency_ms"] / 1000 * self.latency_scale)
+        return self._replay(entry)
+
+    async def acall(self, prompt: Prompt) -> dict:
+        entry = self._next(prompt)
+        if self.latency_scale:
+            await asyncio.sleep(entry["latency_ms"] / 1000 * self.latency_scale)
+        return self._replay(entry)
+
+    def rewind(self):
+        with self._lock:
+            self._position = 0
+            self.mismatches = 0
+
+    def _next(self, prompt: Prompt) -> dict:
+        with self._lock:
+            if self._position >= len(self.entries):
+                raise ReplayExhaustedError(
+                    f"Replay of {self.path} ran out after {len(self.entries)} calls"
+                )
+            entry = self.entries[self._position]
+            self._position += 1
+
+            if self.verify and prompt_fingerprint(prompt, entry.get("model")) != entry["fingerprint"]:
+                if self.strict:
+                    raise LLMCallError(f"Prompt of step {entry['step']} differs from the recording")
+                self.mismatches += 1
+            return entry
+
+    @staticmethod
+    def _replay(entry: dict):
+        for model, prompt_tokens, completion_tokens in entry["usage"]:
+            record_usage(model, {"prompt_tokens": prompt_tokens, "completion_tokens": completion_tokens})
+        # Callers may keep and mutate the response (e.g. coerced args)
+        return json.loads(json.dumps(entry["response"]))
+
+
+def load_fixture(path: str, session: str | None = None) -> list:
+    """Recorded calls of `session` (all sessions if None), in order."""
+    entries = []
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            if session is None or entry["session"] == session:
+                entries.append(entry)
+    return entries
@@ -0,0 +1,198 @@
+import asyncio
+import contextvars
+import random
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from game.config.config import CONFIG
+from game.language.prompt import Prompt
+from game.llm.base_client import BaseLLMClient, set_deadline
+from game.llm.model_health import parse_duration
+
+RETRYABLE_STATUS = {408, 409, 429, 500, 502, 503, 504}
+RETRYABLE_ERRORS = {"APITimeoutError", "APIConnectionError", "InternalServerError", "RateLimitError"}
+
+
+class LLMCallError(RuntimeError):
+    """Raised when an LLM call fails for good (non-retryable, retries exhausted or deadline hit)."""
+
+
+def is_retryable(error: Exception) -> bool:
+    if isinstance(error, (TimeoutError, ConnectionError)):
+        return True
+    if getattr(error, "status_code", None) in RETRYABLE_STATUS:
+        return True
+    return type(error).__name__ in RETRYABLE_ERRORS
+
+
+def _retry_after(error: Exception) -> float | None:
+    headers = getattr(getattr(error, "response", None), "headers", None)
+    return parse_duration(headers.get("retry-after")) if headers else None
+
+
+class ResilientLLMClient(BaseLLMClient):
+    """
+    Wraps an LLM client with:
+    - a per-call deadline (covering all retries)
+    - jittered exponential backoff on retryable errors (honours retry-after)
+    - optional hedging: after `hedge_after` seconds without an answer, a
+      second request goes to `hedge_client` and the first answer wins
+
+    Providers pass the time left before the deadline as the SDK request
+    timeout (see request_timeout), so abandoned requests do not keep
+    holding a thread.
+    """
+
+    # Shared threads that let sync calls be bounded by a deadline and hedged
+    _executor = None
+    _executor_lock = threading.Lock()
+
+    def __init__(
+        self,
+        client,
+        hedge_client=None,
+        timeout: float | None = None,
+        max_retries: int | None = None,
+        base_delay: float | None = None,
+        max_delay: float | None = None,
+        hedge_after: float | None = None,
+    ):
+        self.client = client
+        self.hedge_client = hedge_client
+        self.timeout = timeout or CONFIG.llm.timeout_seconds
+        self.max_retries = CONFIG.llm.max_retries if max_retries is None else max_retries
+        self.base_delay = base_delay or CONFIG.llm.retry_base_delay
+        self.max_delay = max_delay or CONFIG.llm.retry_max_delay
+        self.hedge_after = hedge_after or CONFIG.llm.hedge_after_seconds
+
+    # ------------------------------------------------------------------
+    # SYNC
+    # ------------------------------------------------------------------
+    def __call__(self, prompt: Prompt) -> dict:
+        deadline = time.monotonic() + self.timeout
+        attempt = 0
+        while True:
+            try:
+                return self._attempt(prompt, deadline)
+            except Exception as e:
+                delay = self._retry_delay(e, attempt, deadline)
+                time.sleep(delay)
+                attempt += 1
+
+    def _attempt(self, prompt: Prompt, deadline: float) -> dict:
+        pool = self._pool()
+        # Copy the context so providers can annotate the caller's llm.call span
+        futures = {pool.submit(contextvars.copy_context().run, _call, self.client, prompt, deadline)}
+
+        if self._hedging():
+            done, _ = wait(futures, timeout=min(self.hedge_after, self._remaining(deadline)))
+            if not done:
+                futures.add(pool.submit(
+                    contextvars.copy_context().run, _call, self.hedge_client, prompt, deadline
+                ))
+
+        error = None
+        while futures:
+            done, futures = wait(futures, timeout=self._remaining(deadline), return_when=FIRST_COMPLETED)
+            if not done:
+                break
+            for future in done:
+                if future.exception() is None:
+                    return future.result()
+                error = future.exception()
+
+        # Still-running requests are abandoned; their results are discarded
+        raise error or TimeoutError(f"LLM call exceeded {self.timeout}s deadline")
+
+    @classmethod
+    def _pool(cls) -> ThreadPoolExecutor:
+        with cls._executor_lock:
+            if cls._executor is None:
+                cls._executor = ThreadPoolExecutor(thread_name_prefix="game-llm")
+            return cls._executor
+
+    # ------------------------------------------------------------------
+    # ASYNC
+    # ------------------------------------------------------------------
+    async def acall(self, prompt: Prompt) -> dict:
+        deadline = time.monotonic() + self.timeout
+        attempt = 0
+        while True:
+            try:
+                return await self._aattempt(prompt, deadline)
+            except Exception as e:
+                delay = self._retry_delay(e, attempt, deadline)
+                await asyncio.sleep(delay)
+                attempt += 1
+
+    async def _aattempt(self, prompt: Prompt, deadline: float) -> dict:
+        tasks = {asyncio.ensure_future(_acall(self.client, prompt, deadline))}
+        try:
+            if self._hedging():
+                done, _ = await asyncio.wait(tasks, timeout=min(self.hedge_after, self._remaining(deadline)))
+                if not done:
+                    tasks.add(asyncio.ensure_future(_acall(self.hedge_client, prompt, deadline)))
+
+            error = None
+            while tasks:
+                done, tasks = await asyncio.wait(
+                    tasks, timeout=self._remaining(deadline), return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    break
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    error = task.exception()
+
+            raise error or TimeoutError(f"LLM call exceeded {self.timeout}s deadline")
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    # ------------------------------------------------------------------
+    # HELPERS
+    # ------------------------------------------------------------------
+    def _hedging(self) -> bool:
+        return self.hedge_client is not None and self.hedge_after is not None
+
+    @staticmethod
+    def _remaining(deadline: float) -> float:
+        return max(0.0, deadline - time.monotonic())
+
+    def _retry_delay(self, error: Exception, attempt: int, deadline: float) -> float:
+        """Return how long to wait before retrying, or raise LLMCallError."""
+        if not is_retryable(error):
+            raise LLMCallError(f"LLM call failed: {error!r}") from error
+        if attempt >= self.max_retries:
+            raise LLMCallError(f"LLM call failed after {attempt + 1} attempts: {error!r}") from error
+
+        # Full jitter, but never sooner than the server asked for
+        delay = random.uniform(0, min(self.max_delay, self.base_delay * 2 ** attempt))
+        delay = max(delay, _retry_after(error) or 0.0)
+
+        if delay >= self._remaining(deadline):
+            raise LLMCallError(f"LLM call deadline of {self.timeout}s exceeded: {error!r}") from error
+        return delay
+
+    def __getattr__(self, name):
+        # Expose wrapped client attributes (model, etc.); `client` itself is
+        # missing only before __init__ ran (unpickling, copy)
+        if name == "client":
+            raise AttributeError(name)
+        return getattr(self.client, name)
+
+
+def _call(client, prompt: Prompt, deadline: float):
+    # Runs in a copied context: the deadline stays local to this request
+    set_deadline(deadline)
+    return client(prompt)
+
+
+async def _acall(client, prompt: Prompt, deadline: float):
+    set_deadline(deadline)  # each task has its own context
+    acall = getattr(client, "acall", None)
+    if acall is not None:
+        return await acall(prompt)
+    return await asyncio.to_thread(client, prompt)
@@ -0,0 +1,229 @@
+import asyncio
+import copy
+import hashlib
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+
+from game.config.config import CONFIG
+from game.language.prompt import Prompt
+from game.llm.base_client import BaseLLMClient, FallbackResponse
+from game.llm.streaming import materialize
+
+
+def prompt_fingerprint(prompt: Prompt, model: str | None, **params) -> str:
+    """Stable content hash of everything that determines the LLM's decision."""
+    payload = {
+        "model": model,
+        "system": prompt.system,
+        "messages": prompt.messages,
+        "tools": prompt.tools,
+        "params": params,
+    }
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+    return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+
+@dataclass
+class CacheStats:
+    memory_hits: int = 0
+    disk_hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def hits(self) -> int:
+        return self.memory_hits + self.disk_hits
+
+    @property
+    def hit_rate(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class ResponseCache:
+    """
+    Two-tier (in-memory LRU + on-disk) content-addressed cache.
+
+    Disk entries live at <directory>/<key[:2]>/<key>.json and expire
+    after `ttl_seconds`; the oldest files are evicted once the
+    directory grows past `max_disk_bytes`.
+    """
+
+    def __init__(
+        self,
+        directory: str | None = None,
+        ttl_seconds: float | None = None,
+        max_memory_entries: int | None = None,
+        max_disk_bytes: int | None = None,
+    ):
+        self.directory = directory or CONFIG.cache.directory
+        self.ttl_seconds = ttl_seconds or CONFIG.cache.ttl_seconds
+        self.max_memory_entries = max_memory_entries or CONFIG.cache.max_memory_entries
+        self.max_disk_bytes = max_disk_bytes or CONFIG.cache.max_disk_bytes
+
+        self.stats = CacheStats()
+        self._lock = threading.Lock()
+        self._memory = OrderedDict()  # key -> (created_at, response)
+        self._disk_bytes = None       # computed on first write
+
+    def get(self, key: str):
+        now = time.time()
+
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None and now - entry[0] <= self.ttl_seconds:
+                self._memory.move_to_end(key)
+                self.stats.memory_hits += 1
+                return copy.deepcopy(entry[1])
+
+        entry = self._read_disk(key, now)
+        with self._lock:
+            if entry is None:
+                self.stats.misses += 1
+                return None
+
+            self.stats.disk_hits += 1
+            self._remember(key, entry)
+        return copy.deepcopy(entry[1])
+
+    def put(self, key: str, response):
+        # Streamed arguments are stored as plain text
+        entry = (time.time(), copy.deepcopy(materialize(response)))
+
+        with self._lock:
+            self._remember(key, entry)
+        self._write_disk(key, entry)
+
+    # ------------------------------------------------------------------
+    # MEMORY TIER
+    # ------------------------------------------------------------------
+    def _remember(self, key, entry):
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_memory_entries:
+            self._memory.popitem(last=False)
+            self.stats.evictions += 1
+
+    # ------------------------------------------------------------------
+    # DISK TIER
+    # ------------------------------------------------------------------
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], key + ".json")
+
+    def _read_disk(self, key: str, now: float):
+        try:
+            with open(self._path(key), "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        if now - data["created_at"] > self.ttl_seconds:
+            return None
+        return data["created_at"], data["response"]
+
+    def _write_disk(self, key: str, entry):
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+
+        data = json.dumps({"created_at": entry[0], "response": entry[1]}).encode("utf-8")
+
+        # Write-then-rename so readers never see a partial entry
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+
+        with self._lock:
+            if self._disk_bytes is None:
+                self._disk_bytes = sum(size for _, size, _ in self._disk_entries())
+            else:
+                self._disk_bytes += len(data)
+
+            if self._disk_bytes > self.max_disk_bytes:
+                self._evict_disk()
+
+    def _disk_entries(self):
+        for root, _, files in os.walk(self.directory):
+            for name in files:
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                yield stat.st_mtime, stat.st_size, path
+
+    def _evict_disk(self):
+        # Oldest first, down to 90% of the limit to avoid evicting on every write
+        target = self.max_disk_bytes * 0.9
+        for _, size, path in sorted(self._disk_entries()):
+            if self._disk_bytes <= target:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            self._disk_bytes -= size
+            self.stats.evictions += 1
+
+
+class CachedLLMClient(BaseLLMClient):
+    """
+    Wraps any LLM client with a ResponseCache keyed on the prompt
+    fingerprint (system, messages, tools, model and generation params).
+
+    The model in the key is the one requested (`requested_model`, e.g.
+    a routing client's "routed"), not whichever model served the last
+    call. Fallback responses the client made up are not cached.
+    """
+
+    def __init__(self, client, cache: ResponseCache | None = None):
+        self.client = client
+        self.cache = cache or ResponseCache()
+
+    def __call__(self, prompt: Prompt) -> dict:
+        key = self._key(prompt)
+        response = self.cache.get(key)
+        if response is None:
+            response = self.client(prompt)
+            self._store(key, response)
+        return response
+
+    async def acall(self, prompt: Prompt) -> dict:
+        key = self._key(prompt)
+        response = self.cache.get(key)
+        if response is None:
+            acall = getattr(self.client, "acall", None)
+            if acall is not None:
+                response = await acall(prompt)
+            else:
+                response = await asyncio.to_thread(self.client, prompt)
+            self._store(key, response)
+        return response
+
+    def _store(self, key: str, response):
+        if not isinstance(response, FallbackResponse):
+            self.cache.put(key, response)
+
+    @property
+    def stats(self) -> CacheStats:
+        return self.cache.stats
+
+    def _key(self, prompt: Prompt) -> str:
+        return prompt_fingerprint(
+            prompt,
+            getattr(self.client, "requested_model", None) or getattr(self.client, "model", None),
+            temperature=getattr(self.client, "temperature", None),
+            max_tokens=getattr(self.client, "max_tokens", None),
+            parallel_tool_calls=getattr(self.client, "parallel_tool_calls", None),
+        )
+
+    def __getattr__(self, name):
+        # Expose wrapped client attributes (model, etc.); `client` itself is
+        # missing only before __init__ ran (unpickling, copy)
+        if name == "client":
+            raise AttributeError(name)
+        return getattr(self.client, name)
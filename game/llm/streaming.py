@@ -0,0 +1,500 @@
+import contextvars
+import hashlib
+import io
+import json
+import tempfile
+from contextlib import contextmanager
+
+from game.config.config import CONFIG
+
+
+class StreamedText:
+    """
+    A string argument received from a streamed LLM response.
+
+    Text is buffered in memory until it exceeds `spool_chars`, then
+    spilled to a temporary file, so a large argument (e.g. a full
+    README) never has to exist as one Python string. Tools that
+    declare the argument in `stream_args` receive this object and can
+    copy it to their output with copy_to(); other tools get a str.
+    Close it (or use it as a context manager) to remove the spool file.
+    """
+
+    def __init__(self, spool_chars: int | None = None):
+        self.spool_chars = spool_chars or CONFIG.llm.stream_spool_chars
+        self._parts = []
+        self._file = None
+        self._size = 0
+        self._digest = hashlib.sha256()
+
+    def write(self, text: str):
+        if not text:
+            return
+        self._size += len(text)
+        self._digest.update(text.encode("utf-8", "surrogatepass"))
+
+        if self._file is not None:
+            self._file.write(text)
+            return
+
+        self._parts.append(text)
+        if self._size > self.spool_chars:
+            self._file = tempfile.TemporaryFile("w+", encoding="utf-8")
+            self._file.write("".join(self._parts))
+            self._parts = []
+
+    @property
+    def spilled(self) -> bool:
+        return self._file is not None
+
+    def iter_chunks(self, chunk_chars: int = 64 * 1024):
+        if self._file is None:
+            yield "".join(self._parts)
+            return
+
+        self._file.flush()
+        self._file.seek(0)
+        while True:
+            chunk = self._file.read(chunk_chars)
+            if not chunk:
+                break
+            yield chunk
+
+    def copy_to(self, out) -> int:
+        """Write the text to a text-mode file object; returns UTF-8 bytes written."""
+        written = 0
+        for chunk in self.iter_chunks():
+            out.write(chunk)
+            written += len(chunk.encode("utf-8"))
+        return written
+
+    def getvalue(self) -> str:
+        return "".join(self.iter_chunks())
+
+    def digest(self) -> str:
+        """Hash of the text, without reading back the spool file."""
+        return self._digest.hexdigest()
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __len__(self) -> int:
+        return self._size
+
+    def __str__(self) -> str:
+        # Compact stand-in used when the decision is serialized into memory
+        return f"[streamed text: {self._size} chars]"
+
+    __repr__ = __str__
+
+
+def materialize(value):
+    """Recursively replace StreamedText values with plain strings."""
+    if isinstance(value, StreamedText):
+        return value.getvalue()
+    if isinstance(value, dict):
+        return {k: materialize(v) for k, v in value.items()}
+    if isinstance(value, list):
+        return [materialize(v) for v in value]
+    return value
+
+
+def close_streamed(args: dict):
+    """Close the StreamedText values of a call's args (removes their spool files)."""
+    for value in args.values() if isinstance(args, dict) else ():
+        if isinstance(value, StreamedText):
+            value.close()
+
+
+def call_key(tool_name: str, args: dict) -> str:
+    """
+    Identity of a tool call by content, so the same call streamed again
+    (e.g. after a mid-stream fallback) or parsed from the final response
+    can be matched to one already reported.
+    """
+    return json.dumps([tool_name, args], sort_keys=True, default=_key_part)
+
+
+def _key_part(value) -> str:
+    if isinstance(value, StreamedText):
+        return f"streamed:{value.digest()}"
+    return str(value)
+
+
+# ----------------------------------------------------------------------
+# Incremental argument parser
+# ----------------------------------------------------------------------
+
+_START, _EXPECT_KEY, _AFTER_KEY, _EXPECT_VALUE, _IN_STRING, _IN_RAW, _AFTER_VALUE, _DONE = range(8)
+
+_WHITESPACE = " \t\r\n"
+_SIMPLE_ESCAPES = {'"': '"', "\\": "\\", "/": "/", "b": "\b", "f": "\f", "n": "\n", "r": "\r", "t": "\t"}
+
+
+class ArgumentStreamParser:
+    """
+    Parses a tool call's JSON arguments object as it arrives in chunks.
+
+    Top-level string values are decoded straight into StreamedText
+    buffers; other values (numbers, bools, nested objects/arrays) are
+    buffered raw and decoded with json.loads once complete.
+    """
+
+    def __init__(self, spool_chars: int | None = None):
+        self.spool_chars = spool_chars
+        self.args = {}
+        self.started = False
+
+        self._state = _START
+        self._key = None
+        self._target = None         # io.StringIO (key) or StreamedText (value)
+        self._target_is_key = False
+        self._escape = None         # None | "" | "u..." while decoding an escape
+        self._high_surrogate = None
+
+        self._raw = []              # raw text of a non-string value
+        self._depth = 0
+        self._raw_in_string = False
+        self._raw_escape = False
+
+    @property
+    def done(self) -> bool:
+        return self._state == _DONE
+
+    def feed(self, text: str):
+        i, n = 0, len(text)
+        while i < n:
+            state = self._state
+
+            if state == _IN_STRING:
+                i = self._feed_string(text, i)
+                continue
+
+            if state == _IN_RAW:
+                i = self._feed_raw(text, i)
+                continue
+
+            ch = text[i]
+            if ch in _WHITESPACE:
+                i += 1
+                continue
+
+            if state == _START:
+                self._expect(ch, "{")
+                self.started = True
+                self._state = _EXPECT_KEY
+            elif state == _EXPECT_KEY:
+                if ch == "}" and not self.args:
+                    self._state = _DONE
+                else:
+                    self._expect(ch, '"')
+                    self._begin_string(io.StringIO(), is_key=True)
+            elif state == _AFTER_KEY:
+                self._expect(ch, ":")
+                self._state = _EXPECT_VALUE
+            elif state == _EXPECT_VALUE:
+                if ch == '"':
+                    self._begin_string(StreamedText(self.spool_chars), is_key=False)
+                else:
+                    self._raw, self._depth = [], 0
+                    self._raw_in_string = self._raw_escape = False
+                    self._state = _IN_RAW
+                    continue  # re-read this char as part of the raw value
+            elif state == _AFTER_VALUE:
+                if ch == ",":
+                    self._state = _EXPECT_KEY
+                else:
+                    self._expect(ch, "}")
+                    self._state = _DONE
+            else:  # _DONE
+                raise ValueError(f"Unexpected data after tool arguments: {ch!r}")
+            i += 1
+
+    def finish(self) -> dict:
+        if not self.started:
+            return {}
+        if not self.done:
+            raise ValueError("Tool arguments JSON ended before the object was complete")
+
+        # Small strings never need the spooling wrapper
+        for key, value in self.args.items():
+            if isinstance(value, StreamedText) and not value.spilled:
+                self.args[key] = value.getvalue()
+        return self.args
+
+    # ------------------------------------------------------------------
+    # STRINGS
+    # ------------------------------------------------------------------
+    def _begin_string(self, target, is_key: bool):
+        self._target = target
+        self._target_is_key = is_key
+        self._escape = None
+        self._high_surrogate = None
+        self._state = _IN_STRING
+
+    def _feed_string(self, text: str, i: int) -> int:
+        n = len(text)
+
+        if self._escape is not None:
+            return self._feed_escape(text, i)
+
+        # Fast path: copy everything up to the next quote or backslash
+        quote = text.find('"', i)
+        backslash = text.find("\\", i)
+        j = min(p for p in (quote, backslash, n) if p != -1)
+
+        if j > i:
+            self._emit(text[i:j])
+        if j == n:
+            return n
+
+        if text[j] == "\\":
+            self._escape = ""
+            return j + 1
+
+        self._end_string()
+        return j + 1
+
+    def _feed_escape(self, text: str, i: int) -> int:
+        ch = text[i]
+
+        if self._escape == "":
+            if ch == "u":
+                self._escape = "u"
+                return i + 1
+            if ch not in _SIMPLE_ESCAPES:
+                raise ValueError(f"Invalid escape in tool arguments: \\{ch}")
+            self._escape = None
+            self._emit(_SIMPLE_ESCAPES[ch])
+            return i + 1
+
+        # \uXXXX may be split across chunks
+        self._escape += ch
+        if len(self._escape) < 5:
+            return i + 1
+
+        code = int(self._escape[1:], 16)
+        self._escape = None
+        self._emit_codepoint(code)
+        return i + 1
+
+    def _emit_codepoint(self, code: int):
+        if 0xD800 <= code <= 0xDBFF:
+            self._high_surrogate = code
+            return
+
+        if 0xDC00 <= code <= 0xDFFF and self._high_surrogate is not None:
+            code = 0x10000 + ((self._high_surrogate - 0xD800) << 10) + (code - 0xDC00)
+            self._high_surrogate = None
+            self._target.write(chr(code))
+            return
+
+        self._emit(chr(code))
+
+    def _emit(self, text: str):
+        if self._high_surrogate is not None:
+            # Unpaired surrogate: keep it, as json.loads would
+            self._target.write(chr(self._high_surrogate))
+            self._high_surrogate = None
+        self._target.write(text)
+
+    def _end_string(self):
+        if self._high_surrogate is not None:
+            self._target.write(chr(self._high_surrogate))
+            self._high_surrogate = None
+
+        if self._target_is_key:
+            self._key = self._target.getvalue()
+            self._state = _AFTER_KEY
+        else:
+            self.args[self._key] = self._target
+            self._state = _AFTER_VALUE
+        self._target = None
+
+    # ------------------------------------------------------------------
+    # NON-STRING VALUES
+    # ------------------------------------------------------------------
+    def _feed_raw(self, text: str, i: int) -> int:
+        n = len(text)
+        while i < n:
+            ch = text[i]
+
+            if self._raw_in_string:
+                if self._raw_escape:
+                    self._raw_escape = False
+                elif ch == "\\":
+                    self._raw_escape = True
+                elif ch == '"':
+                    self._raw_in_string = False
+            elif ch == '"':
+                self._raw_in_string = True
+            elif ch in "[{":
+                self._depth += 1
+            elif ch in "]}":
+                if self._depth == 0:
+                    # End of a scalar value; '}' closes the arguments object
+                    self._end_raw()
+                    return i
+                self._depth -= 1
+                if self._depth == 0:
+                    self._raw.append(ch)
+                    self._end_raw()
+                    return i + 1
+            elif ch == "," and self._depth == 0:
+                self._end_raw()
+                return i
+
+            self._raw.append(ch)
+            i += 1
+        return n
+
+    def _end_raw(self):
+        raw = "".join(self._raw).strip()
+        try:
+            self.args[self._key] = json.loads(raw)
+        except json.JSONDecodeError:
+            raise ValueError(f"Invalid value for tool argument '{self._key}': {raw[:100]}")
+        self._raw = []
+        self._state = _AFTER_VALUE
+
+    @staticmethod
+    def _expect(ch: str, expected: str):
+        if ch != expected:
+            raise ValueError(f"Invalid tool arguments JSON: expected {expected!r}, got {ch!r}")
+
+
+# ----------------------------------------------------------------------
+# Tool-call assembly from streamed chunks
+# ----------------------------------------------------------------------
+
+# Hooks of the streamed calls made in the current context (see stream_hooks)
+_hooks = contextvars.ContextVar("game_stream_hooks", default=None)
+
+
+@contextmanager
+def stream_hooks(on_tool_start=None, on_tool_call=None, validate=None):
+    """
+    Install hooks for the streamed LLM calls made inside the block,
+    including those on worker threads or tasks the context is copied to.
+    They replace the client's own hooks, so one client can be shared by
+    agents that each dispatch their own calls. validate(name, args) ->
+    args checks a finished call before on_tool_call sees it and raises
+    ValueError to hold it back.
+    """
+    token = _hooks.set((on_tool_start, on_tool_call, validate))
+    try:
+        yield
+    finally:
+        _hooks.reset(token)
+
+
+class ToolCallAssembler:
+    """
+    Rebuilds tool calls from chat-completion stream chunks.
+
+    - on_tool_start(name) fires as soon as a call's tool name arrives
+    - on_tool_call(invocation) fires as soon as a call's arguments are
+      complete and pass the tool's validator (coerced args), while later
+      calls may still be streaming (early dispatch). Calls whose key is
+      in `emitted` are not reported again; the set is shared by the
+      attempts of one request so a fallback does not repeat them.
+    - usage holds the token usage if the stream reported it (OpenAI
+      style chunk.usage or Groq's chunk.x_groq.usage, on the last chunk)
+
+    Hooks installed with stream_hooks() take precedence over the ones
+    passed here.
+    """
+
+    def __init__(
+        self,
+        tools: list,
+        on_tool_start=None,
+        on_tool_call=None,
+        spool_chars: int | None = None,
+        emitted: set | None = None,
+    ):
+        self.schemas = {
+            tool["function"]["name"]: tool["function"].get("parameters")
+            for tool in tools or []
+        }
+        self.validate = None
+        hooks = _hooks.get()
+        if hooks is not None:
+            on_tool_start, on_tool_call, self.validate = hooks
+        self.on_tool_start = on_tool_start
+        self.on_tool_call = on_tool_call
+        self.spool_chars = spool_chars
+        self.emitted = set() if emitted is None else emitted
+
+        self._calls = {}  # index -> {"tool": name, "parser": ArgumentStreamParser, "emitted": bool}
+        self._validators = {}  # tool name -> validator compiled from the request's schema
+        self.usage = None
+
+    def feed(self, chunk):
+        usage = getattr(chunk, "usage", None) or getattr(getattr(chunk, "x_groq", None), "usage", None)
+        if usage is not None:
+            self.usage = usage
+
+        if not chunk.choices:
+            return
+
+        for delta in chunk.choices[0].delta.tool_calls or []:
+            call = self._calls.get(delta.index)
+            if call is None:
+                call = {"tool": None, "parser": ArgumentStreamParser(self.spool_chars), "emitted": False}
+                self._calls[delta.index] = call
+
+            function = delta.function
+            if function is None:
+                continue
+
+            if function.name and call["tool"] is None:
+                call["tool"] = function.name
+                if self.on_tool_start is not None:
+                    self.on_tool_start(function.name)
+
+            if function.arguments:
+                call["parser"].feed(function.arguments)
+                if call["parser"].done:
+                    self._emit(call)
+
+    def finish(self) -> list:
+        invocations = []
+        for index in sorted(self._calls):
+            call = self._calls[index]
+            invocations.append({"tool": call["tool"], "args": call["parser"].finish()})
+        return invocations
+
+    def _emit(self, call):
+        if call["emitted"] or self.on_tool_call is None:
+            return
+        call["emitted"] = True
+
+        name = call["tool"]
+        try:
+            args = (self.validate or self._validate)(name, call["parser"].finish())
+        except ValueError:
+            return  # not dispatched early; the normal path reports the error
+
+        key = call_key(name, args)
+        if key in self.emitted:
+            return
+        self.emitted.add(key)
+        self.on_tool_call({"tool": name, "args": args})
+
+    def _validate(self, name: str, args: dict) -> dict:
+        validator = self._validators.get(name)
+        if validator is None:
+            # Imported here: the validators depend on this module
+            from game.actions.core.validation import compile_validator
+            if name not in self.schemas:
+                raise ValueError(f"Unknown tool: {name}")
+            validator = self._validators[name] = compile_validator(name, self.schemas[name] or {})
+        return validator(args)
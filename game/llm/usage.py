@@ -0,0 +1,286 @@
+"""
+Token usage capture and cost accounting.
+
+Providers report each completed request with record_usage(). An agent
+wraps its LLM call in capture_usage() to collect those reports (several
+for a hedged call) and files them in the UsageLedger. Each record is
+attributed to a session, step and agent, and its prompt tokens are split
+across the memory entries that made up the prompt. Cost comes from the
+model's ModelSpec prices.
+"""
+import contextvars
+import json
+import threading
+from collections import deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+
+from game.config.config import CONFIG
+from game.llm.model_registry import get_model_spec
+from game.memory.tokens import estimate_message_tokens, estimate_tokens
+from game.tracing.tracer import current_span
+
+_meter = contextvars.ContextVar("game_usage_meter", default=None)
+
+
+@dataclass(slots=True)
+class Usage:
+    model: str | None
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+
+    @property
+    def total_tokens(self) -> int:
+        return self.prompt_tokens + self.completion_tokens
+
+    @property
+    def cost_usd(self) -> float:
+        spec = get_model_spec(self.model) if self.model else None
+        return spec.cost(self.prompt_tokens, self.completion_tokens) if spec else 0.0
+
+
+class UsageMeter:
+    """
+    Usage of every provider request made while capture_usage() is active.
+    Nested meters also report to the enclosing one.
+    """
+
+    def __init__(self, parent: "UsageMeter | None" = None):
+        self.calls = []
+        self.parent = parent
+        self._lock = threading.Lock()  # hedged requests report from two threads
+
+    def add(self, usage: Usage):
+        with self._lock:
+            self.calls.append(usage)
+        if self.parent is not None:
+            self.parent.add(usage)
+
+
+@contextmanager
+def capture_usage():
+    meter = UsageMeter(_meter.get())
+    token = _meter.set(meter)
+    try:
+        yield meter
+    finally:
+        _meter.reset(token)
+
+
+def _field(usage, name: str) -> int:
+    value = usage.get(name) if isinstance(usage, dict) else getattr(usage, name, None)
+    return value or 0
+
+
+def record_usage(model: str | None, usage) -> Usage | None:
+    """
+    Report one provider request: `usage` is the SDK's response.usage
+    (object or dict). Goes to the active UsageMeter and llm.call span.
+    """
+    if usage is None:
+        return None
+
+    recorded = Usage(model, _field(usage, "prompt_tokens"), _field(usage, "completion_tokens"))
+    meter = _meter.get()
+    if meter is not None:
+        meter.add(recorded)
+
+    current_span().set(
+        model=model,
+        prompt_tokens=recorded.prompt_tokens,
+        completion_tokens=recorded.completion_tokens,
+        cost_usd=recorded.cost_usd,
+    )
+    return recorded
+
+
+# ----------------------------------------------------------------------
+# Prompt attribution
+# ----------------------------------------------------------------------
+
+def _decision_tools(content: str) -> list:
+    try:
+        decision = json.loads(content)
+    except (TypeError, ValueError):
+        return []
+    calls = decision if isinstance(decision, list) else [decision]
+    return [call["tool"] for call in calls if isinstance(call, dict) and "tool" in call]
+
+
+class PromptComposition:
+    """
+    Estimated prompt tokens of a memory by source: "task", "decision",
+    "system" messages and "tool:<name>" results. Updated incrementally
+    as the memory grows (like PromptBuilder), recomputed when it is
+    swapped or rewritten.
+    """
+
+    def __init__(self):
+        self._reset(None)
+
+    def _reset(self, memory):
+        self._memory = memory
+        self._revision = getattr(memory, "revision", None)
+        self._count = 0
+        self._last_tools = []
+        self.tokens = {}
+
+    def update(self, memory) -> dict:
+        items = memory.items
+        if (
+            memory is not self._memory
+            or getattr(memory, "revision", None) != self._revision
+            or len(items) < self._count
+        ):
+            self._reset(memory)
+
+        for item in items[self._count:]:
+            tokens = estimate_message_tokens(item)
+            role = item.get("role")
+
+            if self._count == 0:
+                self._add("task", tokens)
+            elif role == "assistant":
+                self._last_tools = _decision_tools(item.get("content"))
+                self._add("decision", tokens)
+            elif role == "user" and self._last_tools:
+                # A step's results: split across the tools that produced them
+                share = tokens / len(self._last_tools)
+                for tool in self._last_tools:
+                    self._add(f"tool:{tool}", share)
+                self._last_tools = []
+            else:
+                self._add(role or "other", tokens)
+            self._count += 1
+
+        return self.tokens
+
+    def _add(self, source: str, tokens: float):
+        self.tokens[source] = self.tokens.get(source, 0) + tokens
+
+
+# ----------------------------------------------------------------------
+# Ledger and reports
+# ----------------------------------------------------------------------
+
+@dataclass(slots=True)
+class UsageRecord:
+    session_id: str
+    agent: str | None
+    step: int
+    model: str | None
+    prompt_tokens: int
+    completion_tokens: int
+    cost_usd: float
+    sources: dict = field(default_factory=dict)   # source -> attributed prompt tokens
+
+
+class _Totals:
+    __slots__ = ("calls", "prompt_tokens", "completion_tokens", "cost_usd")
+
+    def __init__(self):
+        self.calls = 0
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+        self.cost_usd = 0.0
+
+    def add(self, prompt_tokens, completion_tokens, cost_usd):
+        self.calls += 1
+        self.prompt_tokens += prompt_tokens
+        self.completion_tokens += completion_tokens
+        self.cost_usd += cost_usd
+
+
+REPORT_DIMENSIONS = ("session", "agent", "model", "source")
+
+
+class UsageLedger:
+    """
+    Process-wide token and cost accounting.
+
+    Totals per session, agent, model and prompt source are kept for the
+    life of the process; the last `max_records` per-call records are
+    kept for drill-down.
+    """
+
+    def __init__(self, max_records: int | None = None):
+        self.max_records = max_records or CONFIG.usage.max_records
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self._records = deque(maxlen=self.max_records)
+            self._totals = {dimension: {} for dimension in REPORT_DIMENSIONS}
+            self._overall = _Totals()
+
+    def record(self, record: UsageRecord):
+        spec = get_model_spec(record.model) if record.model else None
+        input_price = spec.input_price_per_mtok / 1_000_000 if spec else 0.0
+
+        with self._lock:
+            self._records.append(record)
+            self._overall.add(record.prompt_tokens, record.completion_tokens, record.cost_usd)
+            for dimension, key in (
+                ("session", record.session_id),
+                ("agent", record.agent or "unnamed"),
+                ("model", record.model or "unknown"),
+            ):
+                self._bucket(dimension, key).add(
+                    record.prompt_tokens, record.completion_tokens, record.cost_usd
+                )
+            for source, tokens in record.sources.items():
+                self._bucket("source", source).add(tokens, 0, tokens * input_price)
+
+    def _bucket(self, dimension: str, key: str) -> _Totals:
+        totals = self._totals[dimension].get(key)
+        if totals is None:
+            totals = self._totals[dimension][key] = _Totals()
+        return totals
+
+    def report(self, by: str = "model", top: int | None = 10) -> list:
+        """
+        Top consumers along one dimension ("session", "agent", "model" or
+        "source"), by cost then tokens. "source" rows hold the prompt
+        tokens (and input cost) attributed to each kind of memory entry.
+        """
+        if by not in self._totals:
+            raise ValueError(f"Unknown usage dimension '{by}', expected one of {REPORT_DIMENSIONS}")
+
+        with self._lock:
+            rows = [
+                {
+                    by: key,
+                    "calls": totals.calls,
+                    "prompt_tokens": totals.prompt_tokens,
+                    "completion_tokens": totals.completion_tokens,
+                    "total_tokens": totals.prompt_tokens + totals.completion_tokens,
+                    "cost_usd": totals.cost_usd,
+                }
+                for key, totals in self._totals[by].items()
+            ]
+
+        rows.sort(key=lambda row: (row["cost_usd"], row["total_tokens"]), reverse=True)
+        return rows[:top] if top else rows
+
+    def top_consumers(self, top: int = 5) -> dict:
+        """report() for every dimension."""
+        return {dimension: self.report(dimension, top) for dimension in REPORT_DIMENSIONS}
+
+    def totals(self) -> dict:
+        with self._lock:
+            overall = self._overall
+            return {
+                "calls": overall.calls,
+                "prompt_tokens": overall.prompt_tokens,
+                "completion_tokens": overall.completion_tokens,
+                "total_tokens": overall.prompt_tokens + overall.completion_tokens,
+                "cost_usd": overall.cost_usd,
+            }
+
+    def records(self, session_id: str | None = None) -> list:
+        with self._lock:
+            return [r for r in self._records if session_id is None or r.session_id == session_id]
+
+
+USAGE_LEDGER = UsageLedger()
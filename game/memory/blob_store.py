@@ -0,0 +1,93 @@
+import hashlib
+import os
+import re
+import tempfile
+import threading
+
+from game.config.config import CONFIG
+
+_BLOB_ID = re.compile(r"[0-9a-f]{64}")
+
+
+class BlobStore:
+    """
+    Content-addressed text store: <directory>/<id[:2]>/<id>.txt where
+    id is the SHA-256 of the UTF-8 text. Identical values are stored once.
+    Once the directory grows past `max_bytes`, the least recently stored
+    blobs are evicted. One store (BLOB_STORE) is shared by every agent in
+    the process, so the directory is sized once and evictions agree.
+    """
+
+    def __init__(self, directory: str | None = None, max_bytes: int | None = None):
+        self.directory = directory or CONFIG.results.blob_dir
+        self.max_bytes = max_bytes or CONFIG.results.blob_max_bytes
+
+        self._lock = threading.Lock()
+        self._bytes = None  # computed on first write
+
+    def put(self, text: str) -> str:
+        data = text.encode("utf-8")
+        blob_id = hashlib.sha256(data).hexdigest()
+        path = self.path(blob_id)
+
+        try:
+            os.utime(path)  # stored again: now the most recent
+            return blob_id
+        except OSError:
+            pass
+
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Write-then-rename: readers never see a partial blob
+        fd, tmp = tempfile.mkstemp(dir=os.path.dirname(path))
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+
+        with self._lock:
+            if self._bytes is None:
+                self._bytes = sum(size for _, size, _ in self._entries())
+            else:
+                self._bytes += len(data)
+
+            if self._bytes > self.max_bytes:
+                self._evict(keep=path)
+        return blob_id
+
+    def path(self, blob_id: str) -> str:
+        if not _BLOB_ID.fullmatch(blob_id):
+            raise ValueError(f"Invalid blob id: {blob_id!r}")
+        return os.path.join(self.directory, blob_id[:2], f"{blob_id}.txt")
+
+    def open_path(self, blob_id: str) -> str:
+        """Path of an existing blob (KeyError when it is unknown)."""
+        path = self.path(blob_id)
+        if not os.path.exists(path):
+            raise KeyError(f"Unknown blob: {blob_id}")
+        return path
+
+    def _entries(self):
+        for root, _, files in os.walk(self.directory):
+            for name in files:
+                path = os.path.join(root, name)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                yield stat.st_mtime, stat.st_size, path
+
+    def _evict(self, keep: str):
+        # Oldest first, down to 90% of the limit to avoid evicting on every write
+        target = self.max_bytes * 0.9
+        for _, size, path in sorted(self._entries()):
+            if self._bytes <= target:
+                break
+            if path == keep:
+                continue  # the blob being handed out
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            self._bytes -= size
+
+
+BLOB_STORE = BlobStore()
@@ -1,20 +1,61 @@
 import json
+from collections import deque
+
+# Rewrites kept for edits_since(); older consumers start over
+MAX_LOGGED_REVISIONS = 32
 
 
 class Memory:
     def __init__(self):
         self.items = []
 
+        # Bumped whenever existing items are rewritten (not on append),
+        # so incremental consumers like PromptBuilder can catch up
+        self.revision = 0
+        self._edits = deque(maxlen=MAX_LOGGED_REVISIONS)  # (revision, [edit, ...])
+
+        # Completed agent steps, so a run can be resumed (see Agent.resume_step)
+        self.steps = 0
+
     def add_memory(self, memory: dict):
         """
         Enforce LLM-compatible memory format.
         All message content MUST be a string.
         """
+        self.items.append(self.normalize(memory))
+
+    @staticmethod
+    def normalize(memory: dict) -> dict:
         if "content" in memory and not isinstance(memory["content"], str):
             memory = memory.copy()
-            memory["content"] = json.dumps(memory["content"])
+            # default=str: streamed arguments serialize as a short placeholder
+            memory["content"] = json.dumps(memory["content"], default=str)
+        return memory
+
+    def add_memories(self, memories: list):
+        """Add several messages as one update (e.g. a decision and its results)."""
+        for memory in memories:
+            self.add_memory(memory)
+
+    def end_step(self, step: int):
+        """Mark `step` (0-based) as completed."""
+        self.steps = step + 1
+
+    def rewrite(self, edits: list):
+        """
+        Record a rewrite of existing items as one new revision. Edits are
+        ("replace", index, item) or ("delete", start, stop), in the order
+        they were applied to `items`.
+        """
+        self.revision += 1
+        self._edits.append((self.revision, edits))
 
-        self.items.append(memory)
+    def edits_since(self, revision: int):
+        """Edits applied after `revision`, in order, or None if they are no longer known."""
+        edits = [(rev, batch) for rev, batch in self._edits if rev > revision]
+        if len(edits) != self.revision - revision:
+            return None
+        return [edit for _, batch in edits for edit in batch]
 
     def get_memories(self, limit=None):
         return self.items[:limit]
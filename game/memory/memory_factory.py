@@ -0,0 +1,22 @@
+from game.config.config import CONFIG
+from game.memory.memory import Memory
+from game.memory.persistent_memory import PersistentMemory, PersistentTokenBudgetMemory
+from game.memory.token_budget import TokenBudgetMemory
+
+
+class MemoryFactory:
+
+    @staticmethod
+    def create(model: str | None = None, session_id: str | None = None) -> Memory:
+        strategy = CONFIG.memory.strategy.lower()
+
+        # A session id means durable, resumable memory, with the same strategy
+        if strategy == "unbounded":
+            return PersistentMemory.open(session_id) if session_id else Memory()
+
+        if strategy == "token_budget":
+            if session_id:
+                return PersistentTokenBudgetMemory.open(session_id, model)
+            return TokenBudgetMemory.for_model(model)
+
+        raise ValueError(f"Unsupported memory strategy: {strategy}")
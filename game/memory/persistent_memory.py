@@ -0,0 +1,106 @@
+import os
+
+from game.config.config import CONFIG
+from game.memory.memory import Memory
+from game.memory.session_store import SessionStore, StoredMessages
+from game.memory.token_budget import TokenBudgetMemory
+
+
+def _open_store(session_id: str, directory: str | None) -> SessionStore:
+    directory = directory or CONFIG.memory.session_dir
+    return SessionStore(
+        os.path.join(directory, session_id),
+        fsync=CONFIG.memory.session_fsync,
+    )
+
+
+def _stored_steps(store: SessionStore) -> int:
+    steps = store.steps
+    if steps is None:
+        # Logged before steps were counted: one decision per step
+        steps = sum(1 for message in StoredMessages(store) if message.get("role") == "assistant")
+    return steps
+
+
+class PersistentMemory(Memory):
+    """
+    Memory backed by an append-only SessionStore.
+
+    Every add_memory / add_memories call is committed to disk as one
+    batch, and so is the count of completed steps, so a crashed or
+    cancelled run can be resumed by reopening the same session and
+    passing it to Agent.run(memory=...).
+    """
+
+    def __init__(self, store: SessionStore, session_id: str | None = None):
+        super().__init__()
+        self.store = store
+        self.session_id = session_id
+        self.items = StoredMessages(store)
+        self.steps = _stored_steps(store)
+
+    @classmethod
+    def open(cls, session_id: str, directory: str | None = None) -> "PersistentMemory":
+        return cls(_open_store(session_id, directory), session_id)
+
+    def add_memory(self, memory: dict):
+        self.store.append_many([self.normalize(memory)])
+
+    def add_memories(self, memories: list):
+        self.store.append_many([self.normalize(m) for m in memories])
+
+    def end_step(self, step: int):
+        super().end_step(step)
+        self.store.set_steps(self.steps)
+
+    def get_memories(self, limit=None):
+        return self.items[:limit]
+
+    def close(self):
+        self.store.close()
+
+
+class PersistentTokenBudgetMemory(TokenBudgetMemory):
+    """
+    TokenBudgetMemory over a SessionStore.
+
+    The store keeps every message; `items` is the budgeted window that
+    prompts see, rebuilt (and compacted) from the store when a session
+    is reopened.
+    """
+
+    def __init__(self, store: SessionStore, max_tokens: int, session_id: str | None = None, **kwargs):
+        super().__init__(max_tokens, **kwargs)
+        self.store = store
+        self.session_id = session_id
+
+        for message in StoredMessages(store):
+            super().add_memory(message)
+        self.steps = _stored_steps(store)
+
+    @classmethod
+    def open(
+        cls,
+        session_id: str,
+        model_name: str | None = None,
+        directory: str | None = None,
+        **kwargs,
+    ) -> "PersistentTokenBudgetMemory":
+        store = _open_store(session_id, directory)
+        return cls(store, cls.budget_for(model_name), session_id, **kwargs)
+
+    def add_memory(self, memory: dict):
+        self.add_memories([memory])
+
+    def add_memories(self, memories: list):
+        memories = [self.normalize(m) for m in memories]
+        self.store.append_many(memories)
+        for memory in memories:
+            super().add_memory(memory)
+
+    def end_step(self, step: int):
+        super().end_step(step)
+        self.store.set_steps(self.steps)
+
+    def close(self):
+        self.store.close()
@@ -0,0 +1,82 @@
+import json
+
+from game.config.config import CONFIG
+from game.memory.blob_store import BLOB_STORE, BlobStore
+
+
+class ResultGovernor:
+    """
+    Caps how much of a tool result is stored inline in memory.
+
+    Results that serialize to more than `max_chars` have their largest
+    values moved to the BlobStore, largest first, until the rest fits.
+    Each spilled value is replaced by a handle with a preview; the agent
+    can page through the full value with read_blob / search_blob
+    (tagged "blobs": agents that keep spilled results opt into them).
+    """
+
+    def __init__(self, store: BlobStore | None = None, max_chars: int | None = None, preview_chars: int | None = None):
+        self.store = store or BLOB_STORE
+        self.max_chars = max_chars or CONFIG.results.max_inline_chars
+        self.preview_chars = preview_chars or CONFIG.results.preview_chars
+
+    def govern(self, result, max_chars: int | None = None) -> str:
+        """Serialized result for memory; `max_chars` 0 disables the cap."""
+        text = json.dumps(result, default=str)
+
+        limit = self.max_chars if max_chars is None else max_chars
+        if not limit or len(text) <= limit:
+            return text
+
+        # Work on a plain copy: the tool's own object is left untouched
+        governed = json.loads(text)
+        excess = len(text) - limit
+
+        # Large strings first (keeps the result's structure), then containers
+        candidates = sorted(self._values(governed), key=lambda v: (not isinstance(v[3], str), -v[0]))
+        spilled = set()  # ids of containers already moved to the store
+        for size, container, key, value, enclosing in candidates:
+            if excess <= 0:
+                break
+            if not spilled.isdisjoint(enclosing):
+                continue  # inside a container that is already gone
+            if not isinstance(value, str):
+                size = len(json.dumps(value))  # smaller if values inside it were spilled
+                spilled.add(id(value))
+            handle = self._spill(value)
+            container[key] = handle
+            excess -= size - len(json.dumps(handle))
+
+        text = json.dumps(governed)
+        if len(text) > limit:
+            # Many small values: spill the whole result
+            text = json.dumps(self._spill(governed))
+        return text
+
+    def _values(self, value, depth: int = 0, enclosing: tuple = ()):
+        """
+        (serialized size, container, key, value, ids of the containers
+        enclosing it) for values worth spilling.
+        """
+        items = value.items() if isinstance(value, dict) else enumerate(value)
+        for key, item in items:
+            if isinstance(item, str):
+                if len(item) > self.preview_chars:
+                    yield len(json.dumps(item)), value, key, item, enclosing
+            elif isinstance(item, (dict, list)) and item:
+                size = len(json.dumps(item))
+                if size > self.preview_chars:
+                    yield size, value, key, item, enclosing
+                    if depth < 2:
+                        yield from self._values(item, depth + 1, enclosing + (id(item),))
+
+    def _spill(self, value) -> dict:
+        # Strings are stored verbatim; structures one item per line, so
+        # read_blob/search_blob can page and grep them
+        text = value if isinstance(value, str) else json.dumps(value, indent=1, default=str)
+        return {
+            "blob_id": self.store.put(text),
+            "chars": len(text),
+            "preview": text[:self.preview_chars],
+            "note": "Truncated; use read_blob or search_blob with blob_id for the rest",
+        }
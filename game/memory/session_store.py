@@ -0,0 +1,148 @@
+import json
+import os
+import struct
+from array import array
+from collections.abc import Sequence
+
+_LENGTH = struct.Struct("<I")   # record header: payload length
+_OFFSET_SIZE = 8                # index entry: 8-byte little-endian offset
+_STEPS = struct.Struct("<Q")    # step counter: completed agent steps
+
+
+class SessionStore:
+    """
+    Append-only on-disk log of memory messages for one session.
+
+    <session>.log : records = 4-byte length + UTF-8 JSON payload
+    <session>.idx : one 8-byte offset per committed record
+    <session>.step: 8-byte count of completed agent steps
+
+    A batch is committed only once its index entries are written, so a
+    crash mid-write leaves a torn tail that is discarded on the next open.
+    Opening reads only the offset index; records are decoded on access.
+    """
+
+    def __init__(self, path_prefix: str, fsync: bool = False):
+        self.log_path = path_prefix + ".log"
+        self.idx_path = path_prefix + ".idx"
+        self.step_path = path_prefix + ".step"
+        self.fsync = fsync
+
+        directory = os.path.dirname(self.log_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+        flags = os.O_RDWR | os.O_CREAT
+        self._log_fd = os.open(self.log_path, flags, 0o644)
+        self._idx_fd = os.open(self.idx_path, flags, 0o644)
+        self._step_fd = os.open(self.step_path, flags, 0o644)
+
+        self._offsets = array("Q")
+        self._end = 0
+        self._recover()
+
+    # ------------------------------------------------------------------
+    # READ
+    # ------------------------------------------------------------------
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    @property
+    def steps(self) -> int | None:
+        """Completed agent steps; None for a log written without a step counter."""
+        data = os.pread(self._step_fd, _STEPS.size, 0)
+        if len(data) < _STEPS.size:
+            return None if len(self) else 0
+        return _STEPS.unpack(data)[0]
+
+    def read(self, index: int) -> dict:
+        offset = self._offsets[index]
+        (length,) = _LENGTH.unpack(os.pread(self._log_fd, _LENGTH.size, offset))
+        payload = os.pread(self._log_fd, length, offset + _LENGTH.size)
+        return json.loads(payload)
+
+    # ------------------------------------------------------------------
+    # WRITE
+    # ------------------------------------------------------------------
+    def append_many(self, messages: list):
+        """Append messages as one atomic batch."""
+        records = bytearray()
+        offsets = array("Q")
+
+        for message in messages:
+            payload = json.dumps(message, ensure_ascii=False).encode("utf-8")
+            offsets.append(self._end + len(records))
+            records += _LENGTH.pack(len(payload))
+            records += payload
+
+        # Data first, index second → the index never points at partial data
+        os.pwrite(self._log_fd, bytes(records), self._end)
+        if self.fsync:
+            os.fsync(self._log_fd)
+
+        os.pwrite(self._idx_fd, offsets.tobytes(), len(self._offsets) * _OFFSET_SIZE)
+        if self.fsync:
+            os.fsync(self._idx_fd)
+
+        self._offsets.extend(offsets)
+        self._end += len(records)
+
+    def set_steps(self, steps: int):
+        # One 8-byte write: the counter is either old or new, never torn
+        os.pwrite(self._step_fd, _STEPS.pack(steps), 0)
+        if self.fsync:
+            os.fsync(self._step_fd)
+
+    def close(self):
+        os.close(self._log_fd)
+        os.close(self._idx_fd)
+        os.close(self._step_fd)
+
+    # ------------------------------------------------------------------
+    # RECOVERY
+    # ------------------------------------------------------------------
+    def _recover(self):
+        idx_size = os.fstat(self._idx_fd).st_size
+        idx_size -= idx_size % _OFFSET_SIZE
+        self._offsets.frombytes(os.pread(self._idx_fd, idx_size, 0))
+
+        log_size = os.fstat(self._log_fd).st_size
+
+        # Drop index entries whose record is not fully on disk
+        while self._offsets:
+            end = self._record_end(self._offsets[-1], log_size)
+            if end is not None:
+                self._end = end
+                break
+            self._offsets.pop()
+
+        # Discard any torn tail past the last committed record
+        os.ftruncate(self._idx_fd, len(self._offsets) * _OFFSET_SIZE)
+        os.ftruncate(self._log_fd, self._end)
+
+    def _record_end(self, offset: int, log_size: int):
+        if offset + _LENGTH.size > log_size:
+            return None
+        (length,) = _LENGTH.unpack(os.pread(self._log_fd, _LENGTH.size, offset))
+        end = offset + _LENGTH.size + length
+        return end if end <= log_size else None
+
+
+class StoredMessages(Sequence):
+    """Read-only list view over a SessionStore; records are decoded on access."""
+
+    def __init__(self, store: SessionStore):
+        self.store = store
+
+    def __len__(self) -> int:
+        return len(self.store)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self.store.read(i) for i in range(*index.indices(len(self)))]
+
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("message index out of range")
+        return self.store.read(index)
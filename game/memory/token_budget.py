@@ -0,0 +1,129 @@
+from typing import Callable, Optional
+
+from game.config.config import CONFIG
+from game.llm.model_registry import get_model_spec
+from game.memory.memory import Memory
+from game.memory.tokens import estimate_message_tokens
+
+
+class TokenBudgetMemory(Memory):
+    """
+    Memory that keeps the prompt within a token budget.
+
+    - items[0] (the original task) is always kept verbatim
+    - the last `keep_recent` items are always kept verbatim
+    - older tool results are compacted into summaries/stubs first,
+      then the oldest messages are dropped if still over budget
+
+    Token counts are tracked per item as messages are added, so a
+    step never re-scans the whole history to know the total.
+    """
+
+    def __init__(
+        self,
+        max_tokens: int,
+        keep_recent: int | None = None,
+        stub_chars: int | None = None,
+        summarizer: Optional[Callable[[dict], str]] = None,
+    ):
+        super().__init__()
+        self.max_tokens = max_tokens
+        self.keep_recent = keep_recent or CONFIG.memory.keep_recent
+        self.stub_chars = stub_chars or CONFIG.memory.stub_chars
+        self.summarizer = summarizer
+
+        self.total_tokens = 0
+        self._tokens = []        # per-item token estimate, parallel to items
+        self._compacted = []     # per-item flag, parallel to items
+        self._next_candidate = 1 # items before this index are already compacted
+
+    @staticmethod
+    def budget_for(model_name: str | None) -> int:
+        """
+        Budget = model context window (ModelSpec.max_tokens)
+                 minus completion tokens and system/tool-schema overhead.
+        """
+        spec = get_model_spec(model_name) if model_name else None
+        context = spec.max_tokens if spec else CONFIG.memory.default_context_tokens
+        reserve = CONFIG.llm.max_tokens + CONFIG.memory.reserve_tokens
+
+        return max(context - reserve, CONFIG.memory.min_budget_tokens)
+
+    @classmethod
+    def for_model(cls, model_name: str | None, **kwargs) -> "TokenBudgetMemory":
+        return cls(cls.budget_for(model_name), **kwargs)
+
+    def add_memory(self, memory: dict):
+        super().add_memory(memory)
+
+        tokens = estimate_message_tokens(self.items[-1])
+        self._tokens.append(tokens)
+        self._compacted.append(False)
+        self.total_tokens += tokens
+
+        if self.total_tokens > self.max_tokens:
+            self.compact()
+
+    def compact(self):
+        """Bring total_tokens back under max_tokens (best effort)."""
+        edits = []
+        self._compact_tool_results(edits)
+
+        if self.total_tokens > self.max_tokens:
+            self._drop_oldest(edits)
+
+        if edits:
+            # Logged so PromptBuilder patches its prefix instead of starting over
+            self.rewrite(edits)
+
+    # ------------------------------------------------------------------
+    # COMPACTION STEPS
+    # ------------------------------------------------------------------
+    def _window_start(self) -> int:
+        return max(1, len(self.items) - self.keep_recent)
+
+    def _compact_tool_results(self, edits: list):
+        end = self._window_start()
+
+        i = self._next_candidate
+        while i < end and self.total_tokens > self.max_tokens:
+            item = self.items[i]
+            if not self._compacted[i] and item.get("role") == "user":
+                stub = dict(item, content=self._summarize(item, self._tokens[i]))
+                tokens = estimate_message_tokens(stub)
+
+                if tokens < self._tokens[i]:
+                    self.items[i] = stub
+                    self.total_tokens += tokens - self._tokens[i]
+                    self._tokens[i] = tokens
+                    edits.append(("replace", i, stub))
+
+            self._compacted[i] = True
+            i += 1
+
+        self._next_candidate = i
+
+    def _drop_oldest(self, edits: list):
+        # Drop the oldest unpinned items outside the recent window
+        end = self._window_start()
+        drop = 0
+        while 1 + drop < end and self.total_tokens > self.max_tokens:
+            self.total_tokens -= self._tokens[1 + drop]
+            drop += 1
+
+        if not drop:
+            return
+
+        del self.items[1:1 + drop]
+        del self._tokens[1:1 + drop]
+        del self._compacted[1:1 + drop]
+        self._next_candidate = max(1, self._next_candidate - drop)
+        edits.append(("delete", 1, 1 + drop))
+
+    def _summarize(self, item: dict, tokens: int) -> str:
+        if self.summarizer is not None:
+            return self.summarizer(item)
+
+        content = item.get("content") or ""
+        preview = content[:self.stub_chars]
+        return f"[compacted: ~{tokens} tokens] {preview}…"
@@ -0,0 +1,13 @@
+# Cheap token estimation (no tokenizer dependency).
+# ~4 characters per token is close enough for budgeting English/code prompts.
+
+CHARS_PER_TOKEN = 4
+MESSAGE_OVERHEAD_TOKENS = 4  # role + framing per chat message
+
+
+def estimate_tokens(text: str) -> int:
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+def estimate_message_tokens(message: dict) -> int:
+    return MESSAGE_OVERHEAD_TOKENS + estimate_tokens(message.get("content") or "")
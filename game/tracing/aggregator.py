@@ -0,0 +1,83 @@
+import threading
+from collections import deque
+
+from game.config.config import CONFIG
+
+
+class _SpanStats:
+    __slots__ = ("count", "errors", "total_ms", "max_ms", "recent", "totals")
+
+    def __init__(self, window: int):
+        self.count = 0
+        self.errors = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+        self.recent = deque(maxlen=window)
+        self.totals = {}  # numeric attribute -> sum (tokens, bytes, ...)
+
+
+def _percentile(ordered: list, fraction: float) -> float:
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+class SpanAggregator:
+    """
+    In-process span processor: count, errors, mean / p50 / p95 / max
+    duration per span name, plus running sums of numeric attributes.
+    Percentiles cover the last `window` spans of each name.
+    """
+
+    def __init__(self, window: int | None = None):
+        self.window = window or CONFIG.tracing.aggregate_window
+        self._stats = {}
+        self._lock = threading.Lock()
+
+    def on_end(self, span):
+        duration = span.duration_ms
+        with self._lock:
+            stats = self._stats.get(span.name)
+            if stats is None:
+                stats = self._stats[span.name] = _SpanStats(self.window)
+
+            stats.count += 1
+            stats.total_ms += duration
+            stats.max_ms = max(stats.max_ms, duration)
+            stats.recent.append(duration)
+            if span.error is not None:
+                stats.errors += 1
+
+            for key, value in span.attributes.items():
+                if isinstance(value, (int, float)) and not isinstance(value, bool):
+                    stats.totals[key] = stats.totals.get(key, 0) + value
+
+    def summary(self) -> dict:
+        """{span name: {count, errors, mean_ms, p50_ms, p95_ms, max_ms, totals}}"""
+        with self._lock:
+            result = {}
+            for name, stats in self._stats.items():
+                ordered = sorted(stats.recent)
+                result[name] = {
+                    "count": stats.count,
+                    "errors": stats.errors,
+                    "mean_ms": stats.total_ms / stats.count,
+                    "p50_ms": _percentile(ordered, 0.5),
+                    "p95_ms": _percentile(ordered, 0.95),
+                    "max_ms": stats.max_ms,
+                    "totals": dict(stats.totals),
+                }
+            return result
+
+    def report(self) -> str:
+        lines = [f"{'span':<20} {'count':>7} {'errors':>6} {'mean ms':>9} {'p50 ms':>9} {'p95 ms':>9} {'max ms':>9}"]
+        for name, row in sorted(self.summary().items()):
+            lines.append(
+                f"{name:<20} {row['count']:>7} {row['errors']:>6} {row['mean_ms']:>9.2f}"
+                f" {row['p50_ms']:>9.2f} {row['p95_ms']:>9.2f} {row['max_ms']:>9.2f}"
+            )
+        return "\n".join(lines)
+
+    def reset(self):
+        with self._lock:
+            self._stats.clear()
@@ -0,0 +1,39 @@
+import logging
+import reprlib
+
+from game.config.config import CONFIG
+
+
+class Preview:
+    """
+    Lazily formatted, size-capped log argument.
+
+    logger.info("Result: %s", Preview(result)) only formats the value if
+    the record is emitted, and never renders more than `limit` characters
+    of nested containers.
+    """
+
+    __slots__ = ("value", "limit")
+
+    def __init__(self, value, limit: int | None = None):
+        self.value = value
+        self.limit = limit or CONFIG.tracing.log_max_chars
+
+    def __str__(self) -> str:
+        value = self.value
+        if not isinstance(value, str):
+            renderer = reprlib.Repr()
+            renderer.maxstring = renderer.maxother = self.limit
+            renderer.maxdict = renderer.maxlist = renderer.maxlevel = 20
+            value = renderer.repr(value)
+        if len(value) > self.limit:
+            return f"{value[:self.limit]}... [{len(value) - self.limit} more chars]"
+        return value
+
+
+def configure_logging(level: str | None = None):
+    """Plain console logging for the CLI (CONFIG.tracing.log_level by default)."""
+    logging.basicConfig(
+        level=(level or CONFIG.tracing.log_level).upper(),
+        format="%(message)s",
+    )
@@ -0,0 +1,83 @@
+import json
+import os
+import threading
+
+from game.config.config import CONFIG
+
+
+def _attribute_value(value) -> dict:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}  # int64 is a string in OTLP/JSON
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def _attributes(values: dict) -> list:
+    return [{"key": key, "value": _attribute_value(value)} for key, value in values.items()]
+
+
+def _otlp_span(span) -> dict:
+    encoded = {
+        "traceId": span.trace_id,
+        "spanId": span.span_id,
+        "name": span.name,
+        "kind": 1,  # SPAN_KIND_INTERNAL
+        "startTimeUnixNano": str(span.start_ns),
+        "endTimeUnixNano": str(span.end_ns),
+        "attributes": _attributes(span.attributes),
+        "status": {"code": 2, "message": span.error} if span.error else {"code": 1},
+    }
+    if span.parent_id:
+        encoded["parentSpanId"] = span.parent_id
+    return encoded
+
+
+class OTLPJsonExporter:
+    """
+    Span processor that appends finished spans to a local file.
+
+    Each line is an OTLP/JSON ExportTraceServiceRequest, the payload an
+    OpenTelemetry collector accepts on /v1/traces, so the file can be
+    replayed into any OTLP backend (or read by the collector's
+    otlpjsonfile receiver). Spans are written in batches.
+    """
+
+    def __init__(self, path: str, service_name: str | None = None, batch_size: int | None = None):
+        self.path = path
+        self.service_name = service_name or CONFIG.tracing.service_name
+        self.batch_size = batch_size or CONFIG.tracing.export_batch_size
+        self._pending = []
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def on_end(self, span):
+        with self._lock:
+            self._pending.append(_otlp_span(span))
+            if len(self._pending) < self.batch_size:
+                return
+            batch, self._pending = self._pending, []
+        self._write(batch)
+
+    def flush(self):
+        with self._lock:
+            batch, self._pending = self._pending, []
+        if batch:
+            self._write(batch)
+
+    def _write(self, spans: list):
+        request = {
+            "resourceSpans": [{
+                "resource": {"attributes": _attributes({"service.name": self.service_name})},
+                "scopeSpans": [{"scope": {"name": "game"}, "spans": spans}],
+            }]
+        }
+        line = json.dumps(request, separators=(",", ":")) + "\n"
+        with self._write_lock, open(self.path, "a", encoding="utf-8") as f:
+            f.write(line)
@@ -0,0 +1,170 @@
+import contextvars
+import os
+import threading
+import time
+from types import MappingProxyType
+
+from game.config.config import CONFIG
+
+
+class Span:
+    """One timed operation of a run (prompt build, LLM call, tool call, ...)."""
+
+    __slots__ = ("name", "trace_id", "span_id", "parent_id", "start_ns", "end_ns", "attributes", "error")
+
+    def __init__(self, name: str, trace_id: str, parent_id: str | None, attributes: dict):
+        self.name = name
+        self.trace_id = trace_id
+        self.span_id = os.urandom(8).hex()
+        self.parent_id = parent_id
+        self.start_ns = time.time_ns()
+        self.end_ns = None
+        self.attributes = attributes
+        self.error = None
+
+    @property
+    def duration_ms(self) -> float:
+        end = self.end_ns if self.end_ns is not None else time.time_ns()
+        return (end - self.start_ns) / 1e6
+
+    def set(self, **attributes):
+        """Add attributes; None values are skipped."""
+        for key, value in attributes.items():
+            if value is not None:
+                self.attributes[key] = value
+
+
+class _NoopSpan:
+    """Returned while tracing is off, so instrumented code needs no checks."""
+
+    __slots__ = ()
+    name = None
+    attributes = MappingProxyType({})
+
+    def set(self, **attributes):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+NOOP_SPAN = _NoopSpan()
+
+_current = contextvars.ContextVar("game_current_span", default=None)
+
+
+def current_span():
+    """The innermost open span of this thread / task (NOOP_SPAN if none)."""
+    return _current.get() or NOOP_SPAN
+
+
+class _SpanScope:
+    __slots__ = ("tracer", "span", "token")
+
+    def __init__(self, tracer, span):
+        self.tracer = tracer
+        self.span = span
+        self.token = None
+
+    def __enter__(self) -> Span:
+        self.token = _current.set(self.span)
+        return self.span
+
+    def __exit__(self, exc_type, exc, tb):
+        _current.reset(self.token)
+        span = self.span
+        span.end_ns = time.time_ns()
+        if exc is not None:
+            span.error = f"{exc_type.__name__}: {exc}"
+        self.tracer._finish(span)
+        return False
+
+
+class Tracer:
+    """
+    Creates spans and hands finished ones to processors.
+
+    A processor is any object with on_end(span) and, optionally, flush()
+    (see SpanAggregator and OTLPJsonExporter). Spans nest through a
+    context variable, so threads and asyncio tasks each keep their own
+    parent. Without processors span() returns NOOP_SPAN.
+    """
+
+    def __init__(self, processors=None):
+        self.processors = list(processors or [])
+        self._lock = threading.Lock()
+
+    def add_processor(self, processor):
+        with self._lock:
+            self.processors = [*self.processors, processor]
+
+    def span(self, name: str, **attributes):
+        if not self.processors:
+            return NOOP_SPAN
+
+        parent = _current.get()
+        trace_id = parent.trace_id if parent is not None else os.urandom(16).hex()
+        parent_id = parent.span_id if parent is not None else None
+        span = Span(name, trace_id, parent_id, {k: v for k, v in attributes.items() if v is not None})
+        return _SpanScope(self, span)
+
+    def _finish(self, span: Span):
+        for processor in self.processors:
+            try:
+                processor.on_end(span)
+            except Exception:
+                pass  # instrumentation must never break a run
+
+    def flush(self):
+        for processor in self.processors:
+            flush = getattr(processor, "flush", None)
+            if flush is not None:
+                flush()
+
+
+_tracer = None
+_tracer_lock = threading.Lock()
+
+
+def get_tracer() -> Tracer:
+    """Process-wide tracer, configured from CONFIG.tracing on first use."""
+    global _tracer
+    if _tracer is None:
+        with _tracer_lock:
+            if _tracer is None:
+                _tracer = _build_tracer()
+    return _tracer
+
+
+def set_tracer(tracer: Tracer):
+    """Replace the process-wide tracer (e.g. with custom processors)."""
+    global _tracer
+    with _tracer_lock:
+        _tracer = tracer
+
+
+def _build_tracer() -> Tracer:
+    settings = CONFIG.tracing
+    if not settings.enabled:
+        return Tracer()
+
+    from game.tracing.aggregator import SpanAggregator
+    processors = [SpanAggregator()]
+
+    if settings.export_path:
+        import atexit
+        from game.tracing.otlp_exporter import OTLPJsonExporter
+        exporter = OTLPJsonExporter(settings.export_path)
+        atexit.register(exporter.flush)
+        processors.append(exporter)
+
+    return Tracer(processors)
+
+
+def get_aggregator():
+    """The SpanAggregator of the process-wide tracer (None if tracing is off)."""
+    from game.tracing.aggregator import SpanAggregator
+    return next((p for p in get_tracer().processors if isinstance(p, SpanAggregator)), None)
@@ -0,0 +1,256 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import defaultdict
+
+from game.config.config import CONFIG
+from game.workspace.walker import walk
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    id       INTEGER PRIMARY KEY,
+    path     TEXT UNIQUE NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    size     INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS postings (
+    trigram INTEGER NOT NULL,
+    file_id INTEGER NOT NULL,
+    PRIMARY KEY (trigram, file_id)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS postings_by_file ON postings (file_id);
+"""
+
+_BINARY_SNIFF_BYTES = 8192
+
+
+def trigrams(data: bytes) -> set:
+    """Distinct byte trigrams of `data`, packed into ints."""
+    return {(a << 16) | (b << 8) | c for a, b, c in set(zip(data, data[1:], data[2:]))}
+
+
+class TrigramIndex:
+    """
+    On-disk trigram index of the text files under `root`.
+
+    Each file's distinct (lower-cased) trigrams are stored in SQLite.
+    A query only opens the files whose postings contain every trigram
+    of a term; those are then scanned to produce file:line hits.
+    refresh() re-indexes only files whose mtime or size changed.
+    """
+
+    _instances = {}
+    _instances_lock = threading.Lock()
+
+    def __init__(self, root: str, db_path: str | None = None):
+        self.root = os.path.abspath(root)
+        self.settings = CONFIG.search
+
+        if db_path is None:
+            os.makedirs(self.settings.index_dir, exist_ok=True)
+            key = hashlib.sha256(self.root.encode("utf-8")).hexdigest()[:16]
+            db_path = os.path.join(self.settings.index_dir, f"{key}.sqlite")
+
+        self._lock = threading.Lock()
+        self._last_refresh = 0.0
+        self._skipped = {}  # binary/unreadable path -> (mtime_ns, size) when last read
+        self._conn = sqlite3.connect(db_path, timeout=30, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+    @classmethod
+    def for_root(cls, root: str) -> "TrigramIndex":
+        """Shared index per workspace root (one SQLite connection per process)."""
+        root = os.path.abspath(root)
+        with cls._instances_lock:
+            index = cls._instances.get(root)
+            if index is None:
+                index = cls._instances[root] = cls(root)
+            return index
+
+    def close(self):
+        self._conn.close()
+
+    # ------------------------------------------------------------------
+    # INDEXING
+    # ------------------------------------------------------------------
+    def refresh(self, force: bool = False) -> dict:
+        """Bring the index up to date; returns counts of updated and removed files."""
+        with self._lock:
+            now = time.monotonic()
+            if not force and now - self._last_refresh < self.settings.refresh_interval_seconds:
+                return {"updated": 0, "removed": 0}
+
+            known = {
+                path: (file_id, mtime_ns, size)
+                for file_id, path, mtime_ns, size in self._conn.execute(
+                    "SELECT id, path, mtime_ns, size FROM files"
+                )
+            }
+
+            updated = 0
+            skipped = {}
+            with self._conn:
+                for path, stat in self._iter_files():
+                    state = (stat.mtime_ns, stat.size)
+                    entry = known.pop(path, None)
+                    if entry and entry[1:] == state:
+                        continue
+                    if self._skipped.get(path) == state:
+                        skipped[path] = state  # unchanged binary file: not read again
+                        continue
+                    if self._index_file(path, stat, entry[0] if entry else None):
+                        updated += 1
+                    else:
+                        skipped[path] = state
+
+                # Deleted files, plus files that grew too large or turned binary
+                for file_id, _, _ in known.values():
+                    self._remove(file_id)
+
+            self._skipped = skipped
+            self._last_refresh = time.monotonic()
+            return {"updated": updated, "removed": len(known)}
+
+    def _iter_files(self):
+        for entry in walk(self.root):
+            if entry.size <= self.settings.max_file_bytes:
+                yield entry.path, entry
+
+    def _index_file(self, path: str, stat, file_id: int | None) -> bool:
+        data = self._read(path)
+
+        if file_id is not None:
+            self._remove(file_id)
+        if data is None:
+            return False
+
+        cursor = self._conn.execute(
+            "INSERT INTO files (path, mtime_ns, size) VALUES (?, ?, ?)",
+            (path, stat.mtime_ns, stat.size),
+        )
+        self._conn.executemany(
+            "INSERT INTO postings (trigram, file_id) VALUES (?, ?)",
+            ((trigram, cursor.lastrowid) for trigram in trigrams(data.lower())),
+        )
+        return True
+
+    def _remove(self, file_id: int):
+        self._conn.execute("DELETE FROM postings WHERE file_id = ?", (file_id,))
+        self._conn.execute("DELETE FROM files WHERE id = ?", (file_id,))
+
+    def _read(self, path: str) -> bytes | None:
+        """File bytes, or None for unreadable and binary files."""
+        try:
+            with open(os.path.join(self.root, path), "rb") as f:
+                data = f.read(self.settings.max_file_bytes + 1)
+        except OSError:
+            return None
+        if len(data) > self.settings.max_file_bytes or b"\0" in data[:_BINARY_SNIFF_BYTES]:
+            return None
+        return data
+
+    # ------------------------------------------------------------------
+    # QUERYING
+    # ------------------------------------------------------------------
+    def search(self, query: str, max_results: int | None = None, case_sensitive: bool = False) -> dict:
+        """
+        Lines containing any whitespace-separated term of `query`.
+        Hits are ranked by how many distinct terms the line contains,
+        then by how many terms (and matching lines) its file has.
+        """
+        terms = list(dict.fromkeys(query.split()))
+        if not terms:
+            raise ValueError("query must contain at least one term")
+        max_results = max_results or self.settings.max_results
+
+        self.refresh()
+
+        with self._lock:
+            candidates = defaultdict(set)  # path -> indexes of terms it may contain
+            for i, term in enumerate(terms):
+                # bytes.lower(): same ASCII-only folding used when indexing
+                for path in self._candidates(term.encode("utf-8").lower()):
+                    candidates[path].add(i)
+
+        hits = []
+        for path, term_ids in candidates.items():
+            hits.extend(self._scan(path, [(i, terms[i]) for i in sorted(term_ids)], case_sensitive))
+
+        # (score, file_rank, path, line, text); best first
+        hits.sort(key=lambda hit: (-hit[0], -hit[1], hit[2], hit[3]))
+
+        return {
+            "query": query,
+            "hits": [
+                {"file": path, "line": line, "text": text, "score": score}
+                for score, _, path, line, text in hits[:max_results]
+            ],
+            "total_hits": len(hits),
+            "files_matched": len({hit[2] for hit in hits}),
+            "truncated": len(hits) > max_results,
+        }
+
+    def _candidates(self, needle: bytes):
+        grams = trigrams(needle)
+        if not grams:
+            # Shorter than a trigram: every file is a candidate
+            return [path for (path,) in self._conn.execute("SELECT path FROM files")]
+
+        # One JSON parameter: a long term has more trigrams than SQLite allows variables
+        rows = self._conn.execute(
+            """
+            SELECT f.path FROM postings p JOIN files f ON f.id = p.file_id
+            WHERE p.trigram IN (SELECT value FROM json_each(?))
+            GROUP BY p.file_id HAVING COUNT(*) = ?
+            """,
+            (json.dumps(sorted(grams)), len(grams)),
+        )
+        return [path for (path,) in rows]
+
+    def _scan(self, path: str, terms: list, case_sensitive: bool) -> list:
+        data = self._read(path)
+        if data is None:
+            return []
+        haystack = data if case_sensitive else data.lower()
+
+        line_terms = defaultdict(set)   # line start offset -> matched term ids
+        for term_id, term in terms:
+            needle = term.encode("utf-8")
+            if not case_sensitive:
+                needle = needle.lower()
+
+            # Every term is counted before capping, so line scores are exact
+            pos = haystack.find(needle)
+            while pos != -1:
+                start = haystack.rfind(b"\n", 0, pos) + 1
+                line_terms[start].add(term_id)
+                end = haystack.find(b"\n", pos)
+                if end == -1:
+                    break
+                pos = haystack.find(needle, end + 1)
+
+        if not line_terms:
+            return []
+
+        file_rank = len(set().union(*line_terms.values())) * 1000 + len(line_terms)
+        max_hits = self.settings.max_hits_per_file
+        if len(line_terms) > max_hits:
+            # Keep the lines matching the most terms
+            best = sorted(line_terms, key=lambda start: (-len(line_terms[start]), start))[:max_hits]
+            line_terms = {start: line_terms[start] for start in best}
+
+        max_chars = CONFIG.files.max_line_chars
+
+        hits, line, counted = [], 1, 0
+        for start in sorted(line_terms):
+            line += data.count(b"\n", counted, start)
+            counted = start
+            end = data.find(b"\n", start)
+            text = data[start:end if end != -1 else len(data)].decode("utf-8", errors="replace").strip()
+            hits.append((len(line_terms[start]), file_rank, path, line, text[:max_chars]))
+        return hits
@@ -0,0 +1,223 @@
+"""
+Lazy, filtered directory walking on os.scandir.
+
+Entries are yielded depth-first as they are found; one sorted listing
+is held per directory level being walked, so the order is stable and a
+walk can resume after any entry (see `after`).
+"""
+import fnmatch
+import os
+import re
+from dataclasses import dataclass
+from typing import Iterator, List, Optional
+
+from game.config.config import CONFIG
+
+
+@dataclass(frozen=True)
+class WalkEntry:
+    path: str          # relative to the walk root, "/"-separated
+    full_path: str
+    is_dir: bool
+    size: int
+    mtime_ns: int
+    depth: int         # 1 for entries directly under the root
+
+
+# ----------------------------------------------------------------------
+# Glob / .gitignore patterns
+# ----------------------------------------------------------------------
+
+def glob_to_regex(pattern: str) -> str:
+    """Translate a path glob (with ** support) to a regex."""
+    out, i, n = [], 0, len(pattern)
+    while i < n:
+        if pattern.startswith("**/", i):
+            out.append("(?:.*/)?")
+            i += 3
+        elif pattern.startswith("**", i):
+            out.append(".*")
+            i += 2
+        elif pattern[i] == "*":
+            out.append("[^/]*")
+            i += 1
+        elif pattern[i] == "?":
+            out.append("[^/]")
+            i += 1
+        elif pattern[i] == "[":
+            end = pattern.find("]", i + 2)
+            if end == -1:
+                out.append(re.escape("["))
+                i += 1
+                continue
+            body = pattern[i + 1:end]
+            if body.startswith("!"):
+                body = "^" + body[1:]
+            out.append(f"[{body}]")
+            i = end + 1
+        else:
+            out.append(re.escape(pattern[i]))
+            i += 1
+    return "".join(out)
+
+
+class IgnoreRules:
+    """Patterns from one .gitignore file, matched relative to its directory."""
+
+    def __init__(self, lines: List[str]):
+        self.rules = []  # (regex, negate, dir_only)
+        for line in lines:
+            line = line.rstrip("\n").rstrip()
+            if not line or line.startswith("#"):
+                continue
+
+            negate = line.startswith("!")
+            if negate:
+                line = line[1:]
+            if line.startswith("\\"):
+                line = line[1:]
+
+            dir_only = line.endswith("/")
+            line = line.rstrip("/")
+            if not line:
+                continue
+
+            # A slash anywhere but the end anchors the pattern to this directory
+            anchored = "/" in line
+            regex = glob_to_regex(line.lstrip("/"))
+            if not anchored:
+                regex = "(?:.*/)?" + regex
+
+            self.rules.append((re.compile(regex), negate, dir_only))
+
+    @classmethod
+    def load(cls, directory: str) -> Optional["IgnoreRules"]:
+        try:
+            with open(os.path.join(directory, ".gitignore"), encoding="utf-8", errors="replace") as f:
+                rules = cls(f.readlines())
+        except OSError:
+            return None
+        return rules if rules.rules else None
+
+    def match(self, rel_path: str, is_dir: bool) -> Optional[bool]:
+        """True → ignored, False → re-included, None → no rule applies."""
+        result = None
+        for regex, negate, dir_only in self.rules:
+            if dir_only and not is_dir:
+                continue
+            if regex.fullmatch(rel_path):
+                result = not negate
+        return result
+
+
+def _is_ignored(rules_chain, rel_path: str, is_dir: bool) -> bool:
+    # Deeper .gitignore files override shallower ones
+    for base, rules in reversed(rules_chain):
+        result = rules.match(rel_path[len(base):], is_dir)
+        if result is not None:
+            return result
+    return False
+
+
+def _matches(pattern: Optional[re.Pattern], basename_glob: Optional[str], entry: WalkEntry) -> bool:
+    if pattern is not None:
+        return pattern.fullmatch(entry.path) is not None
+    if basename_glob is not None:
+        return fnmatch.fnmatch(entry.path.rsplit("/", 1)[-1], basename_glob)
+    return True
+
+
+# ----------------------------------------------------------------------
+# Walking
+# ----------------------------------------------------------------------
+
+def walk(
+    root: str,
+    pattern: str = "",
+    max_depth: int | None = None,
+    include_dirs: bool = False,
+    respect_gitignore: bool | None = None,
+    ignore_dirs=None,
+    after: str = "",
+) -> Iterator[WalkEntry]:
+    """
+    Yield entries under `root` that match `pattern`.
+
+    pattern: a glob; without "/" it matches the file name ("*.py"),
+    with "/" the relative path ("game/**/*.py").
+    after: relative path of an entry from an earlier walk; only entries
+    that come after it are yielded, and only the directories on its
+    path are listed to get there.
+    """
+    settings = CONFIG.files
+    max_depth = max_depth or settings.walk_max_depth
+    if respect_gitignore is None:
+        respect_gitignore = settings.respect_gitignore
+    ignore_dirs = set(settings.ignore_dirs if ignore_dirs is None else ignore_dirs)
+
+    path_regex = re.compile(glob_to_regex(pattern)) if "/" in pattern else None
+    basename_glob = pattern if pattern and path_regex is None else None
+
+    def listing(directory, rel_prefix, depth, rules_chain):
+        if respect_gitignore:
+            rules = IgnoreRules.load(directory)
+            if rules is not None:
+                rules_chain = rules_chain + [(rel_prefix, rules)]
+        try:
+            with os.scandir(directory) as it:
+                entries = sorted(it, key=lambda e: e.name)
+        except OSError:
+            return
+        for entry in entries:
+            yield entry, rel_prefix, depth, rules_chain
+
+    after_parts = after.split("/") if after else None
+
+    stack = [listing(root, "", 1, [])]
+    while stack:
+        item = next(stack[-1], None)
+        if item is None:
+            stack.pop()
+            continue
+
+        dir_entry, rel_prefix, depth, rules_chain = item
+        rel_path = rel_prefix + dir_entry.name
+
+        # Resuming: entries sort like their path components, in walk order
+        on_after_path = False
+        if after_parts is not None:
+            parts = rel_path.split("/")
+            head = after_parts[:len(parts)]
+            if parts < head:
+                continue
+            on_after_path = parts == head  # `after` itself or a directory above it
+            if not on_after_path:
+                after_parts = None  # past it: everything from here on is new
+
+        try:
+            is_dir = dir_entry.is_dir(follow_symlinks=False)
+            stat = dir_entry.stat(follow_symlinks=False)
+        except OSError:
+            continue
+
+        if is_dir and dir_entry.name in ignore_dirs:
+            continue
+        if rules_chain and _is_ignored(rules_chain, rel_path, is_dir):
+            continue
+
+        entry = WalkEntry(
+            path=rel_path,
+            full_path=dir_entry.path,
+            is_dir=is_dir,
+            size=0 if is_dir else stat.st_size,
+            mtime_ns=stat.st_mtime_ns,
+            depth=depth,
+        )
+
+        if is_dir:
+            if include_dirs and not on_after_path and _matches(path_regex, basename_glob, entry):
+                yield entry
+            if depth < max_depth:
+                stack.append(listing(dir_entry.path, rel_path + "/", depth + 1, rules_chain))
+        elif not on_after_path and _matches(path_regex, basename_glob, entry):
+            yield entry
@@ -1,17 +1,33 @@
 from game.agents.agent_factory import AgentFactory
-from game.memory.memory import Memory
+from game.llm.usage import USAGE_LEDGER
+from game.tracing.log import configure_logging
+from game.tracing.tracer import get_aggregator
 
 
 def main():
+    configure_logging()
+
     print("Available agents: file | readme")
     agent_type = input("Select agent: ").strip()
 
     agent = AgentFactory.create(agent_type)
-    memory = Memory()
+    memory = agent.create_memory()
 
     task = input("Task: ")
     agent.run(task, memory)
 
+    # Per-span timings when CONFIG.tracing is enabled
+    aggregator = get_aggregator()
+    if aggregator is not None:
+        print(aggregator.report())
+
+    totals = USAGE_LEDGER.totals()
+    if totals["calls"]:
+        print(f"Tokens: {totals['prompt_tokens']} prompt + {totals['completion_tokens']} completion"
+              f" (${totals['cost_usd']:.4f})")
+        for row in USAGE_LEDGER.report("source", top=5):
+            print(f"  {row['source']:<24} {row['prompt_tokens']:>8} prompt tokens")
+
 
 if __name__ == "__main__":
     main()